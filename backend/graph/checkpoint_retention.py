@@ -0,0 +1,155 @@
+"""
+Retention policy for persisted interview checkpoints.
+
+Every session writes a new thread_id, and each turn adds several full-state
+checkpoints, so without cleanup the checkpoint tables only ever grow.
+
+  - Finished:    release() deletes a thread once the interview is complete
+                 and its evaluation has been written to disk
+  - Superseded:  a fresh session releases the candidate's older threads for
+                 the same job, which can no longer be resumed anyway
+  - Abandoned:   sweep() drops threads idle for longer than CHECKPOINT_TTL,
+                 then least-recently-written threads until under
+                 CHECKPOINT_MAX_THREADS and CHECKPOINT_MAX_BYTES
+  - Active:      threads with a live WebSocket session are never swept
+  - Context:     a thread's static context (context_store.py) is deleted
+                 with it; contexts whose thread never checkpointed expire
+                 after CHECKPOINT_TTL
+
+sweep() runs every CHECKPOINT_GC_INTERVAL seconds from a task started by
+main.py. stats() reports current thread/checkpoint counts and byte size.
+"""
+
+import os
+import time
+import asyncio
+import threading
+import logging
+from typing import Optional, Sequence
+
+from backend.graph.checkpointer import SQLiteCheckpointSaver, checkpoint_saver
+from backend.graph.context_store import InterviewContextStore, interview_context
+
+logger = logging.getLogger("interviewer.checkpointer")
+
+CHECKPOINT_TTL = float(os.environ.get("CHECKPOINT_TTL", str(24 * 3600)))
+CHECKPOINT_MAX_THREADS = int(os.environ.get("CHECKPOINT_MAX_THREADS", "500"))
+CHECKPOINT_MAX_BYTES = int(os.environ.get("CHECKPOINT_MAX_BYTES", str(200 * 1024 * 1024)))
+CHECKPOINT_GC_INTERVAL = float(os.environ.get("CHECKPOINT_GC_INTERVAL", "300"))
+
+
+class CheckpointRetention:
+
+    def __init__(
+        self,
+        saver: SQLiteCheckpointSaver,
+        contexts: InterviewContextStore,
+        ttl: float = CHECKPOINT_TTL,
+        max_threads: int = CHECKPOINT_MAX_THREADS,
+        max_bytes: int = CHECKPOINT_MAX_BYTES,
+        interval: float = CHECKPOINT_GC_INTERVAL,
+    ):
+        self.saver = saver
+        self.contexts = contexts
+        self.ttl = ttl
+        self.max_threads = max_threads
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.released = 0
+        self.evicted = 0
+        self._active: set = set()
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # ── Session lifecycle ─────────────────────────────────────
+
+    def session_started(self, thread_id: str):
+        with self._lock:
+            self._active.add(thread_id)
+
+    def session_ended(self, thread_id: str):
+        with self._lock:
+            self._active.discard(thread_id)
+
+    def release(self, thread_ids: Sequence[str]):
+        """Delete threads that will never be resumed (finished or superseded)."""
+        with self._lock:
+            doomed = [t for t in thread_ids if t not in self._active]
+        if not doomed:
+            return
+        self.saver.delete_threads(doomed)
+        self.contexts.delete(doomed)
+        self.released += len(doomed)
+        logger.info("[Checkpointer] Released %s threads: %s", len(doomed), doomed)
+
+    # ── TTL / LRU sweep ───────────────────────────────────────
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """Evict expired threads, then LRU threads beyond the count and byte caps."""
+        now = now or time.time()
+        usage = self.saver.thread_usage()
+        with self._lock:
+            active = set(self._active)
+
+        doomed = []
+        kept = []
+        for thread_id, last, size in usage:
+            if thread_id not in active and now - last > self.ttl:
+                doomed.append(thread_id)
+            else:
+                kept.append((thread_id, size))
+
+        count = len(kept)
+        total = sum(size for _, size in kept)
+        for thread_id, size in kept:
+            if count <= self.max_threads and total <= self.max_bytes:
+                break
+            if thread_id in active:
+                continue
+            doomed.append(thread_id)
+            count -= 1
+            total -= size
+
+        if doomed:
+            self.saver.delete_threads(doomed)
+            self.contexts.delete(doomed)
+            self.evicted += len(doomed)
+            logger.info("[Checkpointer] Evicted %s threads | remaining=%s | bytes=%s", len(doomed), count, total)
+
+        # Contexts of sessions that never reached a checkpoint
+        surviving = {thread_id for thread_id, _, _ in usage} - set(doomed)
+        self.contexts.expire(now - self.ttl, keep=surviving | active)
+        return len(doomed)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.error("[Checkpointer] Sweep failed: %s: %s", type(e).__name__, e)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        stats = self.saver.stats()
+        stats.update(self.contexts.stats())
+        with self._lock:
+            stats["active_threads"] = len(self._active)
+        stats["released"] = self.released
+        stats["evicted"] = self.evicted
+        return stats
+
+
+checkpoint_retention = CheckpointRetention(checkpoint_saver, interview_context)
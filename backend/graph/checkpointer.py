@@ -0,0 +1,490 @@
+"""
+Durable LangGraph checkpointer backed by the project's SQLite database.
+
+Replaces the in-process MemorySaver so interview state survives a restart
+and a reconnecting candidate can continue the same thread_id.
+
+  - Storage:        two tables in database.db (WAL, synchronous=NORMAL) —
+                    interview_checkpoints and interview_checkpoint_writes
+  - Write batching: put() / put_writes() only serialize and queue rows; a
+                    background flusher commits them in one transaction every
+                    CHECKPOINT_FLUSH_INTERVAL seconds, or as soon as
+                    CHECKPOINT_BATCH_SIZE rows are waiting
+  - Consistency:    every read flushes the queue first, so the graph always
+                    sees its own writes
+  - Durability:     at most one flush interval of writes is lost on a crash;
+                    close() drains the queue on shutdown
+  - Stats:          stats() aggregates over a separate read connection, so a
+                    /metrics scrape never holds up flushes or graph reads
+
+A graph step never waits on disk: the event loop only touches the queue.
+Retention (deleting finished and abandoned threads) lives in
+checkpoint_retention.py; this module only provides the primitives.
+"""
+
+import os
+import time
+import atexit
+import sqlite3
+import asyncio
+import threading
+import logging
+from typing import Any, AsyncIterator, Iterator, List, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+logger = logging.getLogger("interviewer.checkpointer")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CHECKPOINT_DB_PATH = os.environ.get("CHECKPOINT_DB_PATH", os.path.join(BASE_DIR, "database.db"))
+CHECKPOINT_FLUSH_INTERVAL = float(os.environ.get("CHECKPOINT_FLUSH_INTERVAL", "0.25"))
+CHECKPOINT_BATCH_SIZE = int(os.environ.get("CHECKPOINT_BATCH_SIZE", "64"))
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+
+    def __init__(
+        self,
+        path: str = CHECKPOINT_DB_PATH,
+        flush_interval: float = CHECKPOINT_FLUSH_INTERVAL,
+        batch_size: int = CHECKPOINT_BATCH_SIZE,
+    ):
+        super().__init__()
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.flushes = 0
+        self.rows_flushed = 0
+
+        # _db_lock serializes the connection (flush + reads); _pending_lock only
+        # guards the queues, so put() from the event loop never waits on disk
+        self._db_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending_checkpoints: List[tuple] = []
+        self._pending_writes: List[tuple] = []   # (replace, row)
+        self._conn: Optional[sqlite3.Connection] = None
+        # stats() reads through its own connection (WAL readers don't block the writer)
+        self._stats_lock = threading.Lock()
+        self._stats_conn: Optional[sqlite3.Connection] = None
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        # The flusher is a daemon thread — drain the queue even without a clean shutdown
+        atexit.register(self.close)
+
+    # ── Connection ────────────────────────────────────────────
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily so importing the graph never touches the disk
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # The SQLAlchemy engine shares this file — wait for its locks instead of failing
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS interview_checkpoints ("
+                " thread_id TEXT NOT NULL,"
+                " checkpoint_ns TEXT NOT NULL DEFAULT '',"
+                " checkpoint_id TEXT NOT NULL,"
+                " parent_checkpoint_id TEXT,"
+                " type TEXT,"
+                " checkpoint BLOB,"
+                " metadata_type TEXT,"
+                " metadata BLOB,"
+                " created REAL NOT NULL,"
+                " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS interview_checkpoint_writes ("
+                " thread_id TEXT NOT NULL,"
+                " checkpoint_ns TEXT NOT NULL DEFAULT '',"
+                " checkpoint_id TEXT NOT NULL,"
+                " task_id TEXT NOT NULL,"
+                " idx INTEGER NOT NULL,"
+                " channel TEXT NOT NULL,"
+                " type TEXT,"
+                " value BLOB,"
+                " task_path TEXT NOT NULL DEFAULT '',"
+                " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx))"
+            )
+            conn.commit()
+            self._conn = conn
+            logger.info(
+                "[Checkpointer] Opened %s | flush_interval=%ss | batch_size=%s",
+                self.path, self.flush_interval, self.batch_size,
+            )
+        return self._conn
+
+    # ── Write batching ────────────────────────────────────────
+
+    def _start_flusher(self):
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_loop, name="checkpoint-flusher", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                # Rows stay queued and are retried on the next tick
+                logger.error("[Checkpointer] Flush failed: %s", e)
+
+    def _enqueue(self, checkpoints: Sequence[tuple] = (), writes: Sequence[tuple] = ()):
+        with self._pending_lock:
+            self._pending_checkpoints.extend(checkpoints)
+            self._pending_writes.extend(writes)
+            queued = len(self._pending_checkpoints) + len(self._pending_writes)
+        self._start_flusher()
+        if queued >= self.batch_size:
+            self._wake.set()
+
+    def flush(self):
+        """Commit every queued row in a single transaction."""
+        with self._db_lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        with self._pending_lock:
+            checkpoints, writes = self._pending_checkpoints, self._pending_writes
+            self._pending_checkpoints, self._pending_writes = [], []
+        if not checkpoints and not writes:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO interview_checkpoints (thread_id, checkpoint_ns, checkpoint_id,"
+                    " parent_checkpoint_id, type, checkpoint, metadata_type, metadata, created)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    checkpoints,
+                )
+                # Special channels (errors, interrupts) overwrite; regular writes are first-wins
+                for replace, row in writes:
+                    verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+                    conn.execute(
+                        f"{verb} INTO interview_checkpoint_writes (thread_id, checkpoint_ns, checkpoint_id,"
+                        " task_id, idx, channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        row,
+                    )
+        except sqlite3.Error:
+            # Put the batch back in front of anything queued meanwhile
+            with self._pending_lock:
+                self._pending_checkpoints[:0] = checkpoints
+                self._pending_writes[:0] = writes
+            raise
+        self.flushes += 1
+        self.rows_flushed += len(checkpoints) + len(writes)
+
+    def close(self):
+        """Stop the flusher and drain the queue. Called on app shutdown."""
+        self._closed = True
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush()
+        if self.flushes:
+            logger.info("[Checkpointer] Closed | flushes=%s | rows=%s", self.flushes, self.rows_flushed)
+
+    # ── BaseCheckpointSaver (sync) ────────────────────────────
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        type_, blob = self.serde.dumps_typed(checkpoint)
+        meta_type, meta_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        self._enqueue(checkpoints=[(
+            thread_id,
+            checkpoint_ns,
+            checkpoint["id"],
+            config["configurable"].get("checkpoint_id"),  # parent
+            type_,
+            blob,
+            meta_type,
+            meta_blob,
+            time.time(),
+        )])
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        replace = all(channel in WRITES_IDX_MAP for channel, _ in writes)
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, blob = self.serde.dumps_typed(value)
+            rows.append((replace, (
+                thread_id,
+                checkpoint_ns,
+                checkpoint_id,
+                task_id,
+                WRITES_IDX_MAP.get(channel, idx),
+                channel,
+                type_,
+                blob,
+                task_path,
+            )))
+        self._enqueue(writes=rows)
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+
+        with self._db_lock:
+            self._flush_locked()
+            conn = self._connect()
+            if checkpoint_id:
+                row = conn.execute(
+                    "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint,"
+                    " metadata_type, metadata FROM interview_checkpoints"
+                    " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint,"
+                    " metadata_type, metadata FROM interview_checkpoints"
+                    " WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            if row is None:
+                return None
+            writes = self._load_writes(conn, row[0], row[1], row[2])
+        return self._to_tuple(row, writes)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        clauses, params = [], []
+        if config is not None:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            checkpoint_id = get_checkpoint_id(config)
+            if checkpoint_id:
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and get_checkpoint_id(before):
+            clauses.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        results = []
+        with self._db_lock:
+            self._flush_locked()
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint,"
+                f" metadata_type, metadata FROM interview_checkpoints{where} ORDER BY checkpoint_id DESC",
+                params,
+            ).fetchall()
+            for row in rows:
+                if filter:
+                    metadata = self.serde.loads_typed((row[6], row[7]))
+                    if not all(metadata.get(k) == v for k, v in filter.items()):
+                        continue
+                results.append(self._to_tuple(row, self._load_writes(conn, row[0], row[1], row[2])))
+                if limit is not None and len(results) >= limit:
+                    break
+        yield from results
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._db_lock:
+            self._flush_locked()
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM interview_checkpoints WHERE thread_id = ?", (thread_id,))
+                conn.execute("DELETE FROM interview_checkpoint_writes WHERE thread_id = ?", (thread_id,))
+
+    # ── BaseCheckpointSaver (async) ───────────────────────────
+    # Puts only queue rows, so they run inline; reads may flush and hit the
+    # disk, so they go to a worker thread.
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        results = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in results:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    # ── Helpers ───────────────────────────────────────────────
+
+    def _load_writes(self, conn: sqlite3.Connection, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> list:
+        return conn.execute(
+            "SELECT task_id, channel, type, value FROM interview_checkpoint_writes"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+
+    def _to_tuple(self, row: tuple, writes: list) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, blob, meta_type, meta_blob = row
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((type_, blob)),
+            metadata=self.serde.loads_typed((meta_type, meta_blob)),
+            parent_config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": parent_id,
+                }
+            } if parent_id else None,
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((w_type, w_blob)))
+                for task_id, channel, w_type, w_blob in writes
+            ],
+        )
+
+    def delete_threads(self, thread_ids: Sequence[str]) -> None:
+        """Delete several threads in one transaction."""
+        if not thread_ids:
+            return
+        params = [(t,) for t in thread_ids]
+        with self._db_lock:
+            self._flush_locked()
+            conn = self._connect()
+            with conn:
+                conn.executemany("DELETE FROM interview_checkpoints WHERE thread_id = ?", params)
+                conn.executemany("DELETE FROM interview_checkpoint_writes WHERE thread_id = ?", params)
+
+    def thread_usage(self) -> List[tuple]:
+        """(thread_id, last write time, stored bytes) for every thread, least recently written first."""
+        with self._db_lock:
+            self._flush_locked()
+            return self._connect().execute(
+                "SELECT thread_id, MAX(last), SUM(size) FROM ("
+                " SELECT thread_id, MAX(created) AS last,"
+                "  SUM(length(checkpoint) + length(metadata)) AS size"
+                "  FROM interview_checkpoints GROUP BY thread_id"
+                " UNION ALL"
+                " SELECT thread_id, 0 AS last, SUM(length(value)) AS size"
+                "  FROM interview_checkpoint_writes GROUP BY thread_id"
+                ") GROUP BY thread_id ORDER BY MAX(last) ASC"
+            ).fetchall()
+
+    def _connect_stats(self) -> sqlite3.Connection:
+        if self._stats_conn is None:
+            if self._conn is None:
+                with self._db_lock:
+                    self._connect()  # creates the tables
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._stats_conn = conn
+        return self._stats_conn
+
+    def stats(self) -> dict:
+        """Flushed totals plus the queue length; never takes the flush lock."""
+        with self._stats_lock:
+            conn = self._connect_stats()
+            threads, checkpoints, checkpoint_bytes = conn.execute(
+                "SELECT COUNT(DISTINCT thread_id), COUNT(*),"
+                " COALESCE(SUM(length(checkpoint) + length(metadata)), 0) FROM interview_checkpoints"
+            ).fetchone()
+            writes, write_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length(value)), 0) FROM interview_checkpoint_writes"
+            ).fetchone()
+        with self._pending_lock:
+            pending = len(self._pending_checkpoints) + len(self._pending_writes)
+        return {
+            "threads": threads,
+            "checkpoints": checkpoints,
+            "writes": writes,
+            "bytes": checkpoint_bytes + write_bytes,
+            "pending": pending,
+            "flushes": self.flushes,
+        }
+
+    def thread_ids(self, prefix: str) -> List[str]:
+        """Thread ids starting with `prefix`, most recently written first."""
+        with self._db_lock:
+            self._flush_locked()
+            rows = self._connect().execute(
+                # GLOB, not LIKE — '_' in thread ids would be a LIKE wildcard
+                "SELECT thread_id, MAX(created) AS last FROM interview_checkpoints"
+                " WHERE thread_id GLOB ? GROUP BY thread_id ORDER BY last DESC",
+                (prefix + "*",),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+checkpoint_saver = SQLiteCheckpointSaver()
@@ -0,0 +1,139 @@
+"""
+Static interview context, stored once per session instead of in every checkpoint.
+
+resume_profile, question_file, job_details and candidate_name never change
+during an interview, but as InterviewState fields they were serialized into
+every checkpoint — once per node per turn. The graph state now carries only
+a context_id (the session's thread_id); nodes look the context up here.
+
+  - Storage:  interview_contexts table in database.db, written once at
+              session start, so a resumed thread finds its context after a
+              restart
+  - Reads:    served from an in-process LRU of CONTEXT_CACHE_SIZE entries;
+              a miss (e.g. after a restart) loads the row once. Nodes call
+              get() synchronously, so voice_handler warms the entry with
+              aget() — the SQLite read in a worker thread — before every
+              graph run, and a node never hits the disk on the event loop
+  - Cleanup:  checkpoint_retention deletes a context together with its thread
+"""
+
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import threading
+import logging
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+from backend.graph.checkpointer import CHECKPOINT_DB_PATH
+
+logger = logging.getLogger("interviewer.context_store")
+
+# Contexts kept in memory — comfortably above the number of live sessions
+CONTEXT_CACHE_SIZE = int(os.environ.get("CONTEXT_CACHE_SIZE", "256"))
+
+
+class InterviewContextStore:
+
+    def __init__(self, path: str = CHECKPOINT_DB_PATH, cache_size: int = CONTEXT_CACHE_SIZE):
+        self.path = path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily so importing the graph never touches the disk
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS interview_contexts ("
+                " context_id TEXT PRIMARY KEY,"
+                " data TEXT NOT NULL,"
+                " created REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, context_id: str, context: dict):
+        self._cache[context_id] = context
+        self._cache.move_to_end(context_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def put(self, context_id: str, context: dict):
+        data = json.dumps(context, ensure_ascii=False)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO interview_contexts (context_id, data, created) VALUES (?, ?, ?)",
+                (context_id, data, time.time()),
+            )
+            conn.commit()
+            self._remember(context_id, context)
+        logger.info("[Context] Stored %s | %s bytes", context_id, len(data))
+
+    def get(self, context_id: str) -> dict:
+        """The session's context, or {} if it is unknown."""
+        with self._lock:
+            context = self._cache.get(context_id)
+            if context is not None:
+                self._cache.move_to_end(context_id)
+                return context
+            row = self._connect().execute(
+                "SELECT data FROM interview_contexts WHERE context_id = ?", (context_id,)
+            ).fetchone()
+            if row is None:
+                logger.warning("[Context] Unknown context_id=%r", context_id)
+                return {}
+            context = json.loads(row[0])
+            self._remember(context_id, context)
+            return context
+
+    async def aget(self, context_id: str) -> dict:
+        """get() for the event loop: a cache hit is served inline, a miss in a thread."""
+        with self._lock:
+            context = self._cache.get(context_id)
+            if context is not None:
+                self._cache.move_to_end(context_id)
+                return context
+        return await asyncio.to_thread(self.get, context_id)
+
+    def delete(self, context_ids: Iterable[str]):
+        params = [(c,) for c in context_ids]
+        if not params:
+            return
+        with self._lock:
+            for (context_id,) in params:
+                self._cache.pop(context_id, None)
+            conn = self._connect()
+            conn.executemany("DELETE FROM interview_contexts WHERE context_id = ?", params)
+            conn.commit()
+
+    def expire(self, before: float, keep: Iterable[str] = ()) -> List[str]:
+        """Delete contexts created before `before` (except `keep`), return their ids."""
+        keep = set(keep)
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT context_id FROM interview_contexts WHERE created < ?", (before,)
+            ).fetchall()
+        expired = [row[0] for row in rows if row[0] not in keep]
+        self.delete(expired)
+        return expired
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(length(data)), 0) FROM interview_contexts"
+            ).fetchone()
+            return {"contexts": count, "context_bytes": size, "cached": len(self._cache)}
+
+
+interview_context = InterviewContextStore()
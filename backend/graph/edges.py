@@ -2,6 +2,7 @@
 Conditional edges for the interview graph.
 
 entry_router:          Decides greeting vs grading based on message history.
+entry_router_speculative: Same, but fans grading out to grader + speculative followup.
 route_after_router:    Reads router's decision from state (same_topic/next_topic/end).
 route_after_planner:   Checks if interview should end after planner speaks.
 """
@@ -23,22 +24,37 @@ def entry_router(state: dict) -> str:
         logger.info("[Edge] entry_router → 'greeting' (no messages)")
         return "greeting"
     else:
-        logger.info(f"[Edge] entry_router → 'grading' ({len(messages)} messages)")
+        logger.info("[Edge] entry_router → 'grading' (%s messages)", len(messages))
         return "grading"
 
 
+def entry_router_speculative(state: dict):
+    """
+    Entry edge for the speculative graph.
+    Returns:
+      - "greeting"               → first invocation
+      - ["grading", "speculate"] → grader and followup draft run in parallel
+    """
+    if entry_router(state) == "greeting":
+        return "greeting"
+    return ["grading", "speculate"]
+
+
 def route_after_router(state: dict) -> str:
     """
     Reads the router's route decision from state.
     Returns:
-      - "question_gen"  → same_topic (needs followup question)
-      - "planner_next"  → next_topic (router already set planner_instruction)
-      - "planner_end"   → end (router already set planner_instruction for farewell)
+      - "question_gen"      → same_topic (needs followup question)
+      - "planner_followup"  → same_topic, router already committed a drafted followup
+      - "planner_next"      → next_topic (router already set planner_instruction)
+      - "planner_end"       → end (router already set planner_instruction for farewell)
     """
     route = state.get("route", "same_topic")
-    logger.info(f"[Edge] route_after_router → route='{route}'")
+    logger.info("[Edge] route_after_router → route='%s'", route)
 
     if route == "same_topic":
+        if state.get("planner_instruction"):
+            return "planner_followup"
         return "question_gen"
     elif route == "end":
         return "planner_end"
@@ -54,7 +70,7 @@ def route_after_planner(state: dict) -> str:
       - "__end__"  → otherwise (graph invocation finishes, voice_handler waits for next audio)
     """
     route = state.get("route")
-    logger.info(f"[Edge] route_after_planner → route='{route}'")
+    logger.info("[Edge] route_after_planner → route='%s'", route)
 
     if route == "end":
         return "end_node"
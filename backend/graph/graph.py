@@ -1,7 +1,7 @@
 """
 Graph assembly — builds and compiles the LangGraph interview graph.
 
-Topology:
+Topology (mode="sequential", default):
     START → entry_router:
         "greeting" → greeting_setup → planner → __end__
         "grading"  → grader → router → route_after_router:
@@ -9,54 +9,105 @@ Topology:
             "planner_next"  → planner → __end__
             "planner_end"   → planner → end_node → END
 
-Each invoke() call processes ONE turn.
-The voice_handler loop calls invoke() once per turn.
+Topology (mode="speculative"):
+    Same, except "grading" fans out to grader AND speculative_followup in
+    parallel; router waits for both. On same_topic the router commits the
+    drafted followup ("planner_followup" → planner) and question_gen is
+    skipped; on next_topic/end the draft is discarded.
+
+Topology (mode="fused"):
+    "grading" → grade_and_followup → router. One LLM call returns score,
+    reasoning and (if needed) a followup; the router uses whichever parts
+    it needs. question_gen only runs if the model left the followup empty.
+
+Each ainvoke() call processes ONE turn.
+The voice_handler loop awaits ainvoke() once per turn (the LLM nodes are async).
+
+State is checkpointed to SQLite (see checkpointer.py), so a thread_id can be
+resumed after a reconnect or a server restart.
 """
 
+import os
 import logging
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
 
 from backend.graph.state import InterviewState
+from backend.graph.checkpointer import checkpoint_saver
 from backend.graph.nodes import (
     greeting_setup_node,
     grader_node,
     router_node,
     question_gen_node,
+    speculative_followup_node,
+    grade_and_followup_node,
     planner_node,
     end_node,
 )
-from backend.graph.edges import entry_router, route_after_router, route_after_planner
+from backend.graph.edges import (
+    entry_router,
+    entry_router_speculative,
+    route_after_router,
+    route_after_planner,
+)
 
 logger = logging.getLogger("interviewer.graph")
 
+GRAPH_MODES = ("sequential", "speculative", "fused")
 
-def build_interview_graph():
-    """Construct and compile the interview graph with in-memory checkpointer."""
+# Topology used for the module-level singleton
+INTERVIEW_GRAPH_MODE = os.environ.get("INTERVIEW_GRAPH_MODE", "sequential")
+
+
+def build_interview_graph(mode: str = INTERVIEW_GRAPH_MODE, checkpointer=None):
+    """Construct and compile the interview graph. Defaults to the shared SQLite checkpointer."""
+    if mode not in GRAPH_MODES:
+        raise ValueError(f"Unknown interview graph mode '{mode}' (expected one of {GRAPH_MODES})")
 
     graph = StateGraph(InterviewState)
 
     # ── Register nodes ────────────────────────────────────────
     graph.add_node("greeting_setup", greeting_setup_node)
-    graph.add_node("grader", grader_node)
+    if mode != "fused":
+        graph.add_node("grader", grader_node)
     graph.add_node("router", router_node)
     graph.add_node("question_gen", question_gen_node)
     graph.add_node("planner", planner_node)
     graph.add_node("end_node", end_node)
 
     # ── Entry: greeting vs grading ────────────────────────────
-    graph.add_conditional_edges(START, entry_router, {
-        "greeting": "greeting_setup",
-        "grading": "grader",
-    })
+    if mode == "speculative":
+        graph.add_node("speculative_followup", speculative_followup_node)
+        graph.add_conditional_edges(START, entry_router_speculative, {
+            "greeting": "greeting_setup",
+            "grading": "grader",
+            "speculate": "speculative_followup",
+        })
+    elif mode == "fused":
+        graph.add_node("grade_and_followup", grade_and_followup_node)
+        graph.add_conditional_edges(START, entry_router, {
+            "greeting": "greeting_setup",
+            "grading": "grade_and_followup",
+        })
+    else:
+        graph.add_conditional_edges(START, entry_router, {
+            "greeting": "greeting_setup",
+            "grading": "grader",
+        })
 
     # ── Greeting flow ─────────────────────────────────────────
     graph.add_edge("greeting_setup", "planner")
 
     # ── Grading flow ──────────────────────────────────────────
-    graph.add_edge("grader", "router")
+    if mode == "speculative":
+        # Router waits for both the grade and the drafted followup
+        graph.add_edge(["grader", "speculative_followup"], "router")
+    elif mode == "fused":
+        graph.add_edge("grade_and_followup", "router")
+    else:
+        graph.add_edge("grader", "router")
     graph.add_conditional_edges("router", route_after_router, {
         "question_gen": "question_gen",
+        "planner_followup": "planner",
         "planner_next": "planner",
         "planner_end": "planner",
     })
@@ -71,11 +122,10 @@ def build_interview_graph():
     })
     graph.add_edge("end_node", END)
 
-    # ── Compile with MemorySaver for thread_id-based state persistence ──
-    checkpointer = MemorySaver()
-    compiled = graph.compile(checkpointer=checkpointer)
+    # ── Compile with a checkpointer for thread_id-based state persistence ──
+    compiled = graph.compile(checkpointer=checkpointer or checkpoint_saver)
 
-    logger.info("[Graph] Interview graph compiled successfully (4-node pipeline).")
+    logger.info("[Graph] Interview graph compiled successfully (mode=%s).", mode)
     return compiled
 
 
@@ -5,16 +5,49 @@ greeting_setup_node:  Sets up planner_instruction for the opening greeting.
 grader_node:          LLM call to score the candidate's latest answer (strict).
 router_node:          Pure Python logic — decides same_topic / next_topic / end.
 question_gen_node:    LLM call to generate a followup question on the same topic.
+speculative_followup_node: (speculative mode) drafts that followup in parallel
+                      with the grader; the router commits it on same_topic.
+grade_and_followup_node:   (fused mode) grader + conditional followup in ONE LLM call.
 planner_node:         THE ONLY NODE THAT SPEAKS — converts planner_instruction to speech.
 end_node:             Sets is_complete = True.
+
+The LLM nodes are coroutines — the graph is driven with ainvoke() so every
+LLM round trip awaits on the event loop instead of holding a worker thread.
+
+In streaming mode (PLANNER_STREAMING, default on) the planner asks for plain
+text instead of JSON and emits each completed sentence as a custom stream
+event {"type": "sentence", "text": ..., "cacheable": bool}; voice_handler
+consumes these via astream(stream_mode="custom") and starts TTS on sentence
+one while the rest is still generating. Template and fallback sentences are
+marked cacheable — their audio is worth keeping in the TTS cache.
+
+Static session context (question_file, job_details, resume_profile,
+candidate_name) is read from the context store via _context(state).
+
+Topic transitions and farewells skip the LLM entirely (PLANNER_TEMPLATES,
+default on): the router hands the planner a structured planner_template and
+templates.render_utterance() produces the line locally.
+
+Every node runs inside a tracing span of its own name (tracing.traced), so a
+turn's trace shows how long each node — and each LLM call in it — took.
 """
 
+import os
 import json
 import logging
-from backend.services.llm_client import call_llm
+from langgraph.config import get_stream_writer
+from backend.services.llm_client import acall_llm, astream_llm
+from backend.services.sentence_splitter import SentenceSplitter, split_sentences
+from backend.services.tracing import traced
+from backend.services.metrics import FALLBACKS
+from backend.graph.templates import render_utterance
+from backend.graph.context_store import interview_context
 
 logger = logging.getLogger("interviewer.graph.nodes")
 
+PLANNER_STREAMING = os.environ.get("PLANNER_STREAMING", "1") != "0"
+PLANNER_TEMPLATES = os.environ.get("PLANNER_TEMPLATES", "1") != "0"
+
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
@@ -41,16 +74,30 @@ def _get_last_qa(messages: list) -> tuple[str, str]:
     return last_ai, last_user
 
 
+def _context(state: dict) -> dict:
+    """Static session context for this state's context_id (see context_store.py)."""
+    return interview_context.get(state.get("context_id", ""))
+
+
+def _current_topic_name(state: dict) -> str:
+    topics = _context(state).get("question_file", {}).get("topics", [])
+    topic_index = state.get("current_topic_index", 0)
+    current_topic = topics[topic_index] if topic_index < len(topics) else {}
+    return current_topic.get("topic", "General")
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # NODE 1: GREETING SETUP (no LLM)
 # ══════════════════════════════════════════════════════════════════════════════
 
+@traced("greeting_setup")
 def greeting_setup_node(state: dict) -> dict:
     """Sets up initial state and tells Planner what to say for greeting."""
-    question_file = state.get("question_file", {})
-    candidate_name = state.get("candidate_name", "Candidate")
-    job_details = state.get("job_details", {})
-    resume_profile = state.get("resume_profile", {})
+    context = _context(state)
+    question_file = context.get("question_file", {})
+    candidate_name = context.get("candidate_name", "Candidate")
+    job_details = context.get("job_details", {})
+    resume_profile = context.get("resume_profile", {})
 
     topics = question_file.get("topics", [])
     first_topic = topics[0] if topics else {}
@@ -69,7 +116,7 @@ def greeting_setup_node(state: dict) -> dict:
         f"Keep it to 2-3 sentences. Be natural and conversational."
     )
 
-    logger.info(f"[GreetingSetup] First topic='{topic_name}' | Q='{first_question[:60]}...'")
+    logger.info("[GreetingSetup] First topic='%s' | Q='%s...'", topic_name, first_question[:60])
 
     return {
         "planner_instruction": instruction,
@@ -78,6 +125,7 @@ def greeting_setup_node(state: dict) -> dict:
         "current_topic_score": 0,
         "grader_reasoning": "",
         "route": "greeting",
+        "planner_template": None,
     }
 
 
@@ -85,65 +133,58 @@ def greeting_setup_node(state: dict) -> dict:
 # NODE 2: GRADER (LLM — strict, low temperature)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def grader_node(state: dict) -> dict:
-    """Grades the candidate's last answer. Returns score (0-10) + reasoning."""
-    messages = state.get("messages", [])
-    job_details = state.get("job_details", {})
-    question_file = state.get("question_file", {})
-    topic_index = state.get("current_topic_index", 0)
-
-    topics = question_file.get("topics", [])
-    current_topic = topics[topic_index] if topic_index < len(topics) else {}
-    topic_name = current_topic.get("topic", "General")
-
-    last_ai_msg, last_user_msg = _get_last_qa(messages)
+# Keep system prompt compact — Llama performs better with focused instructions
+GRADER_SYSTEM_PROMPT = (
+    "You are a strict technical interview grader. "
+    "You evaluate answers objectively on a 0-10 scale. "
+    "You always respond in JSON format.\n\n"
+    "SCORING GUIDE:\n"
+    "0-2: No relevant answer, off-topic, or 'I don't know'\n"
+    "3-4: Vague or superficial — mentions the topic but no depth\n"
+    "5-6: Partial answer — shows some knowledge but has gaps\n"
+    "7-8: Good answer — covers key points with reasonable depth\n"
+    "9-10: Excellent — deep knowledge with concrete examples"
+)
+
+
+def _grading_context(state: dict) -> tuple[str, str]:
+    """The grading prompt body (topic, job, last Q and A) and the topic name."""
+    job_details = _context(state).get("job_details", {})
+    topic_name = _current_topic_name(state)
+
+    last_ai_msg, last_user_msg = _get_last_qa(state.get("messages", []))
     # Truncate to keep prompt lean for Groq
     last_ai_msg = _truncate(last_ai_msg, 400)
     last_user_msg = _truncate(last_user_msg, 600)
 
-    logger.info(f"[Grader] Grading answer on topic='{topic_name}'")
-    logger.info(f"[Grader]   Q: '{last_ai_msg[:80]}...'")
-    logger.info(f"[Grader]   A: '{last_user_msg[:80]}...'")
+    logger.info("[Grader] Grading answer on topic='%s'", topic_name)
+    logger.info("[Grader]   Q: '%s...'", last_ai_msg[:80])
+    logger.info("[Grader]   A: '%s...'", last_user_msg[:80])
 
-    # Keep system prompt compact — Llama performs better with focused instructions
-    system_prompt = (
-        "You are a strict technical interview grader. "
-        "You evaluate answers objectively on a 0-10 scale. "
-        "You always respond in JSON format.\n\n"
-        "SCORING GUIDE:\n"
-        "0-2: No relevant answer, off-topic, or 'I don't know'\n"
-        "3-4: Vague or superficial — mentions the topic but no depth\n"
-        "5-6: Partial answer — shows some knowledge but has gaps\n"
-        "7-8: Good answer — covers key points with reasonable depth\n"
-        "9-10: Excellent — deep knowledge with concrete examples"
-    )
-
-    user_prompt = (
+    body = (
         f"TOPIC: {topic_name}\n"
         f"JOB: {_truncate(job_details.get('title', ''), 100)}\n\n"
         f"QUESTION:\n{last_ai_msg}\n\n"
         f"ANSWER:\n{last_user_msg}\n\n"
-        "Grade this answer. Return JSON:\n"
-        '{"score": <integer 0-10>, "reasoning": "<one sentence>"}'
     )
+    return body, topic_name
 
-    raw = call_llm(user_prompt, system_prompt, json_mode=True,
-                   temperature=0.3, max_tokens=100)
 
+def _parse_grade(raw: str, tag: str) -> tuple[int, str, dict]:
+    """Returns (score clamped to 0-10, reasoning, parsed JSON or {})."""
     try:
         parsed = json.loads(raw)
         score = int(parsed.get("score", 5))
         reasoning = str(parsed.get("reasoning", "No reasoning provided"))
-    except (json.JSONDecodeError, TypeError, ValueError):
-        logger.error(f"[Grader] Failed to parse response: {raw[:200]}")
-        score = 5
-        reasoning = "Parse error — using default score"
+    except (json.JSONDecodeError, TypeError, ValueError, AttributeError):
+        logger.error("[%s] Failed to parse response: %s", tag, raw[:200])
+        return 5, "Parse error — using default score", {}
 
     # Clamp score to 0-10
-    score = max(0, min(10, score))
+    return max(0, min(10, score)), reasoning, parsed
 
-    logger.info(f"[Grader] Score={score}/10 | Reasoning: {reasoning}")
 
+def _grade_update(topic_name: str, score: int, reasoning: str) -> dict:
     return {
         "current_topic_score": score,
         "grader_reasoning": reasoning,
@@ -155,18 +196,85 @@ def grader_node(state: dict) -> dict:
     }
 
 
+@traced("grader")
+async def grader_node(state: dict) -> dict:
+    """Grades the candidate's last answer. Returns score (0-10) + reasoning."""
+    body, topic_name = _grading_context(state)
+
+    user_prompt = (
+        body +
+        "Grade this answer. Return JSON:\n"
+        '{"score": <integer 0-10>, "reasoning": "<one sentence>"}'
+    )
+
+    raw = await acall_llm(user_prompt, GRADER_SYSTEM_PROMPT, json_mode=True,
+                          temperature=0.3, max_tokens=100)
+    score, reasoning, _ = _parse_grade(raw, "Grader")
+
+    logger.info("[Grader] Score=%s/10 | Reasoning: %s", score, reasoning)
+
+    return _grade_update(topic_name, score, reasoning)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# NODE 2b: FUSED GRADER + FOLLOWUP (LLM — one call instead of two)
+# ══════════════════════════════════════════════════════════════════════════════
+
+@traced("grade_and_followup")
+async def grade_and_followup_node(state: dict) -> dict:
+    """
+    Fused mode only. One LLM call returns the score, the reasoning and — when
+    the answer falls below the topic threshold and the topic still has turns
+    left — a followup question, which goes to draft_followup for the router.
+    Same context as grader + question_gen, sent once.
+    """
+    body, topic_name = _grading_context(state)
+    topics = _context(state).get("question_file", {}).get("topics", [])
+    topic_index = state.get("current_topic_index", 0)
+    threshold = topics[topic_index].get("threshold", 6) if topic_index < len(topics) else 6
+    turns_left = state.get("current_topic_turn", 0) < MAX_TURNS_PER_TOPIC
+
+    if turns_left:
+        followup_rule = (
+            f"If the score is below {threshold}, also write ONE followup question that "
+            "targets the gap in the answer, is DIFFERENT from the previous question, and is "
+            "open-ended and suitable for a voice conversation. Otherwise use an empty string.\n"
+        )
+    else:
+        followup_rule = "Leave followup_question as an empty string.\n"
+
+    user_prompt = (
+        body +
+        "Grade this answer.\n" + followup_rule +
+        "Return JSON:\n"
+        '{"score": <integer 0-10>, "reasoning": "<one sentence>", "followup_question": "<question or empty>"}'
+    )
+
+    raw = await acall_llm(user_prompt, GRADER_SYSTEM_PROMPT, json_mode=True,
+                          temperature=0.3, max_tokens=200)
+    score, reasoning, parsed = _parse_grade(raw, "GradeFollowup")
+    followup = str(parsed.get("followup_question") or "").strip()
+
+    logger.info("[GradeFollowup] Score=%s/10 | Reasoning: %s | Followup: '%s'", score, reasoning, followup[:60])
+
+    update = _grade_update(topic_name, score, reasoning)
+    update["draft_followup"] = followup
+    return update
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # NODE 3: ROUTER (pure logic — NO LLM)
 # ══════════════════════════════════════════════════════════════════════════════
 
 MAX_TURNS_PER_TOPIC = 3
 
+@traced("router")
 def router_node(state: dict) -> dict:
     """Pure logic router. Reads grader score vs per-topic threshold, decides route."""
     score = state.get("current_topic_score", 0)
     turn = state.get("current_topic_turn", 0)
     topic_index = state.get("current_topic_index", 0)
-    question_file = state.get("question_file", {})
+    question_file = _context(state).get("question_file", {})
 
     topics = question_file.get("topics", [])
     total_topics = len(topics)
@@ -177,8 +285,9 @@ def router_node(state: dict) -> dict:
     topic_threshold = current_topic.get("threshold", 6)
 
     logger.info(
-        f"[Router] Evaluating: score={score} vs threshold={topic_threshold} | "
-        f"turn={turn}/{MAX_TURNS_PER_TOPIC} | topic='{topic_name}' ({topic_index+1}/{total_topics})"
+        "[Router] Evaluating: score=%s vs threshold=%s | "
+        "turn=%s/%s | topic='%s' (%s/%s)",
+        score, topic_threshold, turn, MAX_TURNS_PER_TOPIC, topic_name, topic_index+1, total_topics
     )
 
     # ── Route Decision ──────────────────────────────────────
@@ -195,12 +304,14 @@ def router_node(state: dict) -> dict:
                 "Let them know the team will review and follow up soon. "
                 "Keep it to 1-2 sentences. Be warm and professional."
             )
-            logger.info(f"[Router] → END (all {total_topics} topics covered)")
+            logger.info("[Router] → END (all %s topics covered)", total_topics)
             return {
                 "route": "end",
                 "planner_instruction": instruction,
+                "planner_template": {"kind": "end"},
                 "current_topic_index": topic_index,
                 "current_topic_turn": turn,
+                "draft_followup": "",  # discard any drafted followup
             }
         else:
             # Next topic
@@ -218,21 +329,37 @@ def router_node(state: dict) -> dict:
                 f"to the next topic: '{next_topic_name}'. "
                 f"Ask this question: \"{next_question}\""
             )
-            logger.info(f"[Router] → NEXT TOPIC: '{next_topic_name}' (topic {next_index+1}/{total_topics})")
+            logger.info("[Router] → NEXT TOPIC: '%s' (topic %s/%s)", next_topic_name, next_index+1, total_topics)
             return {
                 "route": "next_topic",
                 "planner_instruction": instruction,
+                "planner_template": {
+                    "kind": "next_topic",
+                    "topic": next_topic_name,
+                    "question": next_question,
+                    "satisfied": score >= topic_threshold,
+                },
                 "current_topic_index": next_index,
                 "current_topic_turn": 1,  # Primary Q counts as turn 1
+                "draft_followup": "",  # discard any drafted followup
             }
     else:
         # Same topic — needs deeper probing
-        logger.info(f"[Router] → SAME TOPIC: score {score} < threshold {topic_threshold}, turn {turn+1}")
+        logger.info("[Router] → SAME TOPIC: score %s < threshold %s, turn %s", score, topic_threshold, turn+1)
+        draft = state.get("draft_followup", "")
+        if draft:
+            # Commit the followup drafted alongside the grader — skips question_gen
+            logger.info("[Router]   Committing drafted followup: '%s...'", draft[:60])
+            instruction = _followup_instruction(topic_name, state.get("grader_reasoning", ""), draft)
+        else:
+            instruction = ""  # question_gen will fill this
         return {
             "route": "same_topic",
-            "planner_instruction": "",  # question_gen will fill this
+            "planner_instruction": instruction,
+            "planner_template": None,  # free-form followup → LLM planner
             "current_topic_index": topic_index,
             "current_topic_turn": turn + 1,
+            "draft_followup": "",
         }
 
 
@@ -240,85 +367,169 @@ def router_node(state: dict) -> dict:
 # NODE 4: QUESTION GENERATOR (LLM — generates followup on same topic)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def question_gen_node(state: dict) -> dict:
-    """Generates a targeted followup question when the answer was insufficient."""
-    messages = state.get("messages", [])
-    job_details = state.get("job_details", {})
-    question_file = state.get("question_file", {})
-    topic_index = state.get("current_topic_index", 0)
-    grader_reasoning = state.get("grader_reasoning", "")
-
-    topics = question_file.get("topics", [])
-    current_topic = topics[topic_index] if topic_index < len(topics) else {}
-    topic_name = current_topic.get("topic", "General")
+def _followup_prompts(state: dict, grader_reasoning: str = "") -> tuple[str, str]:
+    """
+    (system_prompt, user_prompt) for generating a followup on the current topic.
+    Without grader_reasoning (speculative draft) the question probes whatever
+    looks thin in the answer instead of a gap the grader named.
+    """
+    job_details = _context(state).get("job_details", {})
+    topic_name = _current_topic_name(state)
 
-    last_ai_msg, last_user_msg = _get_last_qa(messages)
+    last_ai_msg, last_user_msg = _get_last_qa(state.get("messages", []))
     last_ai_msg = _truncate(last_ai_msg, 300)
     last_user_msg = _truncate(last_user_msg, 400)
 
-    logger.info(f"[QuestionGen] Generating followup for topic='{topic_name}'")
-    logger.info(f"[QuestionGen]   Grader said: '{grader_reasoning}'")
-
     system_prompt = (
         "You are an expert interview question designer. "
         "Generate ONE targeted followup question. "
         "You always respond in JSON format."
     )
 
+    if grader_reasoning:
+        gap = f"WEAKNESS IDENTIFIED: {_truncate(grader_reasoning, 200)}\n\n"
+        target = "1. Targets the specific gap identified above\n"
+    else:
+        gap = ""
+        target = "1. Probes the vaguest or least supported part of the answer\n"
+
     user_prompt = (
         f"TOPIC: {topic_name}\n"
         f"JOB: {_truncate(job_details.get('title', ''), 100)}\n\n"
         f"PREVIOUS QUESTION:\n{last_ai_msg}\n\n"
         f"CANDIDATE'S ANSWER:\n{last_user_msg}\n\n"
-        f"WEAKNESS IDENTIFIED: {_truncate(grader_reasoning, 200)}\n\n"
+        f"{gap}"
         "Generate ONE followup question that:\n"
-        "1. Targets the specific gap identified above\n"
+        f"{target}"
         "2. Is DIFFERENT from the previous question\n"
         "3. Is open-ended and suitable for a voice conversation\n"
         "4. Gives the candidate a fair chance to demonstrate knowledge\n\n"
         "Return JSON: {\"question\": \"<your followup question>\"}"
     )
+    return system_prompt, user_prompt
 
-    raw = call_llm(user_prompt, system_prompt, json_mode=True,
-                   temperature=0.5, max_tokens=150)
 
+def _parse_followup(raw: str, tag: str) -> str:
     try:
         parsed = json.loads(raw)
-        generated_question = parsed.get("question", "")
-    except (json.JSONDecodeError, TypeError):
-        logger.error(f"[QuestionGen] Failed to parse response: {raw[:200]}")
-        generated_question = ""
-
-    if not generated_question:
-        generated_question = "Can you elaborate on that with a specific example from your experience?"
+        return parsed.get("question", "")
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        logger.error("[%s] Failed to parse response: %s", tag, raw[:200])
+        return ""
 
-    logger.info(f"[QuestionGen] Followup: '{generated_question[:80]}...'")
 
-    instruction = (
+def _followup_instruction(topic_name: str, grader_reasoning: str, question: str) -> str:
+    """planner_instruction for asking a followup on the same topic."""
+    return (
         f"The candidate's previous answer was not strong enough. "
         f"Grader noted: '{_truncate(grader_reasoning, 150)}'. "
         f"Ask this followup question on the same topic ('{topic_name}'): "
-        f"\"{generated_question}\"\n"
+        f"\"{question}\"\n"
         f"Be encouraging, not critical. Briefly acknowledge what they said, "
         f"then ask the followup naturally."
     )
 
+
+@traced("question_gen")
+async def question_gen_node(state: dict) -> dict:
+    """Generates a targeted followup question when the answer was insufficient."""
+    grader_reasoning = state.get("grader_reasoning", "")
+    topic_name = _current_topic_name(state)
+
+    logger.info("[QuestionGen] Generating followup for topic='%s'", topic_name)
+    logger.info("[QuestionGen]   Grader said: '%s'", grader_reasoning)
+
+    system_prompt, user_prompt = _followup_prompts(state, grader_reasoning)
+    raw = await acall_llm(user_prompt, system_prompt, json_mode=True,
+                          temperature=0.5, max_tokens=150)
+    generated_question = _parse_followup(raw, "QuestionGen")
+
+    if not generated_question:
+        generated_question = "Can you elaborate on that with a specific example from your experience?"
+
+    logger.info("[QuestionGen] Followup: '%s...'", generated_question[:80])
+
     return {
-        "planner_instruction": instruction,
+        "planner_instruction": _followup_instruction(topic_name, grader_reasoning, generated_question),
     }
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# NODE 4b: SPECULATIVE FOLLOWUP (LLM — runs in parallel with the grader)
+# ══════════════════════════════════════════════════════════════════════════════
+
+@traced("speculative_followup")
+async def speculative_followup_node(state: dict) -> dict:
+    """
+    Speculative mode only. Drafts a followup for the current topic while the
+    grader is still scoring, so the same_topic path doesn't pay for a
+    separate question_gen round trip. The router commits or discards it.
+    """
+    topic_name = _current_topic_name(state)
+    logger.info("[Speculative] Drafting followup for topic='%s' (parallel with grader)", topic_name)
+
+    system_prompt, user_prompt = _followup_prompts(state)
+    raw = await acall_llm(user_prompt, system_prompt, json_mode=True,
+                          temperature=0.5, max_tokens=150)
+    draft = _parse_followup(raw, "Speculative")
+
+    logger.info("[Speculative] Draft: '%s...'", draft[:80])
+    return {"draft_followup": draft}
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # NODE 5: PLANNER (LLM — the ONLY node that speaks to the candidate)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def planner_node(state: dict) -> dict:
+PLANNER_RULES = (
+    "RULES:\n"
+    "- Keep responses to 2-3 SHORT sentences maximum\n"
+    "- Sound natural and conversational, like a real human interviewer\n"
+    "- NEVER mention scores, grading, thresholds, or internal processes\n"
+    "- NEVER repeat a question word-for-word from the conversation history\n"
+    "- When transitioning topics, briefly acknowledge the previous answer first"
+)
+
+
+def _emit_sentence(writer, text: str, cacheable: bool = False):
+    """Push one finished sentence to the graph's custom stream (for TTS)."""
+    writer({"type": "sentence", "text": text, "cacheable": cacheable})
+
+
+async def _stream_planner_text(user_prompt: str, system_prompt: str, writer) -> str:
+    """Stream the planner reply as plain text, emitting each sentence as it completes."""
+    splitter = SentenceSplitter()
+    parts = []
+    async for delta in astream_llm(user_prompt, system_prompt, temperature=0.7, max_tokens=250):
+        parts.append(delta)
+        for sentence in splitter.feed(delta):
+            _emit_sentence(writer, sentence)
+    tail = splitter.flush()
+    if tail:
+        _emit_sentence(writer, tail)
+    return "".join(parts).strip()
+
+
+@traced("planner")
+async def planner_node(state: dict) -> dict:
     """
     THE ONLY NODE THAT SPEAKS. Reads planner_instruction and generates
     a natural spoken response. Does NOT score or route.
     """
     messages = state.get("messages", [])
     instruction = state.get("planner_instruction", "")
+    writer = get_stream_writer()
+
+    # ── Fast path: transitions/farewells are fully specified → no LLM ──
+    template = state.get("planner_template")
+    if PLANNER_TEMPLATES and template:
+        response_text = render_utterance(template, turn=len(messages))
+        for sentence in split_sentences(response_text):
+            _emit_sentence(writer, sentence, cacheable=True)
+        logger.info("[Planner] Template (%s): '%s...'", template.get('kind'), response_text[:80])
+        return {
+            "messages": [{"role": "model", "content": response_text}],
+        }
 
     # Keep history compact: last 6 messages, each capped at 200 chars
     recent = messages[-6:] if len(messages) > 6 else messages
@@ -329,50 +540,62 @@ def planner_node(state: dict) -> dict:
         history_lines.append(f"{role}: {content}")
     history_text = "\n".join(history_lines)
 
-    logger.info(f"[Planner] Generating response | instruction preview: '{instruction[:80]}...'")
-
-    system_prompt = (
-        "You are a professional interviewer conducting a live voice interview. "
-        "You speak naturally and concisely. You always respond in JSON format.\n\n"
-        "RULES:\n"
-        "- Keep responses to 2-3 SHORT sentences maximum\n"
-        "- Sound natural and conversational, like a real human interviewer\n"
-        "- NEVER mention scores, grading, thresholds, or internal processes\n"
-        "- NEVER repeat a question word-for-word from the conversation history\n"
-        "- When transitioning topics, briefly acknowledge the previous answer first"
-    )
+    logger.info("[Planner] Generating response | streaming=%s | instruction preview: '%s...'", PLANNER_STREAMING, instruction[:80])
 
-    user_prompt = (
+    prompt_body = (
         f"RECENT CONVERSATION:\n{history_text if history_text else '(Starting the interview)'}\n\n"
         f"INSTRUCTION:\n{instruction}\n\n"
         "Generate a natural spoken response following the instruction.\n\n"
-        "Return JSON: {\"response_text\": \"<your spoken response>\"}"
     )
-
-    raw = call_llm(user_prompt, system_prompt, json_mode=True,
-                   temperature=0.7, max_tokens=250)
-
-    try:
-        parsed = json.loads(raw)
-        response_text = parsed.get("response_text", "")
-    except (json.JSONDecodeError, TypeError):
-        logger.error(f"[Planner] Failed to parse response: {raw[:200]}")
-        response_text = ""
+    streamed = False
+
+    if PLANNER_STREAMING:
+        system_prompt = (
+            "You are a professional interviewer conducting a live voice interview. "
+            "You speak naturally and concisely. You reply with ONLY the words you "
+            "will say out loud — no JSON, no quotes, no labels.\n\n" + PLANNER_RULES
+        )
+        response_text = await _stream_planner_text(prompt_body, system_prompt, writer)
+        streamed = bool(response_text)
+    else:
+        system_prompt = (
+            "You are a professional interviewer conducting a live voice interview. "
+            "You speak naturally and concisely. You always respond in JSON format.\n\n" + PLANNER_RULES
+        )
+        user_prompt = prompt_body + "Return JSON: {\"response_text\": \"<your spoken response>\"}"
+
+        raw = await acall_llm(user_prompt, system_prompt, json_mode=True,
+                          temperature=0.7, max_tokens=250)
+
+        try:
+            parsed = json.loads(raw)
+            response_text = parsed.get("response_text", "")
+        except (json.JSONDecodeError, TypeError):
+            logger.error("[Planner] Failed to parse response: %s", raw[:200])
+            response_text = ""
 
     # Context-aware fallback
-    if not response_text or not response_text.strip():
+    fallback = not response_text or not response_text.strip()
+    if fallback:
         logger.warning("[Planner] Empty response, using fallback")
+        FALLBACKS.labels("planner_empty").inc()
         route = state.get("route", "")
         if route == "greeting" or not messages:
-            candidate_name = state.get("candidate_name", "there")
-            job_title = state.get("job_details", {}).get("title", "the position")
+            context = _context(state)
+            candidate_name = context.get("candidate_name", "there")
+            job_title = context.get("job_details", {}).get("title", "the position")
             response_text = f"Hello {candidate_name}! Welcome to your interview for the {job_title} role. Let's start — could you introduce yourself and tell me about your technical background?"
         elif route == "end":
             response_text = "Thank you so much for your time today. The team will review your interview and get back to you soon. Best of luck!"
         else:
             response_text = "That's interesting. Could you give me a specific example from your experience to illustrate that?"
 
-    logger.info(f"[Planner] Response: '{response_text[:80]}...'")
+    # Anything not streamed above (JSON mode, fallback) still goes out sentence by sentence
+    if not streamed:
+        for sentence in split_sentences(response_text):
+            _emit_sentence(writer, sentence, cacheable=fallback)
+
+    logger.info("[Planner] Response: '%s...'", response_text[:80])
 
     return {
         "messages": [{"role": "model", "content": response_text}],
@@ -383,6 +606,7 @@ def planner_node(state: dict) -> dict:
 # NODE 6: END NODE
 # ══════════════════════════════════════════════════════════════════════════════
 
+@traced("end_node")
 def end_node(state: dict) -> dict:
     """
     Fires when route == 'end'. Just marks the interview as complete.
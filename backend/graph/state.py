@@ -4,6 +4,7 @@ InterviewState — the single source of truth for an interview session.
 Fields with `Annotated[list, operator.add]` use a reducer so that
 new items are **appended** to the checkpoint rather than replacing it.
 Scalar fields (int, bool, str, dict) are simply overwritten on each update.
+Static per-session context lives in the context store, referenced by context_id.
 """
 
 import operator
@@ -19,17 +20,10 @@ class InterviewState(TypedDict):
     """Per-turn scores: [{"topic": str, "score": int, "reasoning": str}]"""
 
     # ── Static context (set once at session start) ────────────────
-    resume_profile: dict
-    """Extracted from PDF: {name, skills[], experience_years, past_roles[], education}"""
-
-    question_file: dict
-    """Generated question plan: {topics: [{topic, threshold, primary_question}]}"""
-
-    job_details: dict
-    """Job posting info: {title, description, skills_required, questions_to_ask}"""
-
-    candidate_name: str
-    """Candidate's display name for the greeting."""
+    context_id: str
+    """Key into the interview context store (context_store.py), which holds
+    resume_profile, question_file, job_details and candidate_name. Kept out
+    of the state so the static blobs aren't re-serialized in every checkpoint."""
 
     # ── Mutable scalars (overwritten each turn) ───────────────────
     current_topic_index: int
@@ -47,8 +41,14 @@ class InterviewState(TypedDict):
     planner_instruction: str
     """Instruction string from router/question_gen/greeting_setup → consumed by planner."""
 
+    planner_template: Optional[dict]
+    """Structured utterance for the planner's no-LLM fast path (next_topic/end), else None."""
+
     is_complete: bool
     """True after the end_node fires."""
 
     route: Optional[str]
     """Router decision: 'same_topic' | 'next_topic' | 'end' | None"""
+
+    draft_followup: str
+    """Followup drafted ahead of the router (speculative/fused modes). Committed on same_topic, cleared otherwise."""
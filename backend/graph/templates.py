@@ -0,0 +1,98 @@
+"""
+Deterministic utterance templates — the planner's fast path.
+
+For next_topic and end the router already knows exactly what must be said
+(acknowledge, transition, ask the next primary question / say goodbye), so
+rephrasing it with an LLM call only adds latency. The router writes a
+`planner_template` dict instead and the planner renders it here, locally.
+
+    {"kind": "next_topic", "topic": str, "question": str, "satisfied": bool}
+    {"kind": "end"}
+
+Phrases come from small rotating pools indexed by the turn number, so the
+interviewer doesn't say the same acknowledgement twice in a row and a given
+transcript always renders the same way. That also makes every possible
+rendering enumerable (all_renderings), which the TTS cache pre-warms.
+"""
+
+import math
+
+ACK_SATISFIED = [
+    "Great, thank you for that.",
+    "That's a solid answer, thanks.",
+    "Thanks, that was really clear.",
+    "Good, I appreciate the detail there.",
+    "Excellent, thank you.",
+]
+
+ACK_MOVING_ON = [
+    "Thanks for walking me through that.",
+    "Okay, thank you for sharing that.",
+    "Alright, I appreciate your perspective on that.",
+    "Thanks, that gives me a good picture.",
+    "Understood, thank you.",
+]
+
+TRANSITIONS = [
+    "Let's move on to {topic}.",
+    "Now I'd like to shift gears to {topic}.",
+    "Next, let's talk about {topic}.",
+    "Let's turn to {topic} now.",
+    "Moving on to {topic}.",
+]
+
+FAREWELLS = [
+    "That covers everything I wanted to ask today. Thank you so much for your time — "
+    "the team will review your interview and follow up with you soon.",
+    "That's all the questions I have. Thank you for your time and effort today — "
+    "the team will review everything and get back to you soon.",
+    "We've covered all the topics for today. Thanks again for a great conversation — "
+    "you'll hear back from the team soon.",
+]
+
+
+def _pick(pool: list, turn: int, offset: int = 0) -> str:
+    # Different offsets per pool so the acknowledgement and transition don't rotate in lockstep
+    return pool[(turn + offset) % len(pool)]
+
+
+def render_utterance(template: dict, turn: int) -> str:
+    """Render a planner_template into the spoken response. `turn` drives the rotation."""
+    kind = template.get("kind")
+
+    if kind == "end":
+        return _pick(FAREWELLS, turn)
+
+    if kind == "next_topic":
+        ack_pool = ACK_SATISFIED if template.get("satisfied") else ACK_MOVING_ON
+        question = template.get("question", "").strip()
+        if question and question[-1] not in ".?!":
+            question += "?"
+        return " ".join(part for part in (
+            _pick(ack_pool, turn),
+            _pick(TRANSITIONS, turn, offset=2).format(topic=template.get("topic", "the next topic")),
+            question,
+        ) if part)
+
+    raise ValueError(f"Unknown planner template kind: {kind!r}")
+
+
+def all_renderings(topics: list) -> list:
+    """
+    Every utterance render_utterance() can produce for these question-file
+    topics — each later topic as the next_topic target in every rotation,
+    plus the farewells.
+    """
+    period = math.lcm(len(ACK_SATISFIED), len(ACK_MOVING_ON), len(TRANSITIONS))
+    renderings = []
+    for topic in topics[1:]:
+        for satisfied in (True, False):
+            template = {
+                "kind": "next_topic",
+                "topic": topic.get("topic", "General"),
+                "question": topic.get("primary_question", "Tell me more about your experience."),
+                "satisfied": satisfied,
+            }
+            renderings.extend(render_utterance(template, turn) for turn in range(period))
+    renderings.extend(render_utterance({"kind": "end"}, turn) for turn in range(len(FAREWELLS)))
+    return list(dict.fromkeys(renderings))
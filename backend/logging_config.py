@@ -5,6 +5,18 @@ Sets up:
   - Console handler (colored, human-readable) for terminal
   - File handler (rotating, detailed) saved to backend/logs/
   - Module-specific log levels
+  - A queue in front of both: the root logger only enqueues the record and
+    a background listener thread formats and writes it, so no disk or
+    console I/O happens on the event loop. When LOG_QUEUE_SIZE records are
+    waiting, new ones are dropped and counted (dropped_records()) rather
+    than blocking the caller. LOG_ASYNC=0 writes synchronously instead
+  - Sampling: LOG_SAMPLE="logger=N,..." keeps 1 in N DEBUG records of a
+    high-frequency module logger (e.g. per-window STT decodes); INFO and
+    above always pass
+
+Hot-path modules log with lazy %-style arguments, so a record that is
+filtered out is never formatted, and one that is kept is formatted on the
+listener thread.
 
 Import this at the TOP of main.py before anything else:
     from backend.logging_config import setup_logging
@@ -12,20 +24,94 @@ Import this at the TOP of main.py before anything else:
 """
 
 import os
+import queue
+import atexit
+import itertools
 import logging
 import logging.handlers
 from datetime import datetime
+from typing import Dict, Optional
 
 # Log directory — backend/logs/
 LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
 os.makedirs(LOG_DIR, exist_ok=True)
 
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "DEBUG")
+LOG_ASYNC = os.environ.get("LOG_ASYNC", "1") != "0"
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+# Keep 1 in N DEBUG records per logger, e.g. "interviewer.stt=10,interviewer.voice=5"
+LOG_SAMPLE = os.environ.get("LOG_SAMPLE", "interviewer.stt=10")
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional["_DeferredQueueHandler"] = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records as they are — merging msg % args is left to the
+    listener thread — and drops (counting) instead of blocking when full.
+    Records never leave the process, so they need no pickling prep.
+    """
+
+    def __init__(self, q: queue.Queue):
+        super().__init__(q)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class SampleFilter(logging.Filter):
+    """Pass every record at INFO or above, and 1 in `every` below that."""
 
-def setup_logging(level: str = "DEBUG"):
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.INFO:
+            return True
+        return next(self._counter) % self.every == 0
+
+
+def _parse_sample_rates(spec: str) -> Dict[str, int]:
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, every = item.partition("=")
+        try:
+            rates[name.strip()] = int(every)
+        except ValueError:
+            raise ValueError(f"LOG_SAMPLE entries must look like logger=N, got {item!r}")
+    return rates
+
+
+def dropped_records() -> int:
+    """Records dropped because the log queue was full."""
+    return _queue_handler.dropped if _queue_handler else 0
+
+
+def shutdown_logging():
+    """Stop the listener thread after it has written everything queued."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def setup_logging(level: str = LOG_LEVEL):
     """
-    Configure root logger with console + rotating file handlers.
-    Call this ONCE at startup, before any other imports that use logging.
+    Configure root logger with console + rotating file handlers (behind a
+    queue unless LOG_ASYNC=0). Call this ONCE at startup, before any other
+    imports that use logging.
     """
+    global _listener, _queue_handler
     root_logger = logging.getLogger()
 
     # Prevent duplicate handler attachment on reload
@@ -42,7 +128,6 @@ def setup_logging(level: str = "DEBUG"):
         datefmt="%H:%M:%S",
     )
     console.setFormatter(console_fmt)
-    root_logger.addHandler(console)
 
     # ── File handler (rotating, 5MB per file, keep 5 backups) ────────────
     log_file = os.path.join(LOG_DIR, "interviewer.log")
@@ -55,7 +140,23 @@ def setup_logging(level: str = "DEBUG"):
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_fmt)
-    root_logger.addHandler(file_handler)
+
+    if LOG_ASYNC:
+        _queue_handler = _DeferredQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+        _listener = logging.handlers.QueueListener(
+            _queue_handler.queue, console, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+        root_logger.addHandler(_queue_handler)
+    else:
+        root_logger.addHandler(console)
+        root_logger.addHandler(file_handler)
+
+    # ── Sampled high-frequency loggers ───────────────────────────────────
+    for name, every in _parse_sample_rates(LOG_SAMPLE).items():
+        if every > 1:
+            logging.getLogger(name).addFilter(SampleFilter(every))
 
     # ── Quiet down noisy third-party loggers ─────────────────────────────
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -71,6 +172,6 @@ def setup_logging(level: str = "DEBUG"):
     banner_logger.info("=" * 70)
     banner_logger.info("  THE INTERVIEWER — Backend Starting")
     banner_logger.info(f"  Log file: {log_file}")
-    banner_logger.info(f"  Log level: {level.upper()}")
+    banner_logger.info(f"  Log level: {level.upper()} | async={LOG_ASYNC} | sampled: {LOG_SAMPLE or 'none'}")
     banner_logger.info(f"  Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     banner_logger.info("=" * 70)
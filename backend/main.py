@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Depends, HTTPException, status, Security, WebSocket, WebSocketDisconnect, File, UploadFile, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.security import OAuth2PasswordBearer
 from starlette.middleware.base import BaseHTTPMiddleware
 from sqlalchemy.orm import Session
@@ -8,9 +9,10 @@ import time
 import asyncio
 import logging
 import json as json_module
+import anyio.to_thread
 
 # ── Centralized logging (MUST be first, before other backend imports) ────────
-from backend.logging_config import setup_logging
+from backend.logging_config import setup_logging, dropped_records
 setup_logging()
 
 from backend.database import engine, Base, SessionLocal
@@ -26,9 +28,22 @@ from backend.auth import (
     verify_password, get_password_hash, create_access_token,
     decode_token, pwd_context
 )
-from backend.services.voice_handler import handle_voice_session
+from backend.services.voice_handler import handle_voice_session, find_resumable_session, prewarm_tts
 from backend.services.resume_parser import extract_text_from_pdf, extract_candidate_profile
 from backend.services.question_file_generator import generate_question_file
+from backend.services.llm_client import aclose_llm_clients
+from backend.graph.checkpointer import checkpoint_saver
+from backend.graph.checkpoint_retention import checkpoint_retention
+from backend.graph.context_store import interview_context
+from backend.services.stt_pool import stt_pool
+from backend.services.admission import admission
+from backend.services.tracing import tracer
+from backend.services.metrics import (
+    METRICS_ENABLED, HTTP_REQUEST_SECONDS, InstrumentedThreadPoolExecutor, registry as metrics_registry,
+)
+from backend.services.llm_client import llm_in_flight
+from backend.services.llm_cache import llm_cache
+from backend.services.tts_cache import tts_cache
 from typing import List, Dict, Any, Optional
 
 logger = logging.getLogger("interviewer.api")
@@ -38,7 +53,11 @@ app = FastAPI(title="The Interviewer - Backend API")
 
 # ── Request/Response logging middleware ───────────────────────────────────────
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Logs every HTTP request with method, path, status code, and duration."""
+    """
+    Logs every HTTP request with method, path, status code, and duration,
+    and records the duration per route template (not raw path, so ids don't
+    explode the label set) in http_request_duration_seconds.
+    """
     async def dispatch(self, request: Request, call_next):
         t0 = time.time()
         method = request.method
@@ -48,13 +67,21 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             elapsed = round((time.time() - t0) * 1000, 1)
             logger.info(f"← {method} {path} │ {response.status_code} │ {elapsed}ms")
+            _observe_request(request, response.status_code, t0)
             return response
         except Exception as e:
             elapsed = round((time.time() - t0) * 1000, 1)
             logger.error(f"✗ {method} {path} │ EXCEPTION │ {elapsed}ms │ {type(e).__name__}: {e}")
+            _observe_request(request, 500, t0)
             raise
 
 
+def _observe_request(request: Request, status_code: int, t0: float):
+    route = request.scope.get("route")
+    template = getattr(route, "path", "unmatched")
+    HTTP_REQUEST_SECONDS.labels(request.method, template, status_code).observe(time.time() - t0)
+
+
 app.add_middleware(RequestLoggingMiddleware)
 
 # ── In-memory store for prepared interview data ──────────────────────────────
@@ -62,6 +89,9 @@ app.add_middleware(RequestLoggingMiddleware)
 # Populated by /api/interview/prepare, consumed by WS handler
 _prepared_interviews: Dict[tuple, dict] = {}
 
+# Fire-and-forget tasks (TTS pre-warming), held so they aren't garbage-collected
+_background_tasks: set = set()
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
 
 app.add_middleware(
@@ -602,6 +632,11 @@ async def prepare_interview(
         "question_file": question_file,
     }
 
+    # Synthesize the interview's predictable lines while the candidate gets ready
+    prewarm_task = asyncio.create_task(prewarm_tts(question_file, user.name, job.title))
+    _background_tasks.add(prewarm_task)
+    prewarm_task.add_done_callback(_background_tasks.discard)
+
     elapsed = round(time.time() - t_start, 2)
     logger.info(f"[Prepare] Done in {elapsed}s")
 
@@ -621,6 +656,8 @@ async def websocket_interview(websocket: WebSocket, job_id: int):
         return
 
     db = SessionLocal()
+    admitted_at = None
+    interview_ran = False
     try:
         payload = decode_token(token)
         email = payload.get("sub")
@@ -642,17 +679,44 @@ async def websocket_interview(websocket: WebSocket, job_id: int):
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
             return
 
-        # Retrieve prepared interview data (mandatory)
-        prep_key = (job_id, candidate.id)
-        prepared = _prepared_interviews.pop(prep_key, None)
-        if not prepared:
-            logger.error(f"[WS] No prepared interview data for {prep_key}. Candidate must call /api/interview/prepare first.")
-            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        # Wait for a session slot before the prepared data is consumed, so a
+        # client that is turned away can reconnect and still find it
+        await websocket.accept()
+
+        async def notify_queued(position: int, wait_seconds: float):
+            await websocket.send_text(json_module.dumps({
+                "type": "queued",
+                "position": position,
+                "estimated_wait_seconds": round(wait_seconds),
+                "message": f"All interviewers are busy. You are number {position} in line "
+                           f"(about {max(1, round(wait_seconds / 60))} min).",
+            }))
+
+        if not await admission.admit(notify_queued):
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
             return
+        admitted_at = time.time()
 
-        resume_profile = prepared["resume_profile"]
-        question_file = prepared["question_file"]
-        logger.info(f"[WS] Prepared data loaded for {prep_key} | topics={len(question_file.get('topics', []))}")
+        # Retrieve prepared interview data. A fresh prepare starts a new interview;
+        # without one, a reconnect continues the candidate's unfinished checkpointed thread.
+        prep_key = (job_id, candidate.id)
+        prepared = _prepared_interviews.pop(prep_key, None)
+        resume_thread_id = None
+        if prepared:
+            resume_profile = prepared["resume_profile"]
+            question_file = prepared["question_file"]
+            logger.info(f"[WS] Prepared data loaded for {prep_key} | topics={len(question_file.get('topics', []))}")
+        else:
+            resumable = await find_resumable_session(job_id, candidate.id)
+            if not resumable:
+                logger.error(f"[WS] No prepared interview data for {prep_key}. Candidate must call /api/interview/prepare first.")
+                await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                return
+            resume_thread_id, resumed_state = resumable
+            context = await asyncio.to_thread(interview_context.get, resumed_state.get("context_id", resume_thread_id))
+            resume_profile = context.get("resume_profile", {})
+            question_file = context.get("question_file", {})
+            logger.info(f"[WS] Resuming {resume_thread_id} for {prep_key} | messages={len(resumed_state.get('messages', []))}")
 
         job_details = {
             "job_id": job_id,
@@ -675,7 +739,10 @@ async def websocket_interview(websocket: WebSocket, job_id: int):
             "additional_info": application.additional_info if application else "",
         }
 
-        await handle_voice_session(websocket, job_details, candidate_details, resume_profile, question_file)
+        interview_ran = True
+        await handle_voice_session(
+            websocket, job_details, candidate_details, resume_profile, question_file, resume_thread_id
+        )
 
     except Exception as e:
         logger.error(f"[WS] Auth/connection error: {type(e).__name__}: {e}")
@@ -684,6 +751,10 @@ async def websocket_interview(websocket: WebSocket, job_id: int):
         except Exception:
             pass
     finally:
+        if admitted_at is not None:
+            # Only a session that ran an interview says how long a slot is held;
+            # a connection turned away after admission would drag the estimate down
+            admission.release(time.time() - admitted_at if interview_ran else None)
         db.close()
 
 @app.get("/evaluations/job/{job_id}/candidate/{candidate_id}")
@@ -712,6 +783,155 @@ def get_evaluation_report(
 
 
 
+# ── Metrics ───────────────────────────────────────────────────────────────────
+# Saturation gauges are read from each component's own counters at scrape
+# time; the latency histograms and fallback counters live in metrics.py.
+
+THREAD_POOL_QUEUE = metrics_registry.gauge(
+    "thread_pool_queue_depth", "Jobs waiting for a worker thread", ("pool",),
+)
+THREAD_POOL_BUSY = metrics_registry.gauge(
+    "thread_pool_busy_threads", "Worker threads running a job", ("pool",),
+)
+metrics_registry.register_callback(
+    "ws_sessions_active", "Admitted interview WebSocket sessions", lambda: admission.active,
+)
+metrics_registry.register_callback(
+    "ws_sessions_waiting", "Interview sessions waiting in the admission queue", lambda: admission.stats()["waiting"],
+)
+metrics_registry.register_callback(
+    "admission_sessions_total", "Admission outcomes", lambda: {
+        ("admitted",): admission.admitted,
+        ("queued",): admission.queued,
+        ("rejected",): admission.rejected,
+        ("timed_out",): admission.timed_out,
+    }, kind="counter", labelnames=("outcome",),
+)
+metrics_registry.register_callback(
+    "prepared_interviews", "Prepared interviews not yet picked up by a WebSocket", lambda: len(_prepared_interviews),
+)
+metrics_registry.register_callback(
+    "stt_in_flight", "Transcriptions submitted to the STT pool and not yet answered", lambda: stt_pool.in_flight,
+)
+metrics_registry.register_callback(
+    "stt_workers_alive", "Live STT worker processes", lambda: stt_pool.stats()["alive"],
+)
+metrics_registry.register_callback(
+    "llm_in_flight", "Hot-path LLM requests currently open", llm_in_flight,
+)
+_checkpoint_stats_cache = {"at": 0.0, "stats": {}}
+
+
+def _checkpoint_stats() -> dict:
+    """One checkpoint_saver.stats() query per scrape, shared by both checkpoint gauges."""
+    now = time.monotonic()
+    if now - _checkpoint_stats_cache["at"] > 1.0:
+        _checkpoint_stats_cache["stats"] = checkpoint_saver.stats()
+        _checkpoint_stats_cache["at"] = now
+    return _checkpoint_stats_cache["stats"]
+
+
+metrics_registry.register_callback(
+    "checkpoint_threads", "Interview threads with persisted checkpoints", lambda: _checkpoint_stats()["threads"],
+)
+metrics_registry.register_callback(
+    "checkpoints", "Persisted graph checkpoints", lambda: _checkpoint_stats()["checkpoints"],
+)
+metrics_registry.register_callback(
+    "llm_cache_lookups_total", "Cold-path LLM response cache lookups", lambda: {
+        ("hit",): llm_cache.hits,
+        ("miss",): llm_cache.misses,
+    }, kind="counter", labelnames=("result",),
+)
+metrics_registry.register_callback(
+    "tts_cache_lookups_total", "TTS audio cache lookups", lambda: {
+        ("memory_hit",): tts_cache.memory_hits,
+        ("disk_hit",): tts_cache.disk_hits,
+        ("miss",): tts_cache.misses,
+    }, kind="counter", labelnames=("result",),
+)
+metrics_registry.register_callback(
+    "log_records_dropped_total", "Log records dropped because the log queue was full",
+    dropped_records, kind="counter",
+)
+
+
+# asyncio.to_thread() runs on the loop's default executor; installing our own
+# lets the gauges count its jobs instead of peeking at executor internals
+_default_executor = InstrumentedThreadPoolExecutor(thread_name_prefix="asyncio")
+
+
+@app.on_event("startup")
+async def install_default_executor():
+    asyncio.get_running_loop().set_default_executor(_default_executor)
+
+
+def _observe_thread_pools():
+    """Sample the pools that live on the event loop (must run on the loop)."""
+    THREAD_POOL_QUEUE.labels("asyncio").set(_default_executor.queued)
+    THREAD_POOL_BUSY.labels("asyncio").set(_default_executor.busy)
+    # Sync FastAPI endpoints run in anyio's pool, capped by its limiter
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    THREAD_POOL_QUEUE.labels("anyio").set(limiter.statistics().tasks_waiting)
+    THREAD_POOL_BUSY.labels("anyio").set(limiter.borrowed_tokens)
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus text exposition of every registered metric."""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    _observe_thread_pools()
+    # Some gauges query SQLite — render off the event loop
+    body = await asyncio.to_thread(metrics_registry.render)
+    return Response(body, media_type="text/plain; version=0.0.4")
+
+
+@app.get("/debug/traces/{thread_id}")
+def get_turn_traces(thread_id: str, limit: Optional[int] = None, current_user = Depends(allow_ceo_hr)):
+    """Per-turn latency traces (span trees) of one interview thread, oldest first."""
+    traces = tracer.traces(thread_id, limit)
+    if not traces:
+        raise HTTPException(status_code=404, detail="No traces buffered for this thread")
+    return {"thread_id": thread_id, "traces": traces, "tracer": tracer.stats()}
+
+
+@app.on_event("shutdown")
+async def shutdown_tracer():
+    """Flush traces still queued for the JSONL exporter."""
+    await asyncio.to_thread(tracer.close)
+
+
+@app.on_event("shutdown")
+async def shutdown_llm_clients():
+    """Release the shared async LLM connection pool."""
+    await aclose_llm_clients()
+
+
+@app.on_event("startup")
+async def start_stt_pool():
+    """Spawn the Whisper workers now so model loading doesn't delay the first answer."""
+    stt_pool.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_stt_pool():
+    await asyncio.to_thread(stt_pool.close)
+
+
+@app.on_event("startup")
+async def start_checkpoint_retention():
+    """Periodically evict abandoned interview checkpoints."""
+    checkpoint_retention.start()
+    logger.info(f"[Checkpointer] Retention started | {checkpoint_retention.stats()}")
+
+
+@app.on_event("shutdown")
+async def shutdown_checkpointer():
+    """Flush queued graph checkpoints to SQLite before the process exits."""
+    await checkpoint_retention.stop()
+    await asyncio.to_thread(checkpoint_saver.close)
+
 
 if __name__ == "__main__":
     import uvicorn
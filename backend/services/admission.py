@@ -0,0 +1,178 @@
+"""
+Admission control for interview WebSockets.
+
+Every accepted interview shares the same CPU (Whisper, VAD) and the same
+LLM quota, so past some point each extra session makes all running ones
+slower. The AdmissionController caps how many interviews run at once and
+queues the rest instead:
+
+  - Capacity:  up to ADMISSION_MAX_SESSIONS sessions at once (0 = no cap).
+               A new session is also held back while the STT pool has more
+               than ADMISSION_STT_BACKLOG decodes in flight per worker, or
+               more than ADMISSION_MAX_LLM_IN_FLIGHT hot-path LLM requests
+               are open — unless nothing is running at all
+  - Queue:     FIFO. A waiting client is told its position and an estimated
+               wait (position × average session length / capacity) when it
+               joins and every ADMISSION_UPDATE_INTERVAL seconds after that
+  - Limits:    at most ADMISSION_MAX_QUEUE waiting sessions, each for at most
+               ADMISSION_MAX_WAIT seconds; beyond that admit() says no and
+               the caller closes the socket with 1013 (try again later)
+
+Admission happens before the prepared interview data is consumed, so a
+client that is turned away can simply reconnect later.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional
+
+from backend.services.stt_pool import stt_pool
+from backend.services.llm_client import llm_in_flight
+
+logger = logging.getLogger("interviewer.admission")
+
+ADMISSION_MAX_SESSIONS = int(os.environ.get("ADMISSION_MAX_SESSIONS", str(2 * (os.cpu_count() or 1))))
+ADMISSION_MAX_QUEUE = int(os.environ.get("ADMISSION_MAX_QUEUE", "50"))
+ADMISSION_MAX_WAIT = float(os.environ.get("ADMISSION_MAX_WAIT", "900"))
+ADMISSION_UPDATE_INTERVAL = float(os.environ.get("ADMISSION_UPDATE_INTERVAL", "5"))
+# Decodes queued per STT worker beyond which new sessions wait
+ADMISSION_STT_BACKLOG = int(os.environ.get("ADMISSION_STT_BACKLOG", "2"))
+ADMISSION_MAX_LLM_IN_FLIGHT = int(os.environ.get("ADMISSION_MAX_LLM_IN_FLIGHT", "32"))
+# Assumed interview length until real sessions have been timed
+ADMISSION_SESSION_ESTIMATE = float(os.environ.get("ADMISSION_SESSION_ESTIMATE", "900"))
+
+# Weight of the newest session in the average session length
+EWMA_ALPHA = 0.2
+
+# Called with (queue position, estimated wait in seconds)
+QueuedCallback = Callable[[int, float], Awaitable[None]]
+
+
+class AdmissionController:
+
+    def __init__(
+        self,
+        max_sessions: int = ADMISSION_MAX_SESSIONS,
+        max_queue: int = ADMISSION_MAX_QUEUE,
+        max_wait: float = ADMISSION_MAX_WAIT,
+        update_interval: float = ADMISSION_UPDATE_INTERVAL,
+    ):
+        self.max_sessions = max_sessions
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.update_interval = update_interval
+        self.active = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.avg_session = ADMISSION_SESSION_ESTIMATE
+        self.avg_wait = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    # ── Capacity ──────────────────────────────────────────────
+
+    def overloaded(self) -> Optional[str]:
+        """Why running sessions are already under pressure, or None."""
+        stt_limit = ADMISSION_STT_BACKLOG * max(1, stt_pool.workers)
+        if stt_pool.in_flight > stt_limit:
+            return f"stt_in_flight={stt_pool.in_flight}>{stt_limit}"
+        if llm_in_flight() > ADMISSION_MAX_LLM_IN_FLIGHT:
+            return f"llm_in_flight={llm_in_flight()}>{ADMISSION_MAX_LLM_IN_FLIGHT}"
+        return None
+
+    def _has_capacity(self) -> bool:
+        if self.active == 0:
+            return True
+        if self.max_sessions and self.active >= self.max_sessions:
+            return False
+        return self.overloaded() is None
+
+    def _pump(self):
+        """Admit waiters from the head of the queue while there is room."""
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    def estimated_wait(self, position: int) -> float:
+        slots = self.max_sessions or max(1, self.active)
+        return position * self.avg_session / slots
+
+    # ── Sessions ──────────────────────────────────────────────
+
+    async def admit(self, on_queued: Optional[QueuedCallback] = None) -> bool:
+        """
+        Wait for a session slot. Returns False if the queue is full or the
+        wait ran past max_wait. An exception from on_queued (the client
+        went away) leaves the queue and propagates.
+        """
+        if not self._waiters and self._has_capacity():
+            self.active += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            logger.warning("[Admission] Queue full, rejecting session | %s", self.stats())
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        t0 = time.monotonic()
+        logger.info("[Admission] Session queued | position=%s | %s", len(self._waiters), self.overloaded() or 'at capacity')
+        try:
+            while not waiter.done():
+                if on_queued:
+                    position = self._waiters.index(waiter) + 1
+                    await on_queued(position, self.estimated_wait(position))
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter), self.update_interval)
+                except asyncio.TimeoutError:
+                    # Pressure-based holds don't end with a release(), so look again
+                    self._pump()
+                    if not waiter.done() and time.monotonic() - t0 > self.max_wait:
+                        self.timed_out += 1
+                        logger.warning("[Admission] Gave up after %.0fs in the queue", self.max_wait)
+                        return False
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release()   # admitted just as the client left
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                self._waiters.remove(waiter)
+
+        waited = time.monotonic() - t0
+        self.avg_wait += EWMA_ALPHA * (waited - self.avg_wait)
+        self.admitted += 1
+        logger.info("[Admission] Session admitted after %.1fs in the queue | active=%s", waited, self.active)
+        return True
+
+    def release(self, session_seconds: Optional[float] = None):
+        """A session ended; `session_seconds` feeds the wait estimate."""
+        self.active = max(0, self.active - 1)
+        if session_seconds is not None:
+            self.avg_session += EWMA_ALPHA * (session_seconds - self.avg_session)
+        self._pump()
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "waiting": len(self._waiters),
+            "max_sessions": self.max_sessions,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "avg_wait_s": round(self.avg_wait, 1),
+            "avg_session_s": round(self.avg_session, 1),
+        }
+
+
+admission = AdmissionController()
@@ -0,0 +1,188 @@
+"""
+Adaptive end-of-turn detection.
+
+A fixed silence window either adds its full length to every turn or cuts
+off candidates who pause mid-thought. The Endpointer decides per turn how
+much trailing silence ends it, from three signals:
+
+  - Pauses:      every mid-utterance pause the VAD sees (speech resumed
+                 afterwards) updates an EWMA mean/variance for this
+                 candidate; the base threshold is their p90 pause plus
+                 ENDPOINT_MARGIN_MS (ENDPOINT_DEFAULT_MS until
+                 ENDPOINT_MIN_SAMPLES pauses have been seen)
+  - Rate:        words per voiced second, EWMA over finished answers; slow
+                 speakers get proportionally longer thresholds
+  - Transcript:  the partial transcript, when it covers the audio up to the
+                 silence — a finished sentence shortens the threshold, a
+                 trailing conjunction/filler ("and", "so", "um"...) or comma
+                 lengthens it
+
+Thresholds stay within [ENDPOINT_MIN_MS, VAD_HANGOVER_MS]; the VAD's own
+hangover remains the hard cap. Every decision (silence, threshold, reason)
+is kept for stats(), which voice_handler logs with the session metrics.
+"""
+
+import os
+import math
+import logging
+from collections import Counter
+from typing import List, Optional
+
+from backend.services.vad import VAD_HANGOVER_MS
+
+logger = logging.getLogger("interviewer.endpointer")
+
+ENDPOINT_MIN_MS = float(os.environ.get("ENDPOINT_MIN_MS", "450"))
+ENDPOINT_DEFAULT_MS = float(os.environ.get("ENDPOINT_DEFAULT_MS", "900"))
+ENDPOINT_MARGIN_MS = float(os.environ.get("ENDPOINT_MARGIN_MS", "200"))
+# Silence after which a fresh partial transcript is requested
+ENDPOINT_PROBE_MS = float(os.environ.get("ENDPOINT_PROBE_MS", "250"))
+# Typical conversational rate; slower speakers get longer thresholds
+ENDPOINT_REFERENCE_WPS = float(os.environ.get("ENDPOINT_REFERENCE_WPS", "2.5"))
+
+# Shorter gaps are just between syllables/words
+MIN_PAUSE_MS = 150
+# Pauses needed before the candidate's p90 is trusted
+ENDPOINT_MIN_SAMPLES = 5
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.2
+
+COMPLETE_FACTOR = 0.6
+INCOMPLETE_FACTOR = 1.5
+RATE_SCALE_MIN, RATE_SCALE_MAX = 0.8, 1.4
+
+# Words that almost never end a turn
+_CONTINUATIONS = {
+    "and", "but", "or", "so", "because", "then", "that", "which", "who", "if",
+    "when", "while", "the", "a", "an", "to", "of", "in", "on", "for", "with",
+    "as", "is", "are", "was", "were", "my", "i", "um", "uh", "er", "like",
+}
+
+
+def sentence_complete(text: str) -> Optional[bool]:
+    """True for a finished sentence, False for an obviously unfinished one, None if unknown."""
+    text = text.rstrip()
+    if not text:
+        return None
+    if text.endswith(("...", "…", ",", "-", "—", ";", ":")):
+        return False
+    last_word = text.rsplit(None, 1)[-1].lower().strip(".,!?;:\"'")
+    if last_word in _CONTINUATIONS:
+        return False
+    return text[-1] in ".?!"
+
+
+class Endpointer:
+
+    def __init__(
+        self,
+        min_ms: float = ENDPOINT_MIN_MS,
+        default_ms: float = ENDPOINT_DEFAULT_MS,
+        max_ms: float = VAD_HANGOVER_MS,
+        margin_ms: float = ENDPOINT_MARGIN_MS,
+    ):
+        self.min_ms = min_ms
+        self.default_ms = default_ms
+        self.max_ms = max_ms
+        self.margin_ms = margin_ms
+        self.pause_mean = 0.0
+        self.pause_var = 0.0
+        self.pause_samples = 0
+        self.words_per_second = 0.0
+        self.threshold_ms = default_ms
+        self.reason = "default"
+        self._delays: List[float] = []
+        self._reasons: Counter = Counter()
+
+    # ── Candidate statistics ──────────────────────────────────
+
+    def observe_pause(self, ms: float):
+        """A pause inside an utterance — the candidate kept talking afterwards."""
+        if ms < MIN_PAUSE_MS:
+            return
+        if self.pause_samples == 0:
+            self.pause_mean = ms
+        else:
+            delta = ms - self.pause_mean
+            self.pause_mean += EWMA_ALPHA * delta
+            self.pause_var = (1 - EWMA_ALPHA) * (self.pause_var + EWMA_ALPHA * delta * delta)
+        self.pause_samples += 1
+
+    def observe_utterance(self, text: str, voiced_seconds: float):
+        words = len(text.split())
+        if not words or voiced_seconds < 1.0:
+            return
+        rate = words / voiced_seconds
+        if self.words_per_second == 0.0:
+            self.words_per_second = rate
+        else:
+            self.words_per_second += EWMA_ALPHA * (rate - self.words_per_second)
+
+    @property
+    def pause_p90(self) -> Optional[float]:
+        if self.pause_samples < ENDPOINT_MIN_SAMPLES:
+            return None
+        return self.pause_mean + 1.28 * math.sqrt(self.pause_var)
+
+    # ── Decision ──────────────────────────────────────────────
+
+    def threshold(self, transcript: Optional[str]) -> float:
+        """Trailing silence (ms) that ends the turn now; also sets self.reason."""
+        p90 = self.pause_p90
+        base = self.default_ms if p90 is None else p90 + self.margin_ms
+        if self.words_per_second:
+            base *= min(RATE_SCALE_MAX, max(RATE_SCALE_MIN, ENDPOINT_REFERENCE_WPS / self.words_per_second))
+
+        complete = sentence_complete(transcript) if transcript else None
+        if complete is True:
+            base *= COMPLETE_FACTOR
+            self.reason = "complete"
+        elif complete is False:
+            base *= INCOMPLETE_FACTOR
+            self.reason = "incomplete"
+        else:
+            self.reason = "silence" if p90 is not None else "default"
+        self.threshold_ms = min(self.max_ms, max(self.min_ms, base))
+        return self.threshold_ms
+
+    def should_end(self, silence_ms: float, transcript: Optional[str]) -> bool:
+        """
+        Called while the candidate is silent mid-utterance. `transcript` is
+        the partial transcript if it covers the audio up to the silence.
+        """
+        if silence_ms < self.threshold(transcript):
+            return False
+        self._record(silence_ms, self.reason)
+        return True
+
+    def hangover_reached(self):
+        """The VAD's hard cap ended the turn before any adaptive threshold did."""
+        self.threshold_ms = self.max_ms
+        self.reason = "max"
+        self._record(self.max_ms, "max")
+
+    def _record(self, silence_ms: float, reason: str):
+        self._delays.append(silence_ms)
+        self._reasons[reason] += 1
+        logger.info(
+            "[Endpointer] Turn end | silence=%.0fms | threshold=%.0fms (%s) | "
+            "pause_p90=%.0fms | wps=%.2f",
+            silence_ms, self.threshold_ms, reason, self.pause_p90 or 0, self.words_per_second
+        )
+
+    def stats(self) -> dict:
+        delays = sorted(self._delays)
+
+        def pct(q: float) -> Optional[float]:
+            return round(delays[min(len(delays) - 1, int(q * len(delays)))]) if delays else None
+
+        return {
+            "turns": len(delays),
+            "end_delay_p50_ms": pct(0.5),
+            "end_delay_p90_ms": pct(0.9),
+            "reasons": dict(self._reasons),
+            "threshold_ms": round(self.threshold_ms),
+            "pause_p90_ms": round(self.pause_p90) if self.pause_p90 is not None else None,
+            "pause_samples": self.pause_samples,
+            "words_per_second": round(self.words_per_second, 2),
+        }
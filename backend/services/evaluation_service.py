@@ -94,9 +94,11 @@ Evaluate the candidate and return a JSON object with this exact schema:
         job_details: Dict[str, Any],
         candidate_details: Dict[str, Any],
         evaluation_notes: Optional[List[Dict[str, Any]]] = None,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Analyzes the interview history and generates a structured evaluation report.
+        Re-running an evaluation on the same transcript is a cache hit unless use_cache=False.
         """
         logger.info(f"[Evaluation] Starting evaluation for {candidate_details.get('name')}")
         logger.info(f"[Evaluation]   Job: {job_details.get('title')} | Messages: {len(history)} | Eval notes: {len(evaluation_notes or [])}")
@@ -108,7 +110,7 @@ Evaluate the candidate and return a JSON object with this exact schema:
 
         try:
             raw_text = call_gemini(prompt, system_prompt, json_mode=True,
-                                   temperature=0.3, max_tokens=1500)
+                                   temperature=0.3, max_tokens=1500, use_cache=use_cache)
 
             if not raw_text:
                 raise ValueError("Empty response from LLM")
@@ -0,0 +1,157 @@
+"""
+Per-model latency tracking for the LLM cascade.
+
+Keeps an exponentially weighted moving average (EWMA) of latency, its
+variance and the failure rate for every model the client calls. Two
+consumers:
+  - hedge_budget(): how long to wait on the primary before hedging, taken
+    from the primary's observed p95 (mean + 1.645σ) and capped by config.
+    None (don't hedge) until LLM_HEDGE_MIN_SAMPLES calls have completed.
+    A primary cancelled because its hedge won is recorded with
+    record_cancelled() at the time it had already taken, so slow calls
+    still pull the p95 up instead of silently dropping out of it.
+  - order():        the cascade order — models that are currently failing
+    or far slower than the hedge budget are demoted behind healthy ones.
+"""
+
+import os
+import math
+import time
+import threading
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("interviewer.latency")
+
+# Hedge after the primary's p95, but never later than LLM_HEDGE_BUDGET
+# and never sooner than LLM_HEDGE_MIN (seconds)
+LLM_HEDGE_BUDGET = float(os.environ.get("LLM_HEDGE_BUDGET", "1.5"))
+LLM_HEDGE_MIN = float(os.environ.get("LLM_HEDGE_MIN", "0.3"))
+# Completed (not cancelled) calls needed before a model is hedged at all
+LLM_HEDGE_MIN_SAMPLES = int(os.environ.get("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+# Weight of the newest sample in the moving averages
+EWMA_ALPHA = 0.2
+
+# Samples needed before the p95 estimate is trusted
+MIN_SAMPLES = 5
+
+# A model is demoted when its failure EWMA goes above this
+MAX_FAILURE_RATE = 0.5
+
+# A demoted model gets its slot back after this long without new samples,
+# so it is re-probed instead of staying at the back forever
+DEMOTION_TTL = 30.0
+
+
+class ModelLatency:
+    """EWMA mean/variance of latency plus EWMA failure rate for one model."""
+
+    def __init__(self):
+        self.mean = 0.0
+        self.var = 0.0
+        self.failure_rate = 0.0
+        self.samples = 0
+        self.completed = 0
+        self.updated = 0.0
+
+    def observe(self, seconds: float, succeeded: bool = True):
+        self.updated = time.monotonic()
+        if self.samples == 0:
+            self.mean = seconds
+        else:
+            delta = seconds - self.mean
+            self.mean += EWMA_ALPHA * delta
+            self.var = (1 - EWMA_ALPHA) * (self.var + EWMA_ALPHA * delta * delta)
+        self.samples += 1
+        if succeeded:
+            self.completed += 1
+            self.failure_rate *= (1 - EWMA_ALPHA)
+
+    def fail(self):
+        self.updated = time.monotonic()
+        self.failure_rate = (1 - EWMA_ALPHA) * self.failure_rate + EWMA_ALPHA
+
+    @property
+    def p95(self) -> Optional[float]:
+        if self.samples < MIN_SAMPLES:
+            return None
+        return self.mean + 1.645 * math.sqrt(self.var)
+
+
+class LatencyTracker:
+
+    def __init__(
+        self,
+        hedge_budget: float = LLM_HEDGE_BUDGET,
+        hedge_min: float = LLM_HEDGE_MIN,
+        hedge_min_samples: int = LLM_HEDGE_MIN_SAMPLES,
+    ):
+        self.max_budget = hedge_budget
+        self.min_budget = hedge_min
+        self.min_samples = hedge_min_samples
+        self._stats: Dict[str, ModelLatency] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, model: str) -> ModelLatency:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats.setdefault(model, ModelLatency())
+        return stats
+
+    def record(self, model: str, seconds: float):
+        with self._lock:
+            self._get(model).observe(seconds)
+
+    def record_cancelled(self, model: str, seconds: float):
+        """A call abandoned after `seconds` — a lower bound on its latency."""
+        with self._lock:
+            self._get(model).observe(seconds, succeeded=False)
+
+    def record_failure(self, model: str):
+        with self._lock:
+            self._get(model).fail()
+
+    def hedge_budget(self, model: str) -> Optional[float]:
+        """Seconds to wait for `model` before firing a hedged request (None: don't hedge)."""
+        stats = self._get(model)
+        if stats.completed < self.min_samples or stats.p95 is None:
+            return None
+        return min(self.max_budget, max(self.min_budget, stats.p95))
+
+    def is_healthy(self, model: str) -> bool:
+        stats = self._get(model)
+        if time.monotonic() - stats.updated > DEMOTION_TTL:
+            return True
+        if stats.failure_rate > MAX_FAILURE_RATE:
+            return False
+        return stats.samples < MIN_SAMPLES or stats.mean <= 2 * self.max_budget
+
+    def order(self, models: List[str]) -> List[str]:
+        """
+        Configured order, except unhealthy models move to the back. Healthy
+        models are never reordered among themselves — the primary is the
+        better model, so it only loses its slot while it is misbehaving.
+        """
+        healthy = [m for m in models if self.is_healthy(m)]
+        if len(healthy) == len(models):
+            return list(models)
+        demoted = [m for m in models if m not in healthy]
+        logger.info("[Latency] Demoting unhealthy models %s → order=%s", demoted, healthy + demoted)
+        return healthy + demoted
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                model: {
+                    "ewma_s": round(s.mean, 3),
+                    "p95_s": round(s.p95, 3) if s.p95 is not None else None,
+                    "failure_rate": round(s.failure_rate, 3),
+                    "samples": s.samples,
+                    "completed": s.completed,
+                }
+                for model, s in self._stats.items()
+            }
+
+
+latency_tracker = LatencyTracker()
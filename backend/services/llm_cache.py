@@ -0,0 +1,181 @@
+"""
+Content-addressed cache for cold-path LLM responses.
+
+Resume parsing, question-file generation and evaluation are pure functions
+of their prompts, yet they re-run the full Qwen call whenever the inputs
+repeat (same resume re-uploaded, "Prepare Interview" clicked twice, an
+evaluation re-run). This cache stores responses in SQLite keyed by
+sha256(provider + model + system prompt + user prompt + temperature +
+max_tokens + json_mode) — the provider keeps canned LLM_PROVIDER=fake
+replies from a benchmark out of production lookups.
+
+  - TTL eviction:   entries older than LLM_CACHE_TTL seconds are dropped
+  - Size eviction:  least-recently-used entries beyond LLM_CACHE_MAX_ENTRIES
+                    or LLM_CACHE_MAX_BYTES are dropped
+  - Counters:       hits / misses / writes / evictions via stats()
+
+Only non-empty responses from the model the key names are cached, and in
+JSON mode only ones that parse (llm_client._cacheable) — a failed,
+truncated or fallback-model answer is never replayed.
+Hot-path calls (call_llm / acall_llm) are NOT cached.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import logging
+from typing import Optional
+
+logger = logging.getLogger("interviewer.llm_cache")
+
+# Runtime data, git-ignored (both the LLM and TTS caches live here)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "1") != "0"
+LLM_CACHE_PATH = os.environ.get("LLM_CACHE_PATH", os.path.join(CACHE_DIR, "llm_cache.sqlite3"))
+LLM_CACHE_TTL = float(os.environ.get("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MAX_BYTES = int(os.environ.get("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
+# Run eviction every N writes rather than on every put
+EVICT_EVERY = 50
+
+
+class LLMResponseCache:
+
+    def __init__(
+        self,
+        path: str = LLM_CACHE_PATH,
+        ttl: float = LLM_CACHE_TTL,
+        max_entries: int = LLM_CACHE_MAX_ENTRIES,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily so importing llm_client never touches the disk
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed)")
+            conn.commit()
+            self._conn = conn
+            logger.info("[LLMCache] Opened %s | ttl=%ss | max_entries=%s", self.path, self.ttl, self.max_entries)
+        return self._conn
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> str:
+        payload = json.dumps(
+            [provider, model, system_prompt, user_prompt, temperature, max_tokens, json_mode],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, created FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row[1] > self.ttl:
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE llm_cache SET accessed = ? WHERE key = ?", (now, key))
+                conn.commit()
+                self.hits += 1
+                return row[0]
+        except sqlite3.Error as e:
+            logger.warning("[LLMCache] Read failed, treating as miss: %s", e)
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: str):
+        if not value:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, value, len(value.encode("utf-8")), now, now),
+                )
+                conn.commit()
+                self.writes += 1
+                if self.writes % EVICT_EVERY == 1:
+                    self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning("[LLMCache] Write failed: %s", e)
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired rows, then LRU rows until under both count and byte caps."""
+        removed = conn.execute("DELETE FROM llm_cache WHERE created < ?", (now - self.ttl,)).rowcount
+
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache").fetchone()
+        if count > self.max_entries or total > self.max_bytes:
+            rows = conn.execute("SELECT key, size FROM llm_cache ORDER BY accessed ASC").fetchall()
+            doomed = []
+            for key, size in rows:
+                if count <= self.max_entries and total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                count -= 1
+                total -= size
+            conn.executemany("DELETE FROM llm_cache WHERE key = ?", doomed)
+            removed += len(doomed)
+
+        conn.commit()
+        if removed:
+            self.evictions += removed
+            logger.info("[LLMCache] Evicted %s entries | remaining=%s", removed, count)
+
+    def clear(self):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+llm_cache = LLMResponseCache()
@@ -5,21 +5,88 @@ Two model families, both via Groq:
   - Llama 3.3 70B:  Hot-path interview loop (grader, question_gen, planner).
   - Qwen3 32B:      Cold-path prep tasks (resume parsing, question file gen, evaluation).
 
+Each family has a sync entry point (call_llm / call_gemini) for code that
+runs in worker threads, and an async twin (acall_llm / acall_gemini) for
+code that runs on the event loop. The async client shares one size-limited
+httpx connection pool, so an in-flight request holds a socket, not a thread.
+
+Every request first takes a slot from the process-wide per-model rate
+limiter (see rate_limiter.py); 429s back off with jitter on that shared
+schedule instead of each session sleeping and retrying on its own.
+
+The async hot path hedges: if the primary hasn't answered within its
+observed p95 (capped by LLM_HEDGE_BUDGET), the same request goes to the
+fallback and the first non-empty answer wins (no hedging until the primary
+has LLM_HEDGE_MIN_SAMPLES completed calls). Per-model EWMA latency and
+failure rates (latency_tracker.py) demote misbehaving models in the cascade.
+
+Cold-path responses are cached on disk (llm_cache.py); pass use_cache=False
+to call_gemini / acall_gemini to force a fresh call.
+
+LLM_PROVIDER=fake points both clients at FAKE_LLM_URL instead of Groq — the
+offline stand-in in backend/tools/fake_providers.py, for benchmarks.
+
 All services import from here.
 """
 
 import os
+import json
 import time
+import asyncio
 import logging
-from groq import Groq
+from contextlib import contextmanager
+from typing import AsyncIterator, Optional, Tuple
+from groq import Groq, AsyncGroq, DefaultAsyncHttpxClient
+import httpx
 from dotenv import load_dotenv
+from backend.services.rate_limiter import rate_limiter, backoff_delay
+from backend.services.latency_tracker import latency_tracker
+from backend.services.llm_cache import llm_cache, LLM_CACHE_ENABLED
+from backend.services.tracing import span
+from backend.services.metrics import LLM_REQUEST_SECONDS, LLM_FIRST_TOKEN_SECONDS, LLM_RATE_LIMITED, FALLBACKS
 
 load_dotenv()
 
 logger = logging.getLogger("interviewer.llm")
 
-# ── Groq client (shared for both model families) ──────────────────────────
-_groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+# ── Connection pool limits for the async client ───────────────────────────
+# Every concurrent interview shares this pool. Requests beyond
+# LLM_MAX_CONNECTIONS wait (up to LLM_POOL_TIMEOUT) for a free connection.
+LLM_MAX_CONNECTIONS = int(os.environ.get("LLM_MAX_CONNECTIONS", "64"))
+LLM_MAX_KEEPALIVE = int(os.environ.get("LLM_MAX_KEEPALIVE", "32"))
+LLM_POOL_TIMEOUT = float(os.environ.get("LLM_POOL_TIMEOUT", "30"))
+
+# ── Provider ──────────────────────────────────────────────────────────────
+# "groq": the real API. "fake": a local server speaking the same API
+# (python -m backend.tools.fake_providers) at FAKE_LLM_URL.
+LLM_PROVIDERS = ("groq", "fake")
+LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "groq").lower()
+if LLM_PROVIDER not in LLM_PROVIDERS:
+    raise ValueError(f"LLM_PROVIDER must be one of {LLM_PROVIDERS}, got {LLM_PROVIDER!r}")
+FAKE_LLM_URL = os.environ.get("FAKE_LLM_URL", "http://127.0.0.1:8790")
+
+if LLM_PROVIDER == "fake":
+    _base_url = FAKE_LLM_URL
+    _api_key = os.getenv("GROQ_API_KEY") or "fake"
+else:
+    _base_url = None   # SDK default (or GROQ_BASE_URL)
+    _api_key = os.getenv("GROQ_API_KEY")
+
+# ── Groq clients (shared for both model families) ─────────────────────────
+# max_retries=0: retries/backoff are ours (rate-limiter aware), not the SDK's
+_groq_client = Groq(api_key=_api_key, base_url=_base_url, max_retries=0)
+_async_groq_client = AsyncGroq(
+    api_key=_api_key,
+    base_url=_base_url,
+    max_retries=0,
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE,
+        ),
+        timeout=httpx.Timeout(60.0, pool=LLM_POOL_TIMEOUT),
+    ),
+)
 
 # Hot-path: fast interview loop
 GROQ_PRIMARY = "llama-3.3-70b-versatile"
@@ -29,6 +96,98 @@ GROQ_FALLBACK = "llama-3.1-8b-instant"
 QWEN_PRIMARY = "qwen/qwen3-32b"
 QWEN_FALLBACK = "llama-3.3-70b-versatile"  # Fall back to Llama if Qwen fails
 
+# ── Per-model quotas: (requests/min, tokens/min) ──────────────────────────
+# Client-side limiting is opt-in: LLM_RATE_LIMIT_ENABLED=1 (or setting
+# LLM_RATE_LIMITS) turns it on. The defaults below match Groq's free tier and
+# would needlessly cap a paid account; override them with LLM_RATE_LIMITS,
+# a JSON object like {"llama-3.3-70b-versatile": [1000, 300000]}. 429
+# backoff (Retry-After or jittered) applies either way, see rate_limiter.py.
+MODEL_RATE_LIMITS = {
+    GROQ_PRIMARY: (30, 12000),
+    GROQ_FALLBACK: (30, 6000),
+    QWEN_PRIMARY: (60, 6000),
+}
+MODEL_RATE_LIMITS.update({
+    model: tuple(limits)
+    for model, limits in json.loads(os.environ.get("LLM_RATE_LIMITS", "{}")).items()
+})
+rate_limiter.configure(MODEL_RATE_LIMITS)
+rate_limiter.enabled = os.environ.get(
+    "LLM_RATE_LIMIT_ENABLED", "1" if os.environ.get("LLM_RATE_LIMITS") else "0"
+) != "0"
+
+# Longest we queue for one model before cascading to the next one
+LLM_MAX_QUEUE_WAIT = float(os.environ.get("LLM_MAX_QUEUE_WAIT", "10"))
+
+# Hedged requests on the hot path (set LLM_HEDGING=0 to disable)
+LLM_HEDGING = os.environ.get("LLM_HEDGING", "1") != "0"
+
+# Hot-path model calls currently queued or running (read by admission.py)
+_llm_in_flight = 0
+
+
+def llm_in_flight() -> int:
+    return _llm_in_flight
+
+
+@contextmanager
+def _tracked_in_flight():
+    global _llm_in_flight
+    _llm_in_flight += 1
+    try:
+        yield
+    finally:
+        _llm_in_flight -= 1
+
+
+def _truncate_prompt(user_prompt: str, system_prompt: str, tag: str) -> str:
+    """Safety guard: truncate extremely long prompts to avoid wasting tokens."""
+    total_chars = len(system_prompt) + len(user_prompt)
+    if total_chars > 8000:
+        logger.warning("[LLM/%s] Prompt too large (%s chars), truncating user_prompt", tag, total_chars)
+        user_prompt = user_prompt[:7000 - len(system_prompt)] + "\n...(truncated)"
+    return user_prompt
+
+
+def _build_request(
+    model: str,
+    user_prompt: str,
+    system_prompt: str,
+    json_mode: bool,
+    temperature: float,
+    max_tokens: int,
+) -> dict:
+    """Build the chat.completions.create kwargs for one model."""
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": user_prompt})
+
+    kwargs = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    if json_mode:
+        kwargs["response_format"] = {"type": "json_object"}
+    return kwargs
+
+
+def _is_quota_error(e: Exception) -> bool:
+    error_msg = str(e)
+    return any(k in error_msg for k in ["rate_limit", "quota", "429", "Too Many Requests"])
+
+
+def _estimate_tokens(user_prompt: str, system_prompt: str, max_tokens: int) -> int:
+    """Rough TPM reservation: ~4 chars per prompt token + the completion budget."""
+    return (len(system_prompt) + len(user_prompt)) // 4 + max_tokens
+
+
+def _usage_tokens(response) -> int:
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "total_tokens", 0) or 0
+
 
 def _call_groq(
     user_prompt: str,
@@ -42,64 +201,235 @@ def _call_groq(
     """
     Internal helper: Call Groq with retry (3x) + model cascade.
     """
+    return _call_groq_model(user_prompt, system_prompt, json_mode, temperature, max_tokens, models, tag)[0]
+
+
+def _call_groq_model(
+    user_prompt: str,
+    system_prompt: str = "",
+    json_mode: bool = True,
+    temperature: float = 0.7,
+    max_tokens: int = 500,
+    models: list = None,
+    tag: str = "Groq",
+) -> Tuple[str, Optional[str]]:
+    """_call_groq, also returning the model that answered (None if none did)."""
     if models is None:
         models = [GROQ_PRIMARY, GROQ_FALLBACK]
 
-    # Safety guard: truncate extremely long prompts to avoid wasting tokens
-    total_chars = len(system_prompt) + len(user_prompt)
-    if total_chars > 8000:
-        logger.warning(f"[LLM/{tag}] Prompt too large ({total_chars} chars), truncating user_prompt")
-        user_prompt = user_prompt[:7000 - len(system_prompt)] + "\n...(truncated)"
+    user_prompt = _truncate_prompt(user_prompt, system_prompt, tag)
 
-    for model in models:
+    est_tokens = _estimate_tokens(user_prompt, system_prompt, max_tokens)
+
+    for model in latency_tracker.order(models):
         for attempt in range(3):
+            if not rate_limiter.acquire_blocking(model, est_tokens, max_wait=LLM_MAX_QUEUE_WAIT):
+                break
             try:
                 if attempt == 0:
-                    logger.info(f"[LLM/{tag}] Calling model={model} attempt=1/3 temp={temperature} prompt={len(system_prompt)+len(user_prompt)} chars")
+                    logger.info("[LLM/%s] Calling model=%s attempt=1/3 temp=%s prompt=%s chars", tag, model, temperature, len(system_prompt)+len(user_prompt))
                 else:
-                    logger.info(f"[LLM/{tag}] Calling model={model} attempt={attempt + 1}/3 temp={temperature}")
+                    logger.info("[LLM/%s] Calling model=%s attempt=%s/3 temp=%s", tag, model, attempt + 1, temperature)
                 t0 = time.time()
 
-                messages = []
-                if system_prompt:
-                    messages.append({"role": "system", "content": system_prompt})
-                messages.append({"role": "user", "content": user_prompt})
+                kwargs = _build_request(model, user_prompt, system_prompt, json_mode, temperature, max_tokens)
+                response = _groq_client.chat.completions.create(**kwargs)
+                rate_limiter.settle(model, est_tokens, _usage_tokens(response))
+                result = response.choices[0].message.content.strip() if response.choices else ""
+
+                elapsed = round(time.time() - t0, 2)
+                if not result:
+                    logger.warning("[LLM/%s] %s returned empty text after %ss", tag, model, elapsed)
+                    latency_tracker.record_failure(model)
+                    continue
+
+                latency_tracker.record(model, elapsed)
+                LLM_REQUEST_SECONDS.labels(model, tag).observe(elapsed)
+                logger.info("[LLM/%s] OK model=%s elapsed=%ss | %s...", tag, model, elapsed, result[:120])
+                return result, model
+
+            except Exception as e:
+                latency_tracker.record_failure(model)
+                is_quota = _is_quota_error(e)
+                if is_quota:
+                    LLM_RATE_LIMITED.labels(model).inc()
+                logger.warning("[LLM/%s] ERROR %s | model=%s | attempt=%s | quota=%s", tag, type(e).__name__, model, attempt+1, is_quota)
+                if is_quota and attempt < 2:
+                    # Back off on the shared schedule; the next acquire waits it out
+                    wait = backoff_delay(attempt, e)
+                    rate_limiter.penalize(model, wait)
+                    logger.info("[LLM/%s] Rate limited, model=%s backing off %.2fs...", tag, model, wait)
+                else:
+                    break
+
+    logger.error("[LLM/%s] CRITICAL: All models exhausted. Returning fallback.", tag)
+    FALLBACKS.labels("llm_exhausted").inc()
+    return "", None
 
-                kwargs = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                }
-                if json_mode:
-                    kwargs["response_format"] = {"type": "json_object"}
 
-                response = _groq_client.chat.completions.create(**kwargs)
+async def _acall_model(
+    model: str,
+    user_prompt: str,
+    system_prompt: str,
+    json_mode: bool,
+    temperature: float,
+    max_tokens: int,
+    est_tokens: int,
+    tag: str,
+) -> str:
+    """One model, up to 3 attempts. Returns "" if the model gave up."""
+    with span("llm", model=model, tag=tag) as llm_span:
+        for attempt in range(3):
+            if not await rate_limiter.acquire(model, est_tokens, max_wait=LLM_MAX_QUEUE_WAIT):
+                break
+            try:
+                if attempt == 0:
+                    logger.info("[LLM/%s] Calling model=%s attempt=1/3 temp=%s prompt=%s chars (async)", tag, model, temperature, len(system_prompt)+len(user_prompt))
+                else:
+                    logger.info("[LLM/%s] Calling model=%s attempt=%s/3 temp=%s (async)", tag, model, attempt + 1, temperature)
+                t0 = time.time()
+
+                kwargs = _build_request(model, user_prompt, system_prompt, json_mode, temperature, max_tokens)
+                with _tracked_in_flight():
+                    response = await _async_groq_client.chat.completions.create(**kwargs)
+                rate_limiter.settle(model, est_tokens, _usage_tokens(response))
                 result = response.choices[0].message.content.strip() if response.choices else ""
 
                 elapsed = round(time.time() - t0, 2)
                 if not result:
-                    logger.warning(f"[LLM/{tag}] {model} returned empty text after {elapsed}s")
+                    logger.warning("[LLM/%s] %s returned empty text after %ss", tag, model, elapsed)
+                    latency_tracker.record_failure(model)
                     continue
 
-                logger.info(f"[LLM/{tag}] OK model={model} elapsed={elapsed}s | {result[:120]}...")
+                latency_tracker.record(model, elapsed)
+                LLM_REQUEST_SECONDS.labels(model, tag).observe(elapsed)
+                llm_span.set(attempts=attempt + 1, tokens=_usage_tokens(response))
+                logger.info("[LLM/%s] OK model=%s elapsed=%ss | %s...", tag, model, elapsed, result[:120])
                 return result
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                error_msg = str(e)
-                is_quota = any(k in error_msg for k in ["rate_limit", "quota", "429", "Too Many Requests"])
-                logger.warning(f"[LLM/{tag}] ERROR {type(e).__name__} | model={model} | attempt={attempt+1} | quota={is_quota}")
+                latency_tracker.record_failure(model)
+                is_quota = _is_quota_error(e)
+                if is_quota:
+                    LLM_RATE_LIMITED.labels(model).inc()
+                logger.warning("[LLM/%s] ERROR %s | model=%s | attempt=%s | quota=%s", tag, type(e).__name__, model, attempt+1, is_quota)
                 if is_quota and attempt < 2:
-                    wait = 2 ** (attempt + 1)
-                    logger.info(f"[LLM/{tag}] Rate limited, waiting {wait}s...")
-                    time.sleep(wait)
+                    # Back off on the shared schedule; the next acquire waits it out
+                    wait = backoff_delay(attempt, e)
+                    rate_limiter.penalize(model, wait)
+                    llm_span.event("rate_limited", backoff_s=round(wait, 2))
+                    logger.info("[LLM/%s] Rate limited, model=%s backing off %.2fs...", tag, model, wait)
                 else:
                     break
-
-    logger.error(f"[LLM/{tag}] CRITICAL: All models exhausted. Returning fallback.")
+        llm_span.set(result="empty")
     return ""
 
 
+async def _acall_hedged(primary: str, backup: str, call, tag: str) -> Tuple[str, Optional[str]]:
+    """
+    Start `primary`; if it hasn't produced an answer within its hedge budget
+    (or fails), start `backup` too and return whichever answers first, with
+    the model that gave it. The loser is cancelled, and recorded in the
+    latency tracker at the time it had taken. Until the primary has enough
+    completed calls for a p95, it is only replaced when it fails.
+    """
+    budget = latency_tracker.hedge_budget(primary)
+    primary_task = asyncio.create_task(call(primary))
+    pending = {primary_task}
+    models = {primary_task: primary}
+    started = {primary_task: time.perf_counter()}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=budget)
+        if primary_task in done and primary_task.result():
+            return primary_task.result(), primary
+
+        if primary_task in done:
+            logger.info("[LLM/%s] %s failed, falling back to %s", tag, primary, backup)
+        else:
+            logger.info("[LLM/%s] %s slower than %.2fs, hedging with %s", tag, primary, budget, backup)
+        backup_task = asyncio.create_task(call(backup))
+        models[backup_task] = backup
+        started[backup_task] = time.perf_counter()
+        pending.add(backup_task)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.result():
+                    return task.result(), models[task]
+        return "", None
+    finally:
+        for task in pending:
+            task.cancel()
+            latency_tracker.record_cancelled(models[task], time.perf_counter() - started[task])
+
+
+async def _acall_groq(
+    user_prompt: str,
+    system_prompt: str = "",
+    json_mode: bool = True,
+    temperature: float = 0.7,
+    max_tokens: int = 500,
+    models: list = None,
+    tag: str = "Groq",
+    hedge: bool = False,
+) -> str:
+    """
+    Async twin of _call_groq: same retry (3x) + model cascade, but awaits
+    the shared AsyncGroq client instead of blocking a worker thread.
+    With hedge=True the first two models in the cascade race (see _acall_hedged).
+    """
+    result, _ = await _acall_groq_model(user_prompt, system_prompt, json_mode, temperature,
+                                        max_tokens, models, tag, hedge)
+    return result
+
+
+async def _acall_groq_model(
+    user_prompt: str,
+    system_prompt: str = "",
+    json_mode: bool = True,
+    temperature: float = 0.7,
+    max_tokens: int = 500,
+    models: list = None,
+    tag: str = "Groq",
+    hedge: bool = False,
+) -> Tuple[str, Optional[str]]:
+    """_acall_groq, also returning the model that answered (None if none did)."""
+    if models is None:
+        models = [GROQ_PRIMARY, GROQ_FALLBACK]
+
+    user_prompt = _truncate_prompt(user_prompt, system_prompt, tag)
+    est_tokens = _estimate_tokens(user_prompt, system_prompt, max_tokens)
+    models = latency_tracker.order(models)
+
+    def call(model: str):
+        return _acall_model(model, user_prompt, system_prompt, json_mode,
+                            temperature, max_tokens, est_tokens, tag)
+
+    if hedge and len(models) > 1:
+        result, model = await _acall_hedged(models[0], models[1], call, tag)
+        if result:
+            return result, model
+        models = models[2:]
+
+    for model in models:
+        result = await call(model)
+        if result:
+            return result, model
+
+    logger.error("[LLM/%s] CRITICAL: All models exhausted. Returning fallback.", tag)
+    FALLBACKS.labels("llm_exhausted").inc()
+    return "", None
+
+
+async def aclose_llm_clients():
+    """Close the shared async connection pool. Called on app shutdown."""
+    await _async_groq_client.close()
+    logger.info("[LLM] Async connection pool closed.")
+
+
 def call_llm(
     user_prompt: str,
     system_prompt: str = "",
@@ -122,24 +452,176 @@ def call_llm(
     )
 
 
+def _cacheable(result: str, answered_by: Optional[str], keyed_model: str, json_mode: bool) -> bool:
+    """
+    Only the keyed (primary) model's answers are stored, and in JSON mode
+    only ones that parse — a truncated or malformed reply must not be
+    replayed to resume_parser / question_file_generator for days.
+    """
+    if not result or answered_by != keyed_model:
+        return False
+    if json_mode:
+        try:
+            json.loads(result)
+        except ValueError:
+            logger.warning("[LLM/Groq/Qwen] Not caching unparseable JSON from %s", answered_by)
+            return False
+    return True
+
+
 def call_gemini(
     user_prompt: str,
     system_prompt: str = "",
     json_mode: bool = True,
     temperature: float = 0.5,
     max_tokens: int = 500,
+    use_cache: bool = True,
 ) -> str:
     """
     Call Groq Qwen3-32B for cold-path prep tasks.
     Replaces the old Gemini calls — same interface, now powered by Qwen via Groq.
     Used by: resume_parser, question_file_generator, evaluation_service.
+    Identical requests are served from the on-disk cache unless use_cache=False.
     """
-    return _call_groq(
+    models = [QWEN_PRIMARY, QWEN_FALLBACK]
+    cache_key = None
+    if use_cache and LLM_CACHE_ENABLED:
+        cache_key = llm_cache.make_key(LLM_PROVIDER, models[0], system_prompt, user_prompt, temperature, max_tokens, json_mode)
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[LLM/Groq/Qwen] Cache HIT key=%s | %s", cache_key[:12], llm_cache.stats())
+            return cached
+
+    result, answered_by = _call_groq_model(
+        user_prompt=user_prompt,
+        system_prompt=system_prompt,
+        json_mode=json_mode,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        models=models,
+        tag="Groq/Qwen",
+    )
+    if cache_key and _cacheable(result, answered_by, models[0], json_mode):
+        llm_cache.put(cache_key, result)
+    return result
+
+
+async def acall_llm(
+    user_prompt: str,
+    system_prompt: str = "",
+    json_mode: bool = True,
+    temperature: float = 0.7,
+    max_tokens: int = 500,
+) -> str:
+    """
+    Async version of call_llm for the hot-path interview loop.
+    Used by: grader, question_gen, planner nodes (graph runs via ainvoke).
+    """
+    return await _acall_groq(
+        user_prompt=user_prompt,
+        system_prompt=system_prompt,
+        json_mode=json_mode,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        models=[GROQ_PRIMARY, GROQ_FALLBACK],
+        tag="Groq/Llama",
+        hedge=LLM_HEDGING,
+    )
+
+
+async def astream_llm(
+    user_prompt: str,
+    system_prompt: str = "",
+    temperature: float = 0.7,
+    max_tokens: int = 500,
+) -> AsyncIterator[str]:
+    """
+    Stream a plain-text (non-JSON) hot-path completion, yielding text deltas
+    as they arrive. Used by the streaming planner to feed TTS sentence by
+    sentence. A model that fails before its first token cascades to the
+    next one; once text has been yielded the stream can't be restarted, so a
+    mid-stream failure just ends it early.
+    """
+    tag = "Groq/Llama/stream"
+    user_prompt = _truncate_prompt(user_prompt, system_prompt, tag)
+    est_tokens = _estimate_tokens(user_prompt, system_prompt, max_tokens)
+
+    for model in latency_tracker.order([GROQ_PRIMARY, GROQ_FALLBACK]):
+        if not await rate_limiter.acquire(model, est_tokens, max_wait=LLM_MAX_QUEUE_WAIT):
+            continue
+        emitted = False
+        try:
+            logger.info("[LLM/%s] Streaming model=%s temp=%s prompt=%s chars", tag, model, temperature, len(system_prompt)+len(user_prompt))
+            t0 = time.time()
+            kwargs = _build_request(model, user_prompt, system_prompt, False, temperature, max_tokens)
+            with _tracked_in_flight(), span("llm", current=False, model=model, tag=tag, stream=True) as llm_span:
+                stream = await _async_groq_client.chat.completions.create(stream=True, **kwargs)
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if not delta:
+                        continue
+                    if not emitted:
+                        emitted = True
+                        llm_span.event("first_token")
+                        LLM_FIRST_TOKEN_SECONDS.labels(model, tag).observe(time.time() - t0)
+                        logger.info("[LLM/%s] First token model=%s after %ss", tag, model, round(time.time() - t0, 2))
+                    yield delta
+
+            elapsed = round(time.time() - t0, 2)
+            if emitted:
+                latency_tracker.record(model, elapsed)
+                LLM_REQUEST_SECONDS.labels(model, tag).observe(elapsed)
+                logger.info("[LLM/%s] OK model=%s elapsed=%ss", tag, model, elapsed)
+                return
+            latency_tracker.record_failure(model)
+            logger.warning("[LLM/%s] %s streamed no text after %ss", tag, model, elapsed)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            latency_tracker.record_failure(model)
+            is_quota = _is_quota_error(e)
+            if is_quota:
+                LLM_RATE_LIMITED.labels(model).inc()
+            logger.warning("[LLM/%s] ERROR %s | model=%s | quota=%s | emitted=%s", tag, type(e).__name__, model, is_quota, emitted)
+            if is_quota:
+                rate_limiter.penalize(model, backoff_delay(0, e))
+            if emitted:
+                return
+
+    logger.error("[LLM/%s] CRITICAL: All models exhausted while streaming.", tag)
+    FALLBACKS.labels("llm_exhausted").inc()
+
+
+async def acall_gemini(
+    user_prompt: str,
+    system_prompt: str = "",
+    json_mode: bool = True,
+    temperature: float = 0.5,
+    max_tokens: int = 500,
+    use_cache: bool = True,
+) -> str:
+    """
+    Async version of call_gemini for cold-path prep tasks running on the event loop.
+    """
+    models = [QWEN_PRIMARY, QWEN_FALLBACK]
+    cache_key = None
+    if use_cache and LLM_CACHE_ENABLED:
+        cache_key = llm_cache.make_key(LLM_PROVIDER, models[0], system_prompt, user_prompt, temperature, max_tokens, json_mode)
+        cached = await asyncio.to_thread(llm_cache.get, cache_key)
+        if cached is not None:
+            logger.info("[LLM/Groq/Qwen] Cache HIT key=%s | %s", cache_key[:12], llm_cache.stats())
+            return cached
+
+    result, answered_by = await _acall_groq_model(
         user_prompt=user_prompt,
         system_prompt=system_prompt,
         json_mode=json_mode,
         temperature=temperature,
         max_tokens=max_tokens,
-        models=[QWEN_PRIMARY, QWEN_FALLBACK],
+        models=models,
         tag="Groq/Qwen",
     )
+    if cache_key and _cacheable(result, answered_by, models[0], json_mode):
+        await asyncio.to_thread(llm_cache.put, cache_key, result)
+    return result
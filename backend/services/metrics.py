@@ -0,0 +1,325 @@
+"""
+Prometheus-style metrics, served as text by GET /metrics.
+
+  - Counter / Histogram:  updated inline where the work happens. Each
+                          labelled child has its own small lock, so an
+                          update is a bisect plus a few additions and
+                          threads never contend across label sets
+  - Gauges:               set inline (Gauge) or read at scrape time from
+                          the components' own counters (register_callback),
+                          so saturation gauges cost nothing between scrapes
+  - Exposition:           render() writes text format 0.0.4; it may run
+                          SQL-backed callbacks, so main.py calls it off the
+                          event loop
+
+Instrumented here: HTTP route latency, LLM calls (by model and tag), STT,
+TTS, graph nodes and turn first-audio latency, plus 429 and fallback
+counters. main.py registers the saturation gauges (sessions, thread pool,
+STT / LLM in flight, checkpoints, prepared interviews, caches).
+
+METRICS_ENABLED=0 turns every update into a no-op and /metrics into a 404.
+"""
+
+import os
+import math
+import bisect
+import threading
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Union
+
+logger = logging.getLogger("interviewer.metrics")
+
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+
+# Seconds — spans sub-10ms graph nodes up to LLM calls near their timeouts
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+# A callback returns one value, or {label values: value} for labelled metrics
+CallbackResult = Union[float, Dict[LabelValues, float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# ── Metric types ──────────────────────────────────────────────
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values) -> object:
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class _Value:
+    __slots__ = ("value", "lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        if METRICS_ENABLED:
+            with self.lock:
+                self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def set(self, value: float):
+        if METRICS_ENABLED:
+            self.value = value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, child in list(self._children.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)   # last slot: above every bound
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float):
+        if not METRICS_ENABLED:
+            return
+        i = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[i] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.bounds = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for key, child in list(self._children.items()):
+            with child.lock:
+                counts = list(child.counts)
+                total = child.sum
+            cumulative = 0
+            for bound, count in zip(self.bounds + (math.inf,), counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(round(total, 6))}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _CallbackMetric(_Metric):
+    """A gauge or counter whose value is read from elsewhere at scrape time."""
+
+    def __init__(self, name: str, help: str, kind: str, fn: Callable[[], CallbackResult], labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self.kind = kind
+        self.fn = fn
+
+    def render(self) -> List[str]:
+        try:
+            result = self.fn()
+        except Exception as e:
+            logger.warning("[Metrics] Collecting %s failed: %s: %s", self.name, type(e).__name__, e)
+            return []
+        if result is None:
+            return []
+        values = result if isinstance(result, dict) else {(): result}
+        lines = self._header()
+        for key, value in values.items():
+            if value is not None:
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+# ── Instrumented pools ────────────────────────────────────────
+
+class InstrumentedThreadPoolExecutor(ThreadPoolExecutor):
+    """A ThreadPoolExecutor that counts its own queued and running jobs."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.queued = 0
+        self.busy = 0
+        self._count_lock = threading.Lock()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        def run():
+            with self._count_lock:
+                self.queued -= 1
+                self.busy += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._count_lock:
+                    self.busy -= 1
+
+        def forget_if_cancelled(future: Future):
+            if future.cancelled():
+                with self._count_lock:
+                    self.queued -= 1
+
+        with self._count_lock:
+            self.queued += 1
+        try:
+            future = super().submit(run)
+        except BaseException:
+            with self._count_lock:
+                self.queued -= 1
+            raise
+        future.add_done_callback(forget_if_cancelled)
+        return future
+
+
+# ── Registry ──────────────────────────────────────────────────
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _add(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help, labelnames, buckets))
+
+    def register_callback(
+        self,
+        name: str,
+        help: str,
+        fn: Callable[[], CallbackResult],
+        kind: str = "gauge",
+        labelnames: Sequence[str] = (),
+    ):
+        """Expose a value computed at scrape time (kind "gauge" or "counter")."""
+        self._add(_CallbackMetric(name, help, kind, fn, labelnames))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ── Instruments ───────────────────────────────────────────────
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route", "status"),
+)
+LLM_REQUEST_SECONDS = registry.histogram(
+    "llm_request_duration_seconds", "Latency of successful LLM calls", ("model", "tag"),
+)
+LLM_FIRST_TOKEN_SECONDS = registry.histogram(
+    "llm_first_token_seconds", "Time to first streamed token", ("model", "tag"),
+)
+LLM_RATE_LIMITED = registry.counter(
+    "llm_rate_limited_total", "LLM requests answered with 429 / quota errors", ("model",),
+)
+FALLBACKS = registry.counter(
+    "fallbacks_total",
+    "Canned or degraded responses: llm_exhausted, planner_empty, graph_timeout, tts_failed",
+    ("kind",),
+)
+STT_SECONDS = registry.histogram(
+    "stt_duration_seconds", "Final transcription of a turn (after end of speech)", ("streaming",),
+)
+TTS_FIRST_BYTE_SECONDS = registry.histogram(
+    "tts_first_byte_seconds", "Synthesis start to first audio chunk (cache misses)",
+)
+TTS_SECONDS = registry.histogram(
+    "tts_duration_seconds", "Synthesis of one clip, start to last chunk", ("cached",),
+)
+GRAPH_NODE_SECONDS = registry.histogram(
+    "graph_node_duration_seconds", "LangGraph node run time", ("node",),
+)
+TURN_FIRST_AUDIO_SECONDS = registry.histogram(
+    "turn_first_audio_seconds", "End of candidate speech to first reply audio frame (traced turns)",
+)
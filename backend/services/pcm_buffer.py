@@ -0,0 +1,64 @@
+"""
+Reusable int16 sample buffer for a session's microphone audio.
+
+The old path per utterance was bytearray → bytes() copy → WAV container in
+a BytesIO → Whisper decoding the WAV back into float32. PCMBuffer keeps the
+samples in one preallocated NumPy array instead:
+
+  - append() copies each incoming chunk straight into the array (the chunk
+    itself is only viewed, never converted)
+  - capacity doubles when full, so a long answer costs O(log n) reallocations
+    and the buffer is reused, at its grown size, for every later utterance
+  - view() hands the STT engine a slice of the array — no copy, no WAV
+
+A view stays valid until the next append() (clear() only resets the length),
+and a reallocation leaves earlier views pointing at the old, still-alive array.
+"""
+
+import os
+import numpy as np
+
+SAMPLE_RATE = 16000
+
+# Starting capacity — enough for a typical answer without growing
+PCM_INITIAL_SECONDS = float(os.environ.get("PCM_INITIAL_SECONDS", "30"))
+
+
+class PCMBuffer:
+
+    def __init__(self, initial_seconds: float = PCM_INITIAL_SECONDS):
+        self._data = np.empty(int(initial_seconds * SAMPLE_RATE), dtype=np.int16)
+        self._len = 0
+        self.grows = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def seconds(self) -> float:
+        return self._len / SAMPLE_RATE
+
+    def append(self, chunk: bytes) -> np.ndarray:
+        """Append int16 PCM bytes, return a view of the samples just added."""
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        end = self._len + len(samples)
+        if end > len(self._data):
+            grown = np.empty(max(end, 2 * len(self._data)), dtype=np.int16)
+            grown[:self._len] = self._data[:self._len]
+            self._data = grown
+            self.grows += 1
+        self._data[self._len:end] = samples
+        self._len = end
+        return self._data[end - len(samples):end]
+
+    def view(self, start: int = 0, end: int = None) -> np.ndarray:
+        """Samples [start, end) without copying."""
+        return self._data[start:self._len if end is None else min(end, self._len)]
+
+    def clear(self):
+        """Start a new utterance; the allocated capacity is kept."""
+        self._len = 0
@@ -14,7 +14,8 @@ from backend.services.llm_client import call_gemini
 logger = logging.getLogger("interviewer.question_gen")
 
 
-def generate_question_file(candidate_profile: dict, job_details: dict, interview_topics: list = None) -> dict:
+def generate_question_file(candidate_profile: dict, job_details: dict, interview_topics: list = None,
+                           use_cache: bool = True) -> dict:
     """
     Generate a structured question file.
 
@@ -23,6 +24,8 @@ def generate_question_file(candidate_profile: dict, job_details: dict, interview
         job_details: {title, description, skills_required, questions_to_ask}
         interview_topics: HR-defined list [{"topic": "X", "threshold": 7}, ...]
                           If empty/None, topics are auto-generated.
+        use_cache: Serve identical requests from the LLM response cache.
+                   Pass False to force a fresh set of questions.
 
     Returns:
         {
@@ -119,7 +122,7 @@ Return ONLY a JSON object:
 
     try:
         raw = call_gemini(user_prompt, system_prompt, json_mode=True,
-                       temperature=0.5, max_tokens=1000)
+                       temperature=0.5, max_tokens=1000, use_cache=use_cache)
         qf = json.loads(raw) if raw else {}
         elapsed = round(time.time() - t0, 2)
 
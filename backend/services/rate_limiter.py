@@ -0,0 +1,253 @@
+"""
+Process-wide rate limiter for Groq models.
+
+One limiter per model (GROQ_PRIMARY, QWEN_PRIMARY, ...), each holding two
+token buckets that mirror Groq's quotas:
+  - requests per minute (RPM)
+  - tokens per minute (TPM) — estimated up front, settled with real usage
+
+Buckets are reservation based: every caller reserves capacity in arrival
+order and is told how long to wait, so concurrent sessions are served FIFO
+instead of all retrying at once. A 429 pushes the whole bucket's schedule
+back (penalize), so every queued session backs off together, spread out by
+the refill rate rather than stampeding when the window reopens.
+
+With the limiter disabled (no client-side quotas), a 429 still counts:
+penalize() sets a per-model cooldown that acquire() waits out, so the
+retry loops back off for the jittered delay / Retry-After instead of
+retrying at once.
+
+A caller cancelled while it waits (e.g. the losing side of a hedged
+request) hands its reservation back, since its request is never sent.
+
+Thread-safe: the async hot path and the cold-path worker threads share the
+same buckets.
+"""
+
+import time
+import random
+import asyncio
+import threading
+import logging
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger("interviewer.rate_limiter")
+
+# Used for models that have no explicit entry in the limits table
+DEFAULT_RPM = 30
+DEFAULT_TPM = 6000
+
+# Full-jitter exponential backoff for 429s without a Retry-After header
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 8.0
+
+
+class TokenBucket:
+    """
+    Reservation-based token bucket. `tokens` may go negative: the deficit is
+    the queue of callers that already hold a reservation.
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = float(capacity)
+        self.rate = float(refill_per_sec)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` tokens, return seconds until the reservation is covered."""
+        self._refill(now)
+        self.tokens -= min(amount, self.capacity)
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def give_back(self, amount: float, now: float):
+        self._refill(now)
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def push_back(self, seconds: float, now: float):
+        """Delay everyone (current queue and new arrivals) by `seconds`."""
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class ModelLimiter:
+    """RPM + TPM buckets for a single model."""
+
+    def __init__(self, model: str, rpm: int, tpm: int):
+        self.model = model
+        self.requests = TokenBucket(rpm, rpm / 60.0)
+        self.tokens = TokenBucket(tpm, tpm / 60.0)
+        self.lock = threading.Lock()
+        self.queued = 0
+        self.throttled = 0
+
+    def reserve(self, est_tokens: int) -> float:
+        with self.lock:
+            now = time.monotonic()
+            return max(self.requests.reserve(1, now), self.tokens.reserve(est_tokens, now))
+
+    def cancel(self, est_tokens: int):
+        with self.lock:
+            now = time.monotonic()
+            self.requests.give_back(1, now)
+            self.tokens.give_back(est_tokens, now)
+
+    def settle(self, est_tokens: int, actual_tokens: int):
+        """Correct the TPM bucket once the real token usage is known."""
+        with self.lock:
+            now = time.monotonic()
+            if actual_tokens < est_tokens:
+                self.tokens.give_back(est_tokens - actual_tokens, now)
+            elif actual_tokens > est_tokens:
+                self.tokens.reserve(actual_tokens - est_tokens, now)
+
+    def penalize(self, seconds: float):
+        with self.lock:
+            now = time.monotonic()
+            self.throttled += 1
+            self.requests.push_back(seconds, now)
+
+
+class RateLimiter:
+    """Registry of per-model limiters. Use the module-level `rate_limiter`."""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[int, int]]] = None):
+        self._limits = dict(limits or {})
+        self._models: Dict[str, ModelLimiter] = {}
+        self._lock = threading.Lock()
+        self._cooldown: Dict[str, float] = {}   # model -> monotonic deadline (limiter disabled)
+        self.enabled = True
+
+    def configure(self, limits: Dict[str, Tuple[int, int]]):
+        """Set (rpm, tpm) per model. Existing buckets are rebuilt on next use."""
+        with self._lock:
+            self._limits.update(limits)
+            for model in limits:
+                self._models.pop(model, None)
+
+    def _get(self, model: str) -> ModelLimiter:
+        limiter = self._models.get(model)
+        if limiter is None:
+            with self._lock:
+                limiter = self._models.get(model)
+                if limiter is None:
+                    rpm, tpm = self._limits.get(model, (DEFAULT_RPM, DEFAULT_TPM))
+                    limiter = ModelLimiter(model, rpm, tpm)
+                    self._models[model] = limiter
+                    logger.info("[RateLimit] Bucket created | model=%s | rpm=%s | tpm=%s", model, rpm, tpm)
+        return limiter
+
+    def _reserve(self, model: str, est_tokens: int, max_wait: Optional[float]) -> Optional[float]:
+        limiter = self._get(model)
+        delay = limiter.reserve(est_tokens)
+        if max_wait is not None and delay > max_wait:
+            limiter.cancel(est_tokens)
+            logger.warning("[RateLimit] model=%s queue wait %.1fs exceeds %ss, skipping", model, delay, max_wait)
+            return None
+        if delay > 0:
+            logger.info("[RateLimit] model=%s queued for %.2fs (est_tokens=%s)", model, delay, est_tokens)
+        return delay
+
+    def _cooldown_delay(self, model: str, max_wait: Optional[float]) -> Optional[float]:
+        """Seconds left of `model`'s 429 cooldown, or None if longer than `max_wait`."""
+        delay = self._cooldown.get(model, 0.0) - time.monotonic()
+        if delay <= 0:
+            return 0.0
+        if max_wait is not None and delay > max_wait:
+            logger.warning("[RateLimit] model=%s cooling down for %.1fs, skipping", model, delay)
+            return None
+        logger.info("[RateLimit] model=%s cooling down for %.2fs", model, delay)
+        return delay
+
+    async def acquire(self, model: str, est_tokens: int, max_wait: Optional[float] = None) -> bool:
+        """
+        Wait (without blocking the event loop) until `model` has capacity.
+        Returns False if the queue is longer than `max_wait` — the caller
+        should cascade to another model instead of waiting.
+        """
+        if not self.enabled:
+            delay = self._cooldown_delay(model, max_wait)
+            if delay:
+                await asyncio.sleep(delay)
+            return delay is not None
+        delay = self._reserve(model, est_tokens, max_wait)
+        if delay is None:
+            return False
+        if delay > 0:
+            limiter = self._get(model)
+            limiter.queued += 1
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                limiter.cancel(est_tokens)
+                raise
+            finally:
+                limiter.queued -= 1
+        return True
+
+    def acquire_blocking(self, model: str, est_tokens: int, max_wait: Optional[float] = None) -> bool:
+        """Thread version of acquire() for the sync cold-path client."""
+        if not self.enabled:
+            delay = self._cooldown_delay(model, max_wait)
+            if delay:
+                time.sleep(delay)
+            return delay is not None
+        delay = self._reserve(model, est_tokens, max_wait)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    def settle(self, model: str, est_tokens: int, actual_tokens: Optional[int]):
+        if self.enabled and actual_tokens:
+            self._get(model).settle(est_tokens, actual_tokens)
+
+    def penalize(self, model: str, seconds: float):
+        """Called on a 429: push the model's schedule back for every session."""
+        if self.enabled:
+            self._get(model).penalize(seconds)
+            return
+        with self._lock:
+            deadline = time.monotonic() + seconds
+            self._cooldown[model] = max(self._cooldown.get(model, 0.0), deadline)
+
+    def stats(self) -> Dict[str, dict]:
+        """Snapshot of every bucket (for logs / debug endpoints)."""
+        out = {}
+        for model, limiter in list(self._models.items()):
+            with limiter.lock:
+                now = time.monotonic()
+                limiter.requests._refill(now)
+                limiter.tokens._refill(now)
+                out[model] = {
+                    "requests_available": round(limiter.requests.tokens, 2),
+                    "tokens_available": round(limiter.tokens.tokens, 1),
+                    "queued": limiter.queued,
+                    "throttled": limiter.throttled,
+                }
+        return out
+
+
+def backoff_delay(attempt: int, error: Optional[Exception] = None) -> float:
+    """
+    Delay before retrying after a 429. Honors Retry-After when the API sent
+    one, otherwise full-jitter exponential backoff so sessions don't sync up.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        retry_after = headers.get("retry-after")
+        try:
+            if retry_after is not None:
+                return min(BACKOFF_CAP, float(retry_after)) + random.uniform(0, BACKOFF_BASE)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** (attempt + 1)))
+
+
+rate_limiter = RateLimiter()
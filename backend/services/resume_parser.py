@@ -34,10 +34,11 @@ def extract_text_from_pdf(file_bytes: bytes) -> str:
     return full_text
 
 
-def extract_candidate_profile(resume_text: str) -> dict:
+def extract_candidate_profile(resume_text: str, use_cache: bool = True) -> dict:
     """
     Use LLM to extract a structured candidate profile from resume text.
     Returns: {name, skills[], experience_years, past_roles[], education}
+    Re-uploading the same resume is a cache hit unless use_cache=False.
     """
     logger.info("[ResumeParser] Extracting candidate profile via LLM...")
     t0 = time.time()
@@ -62,7 +63,7 @@ If a field cannot be determined, use reasonable defaults (e.g., experience_years
 
     try:
         raw = call_gemini(user_prompt, system_prompt, json_mode=True,
-                       temperature=0.3, max_tokens=500)
+                       temperature=0.3, max_tokens=500, use_cache=use_cache)
         profile = json.loads(raw) if raw else {}
         elapsed = round(time.time() - t0, 2)
         logger.info(f"[ResumeParser] Profile extracted in {elapsed}s | name={profile.get('name')} | skills={len(profile.get('skills', []))}")
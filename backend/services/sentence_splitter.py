@@ -0,0 +1,61 @@
+"""
+Incremental sentence splitter for streamed LLM output.
+
+Tokens arrive a few characters at a time; TTS wants whole sentences.
+feed() buffers text and returns every sentence that is now complete,
+flush() returns whatever is left once the stream ends.
+
+A sentence ends at . ! or ? followed by whitespace — the trailing space is
+required so decimals ("3.5") and half-streamed tokens are never cut early.
+Very short pieces ("Great.") are merged into the next sentence so TTS isn't
+called for a fragment.
+"""
+
+import re
+from typing import List, Optional
+
+_BOUNDARY = re.compile(r'[.!?]+["\')\]]*\s+')
+
+# Tokens that end with a period but don't end a sentence
+_ABBREVIATIONS = {"e.g.", "i.e.", "etc.", "vs.", "mr.", "mrs.", "ms.", "dr.", "prof.", "sr.", "jr."}
+
+# Shorter sentences are merged with the next one
+MIN_SENTENCE_CHARS = 20
+
+
+class SentenceSplitter:
+
+    def __init__(self, min_chars: int = MIN_SENTENCE_CHARS):
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text, return the sentences it completed (possibly none)."""
+        self._buffer += text
+        sentences = []
+        start = 0
+        for match in _BOUNDARY.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()].strip()
+            last_word = candidate.rsplit(None, 1)[-1].lower() if candidate else ""
+            if last_word in _ABBREVIATIONS or len(candidate) < self.min_chars:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        """Return the remaining text (the last sentence) and reset."""
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return rest or None
+
+
+def split_sentences(text: str, min_chars: int = MIN_SENTENCE_CHARS) -> List[str]:
+    """Split a complete text with the same rules as the streaming splitter."""
+    splitter = SentenceSplitter(min_chars)
+    sentences = splitter.feed(text)
+    tail = splitter.flush()
+    if tail:
+        sentences.append(tail)
+    return sentences
@@ -0,0 +1,141 @@
+"""
+Incremental speech-to-text for one utterance at a time.
+
+Without it the whole utterance is transcribed only after the silence
+window closes, so a long answer adds seconds of Whisper time after the
+candidate stops talking. IncrementalTranscriber instead decodes the
+audio that has arrived so far while the candidate is still speaking:
+
+  - Every STT_WINDOW_SECONDS of new audio, the uncommitted part of the
+    buffer is decoded in the background (one decode in flight at a time)
+  - Every segment except the last is committed — its text is final and the
+    commit offset moves to the start of the last segment, which may still
+    be cut mid-word and is decoded again next time
+  - Committed text + the tentative last segment go out as a partial
+    transcript through the on_partial callback
+  - finish() only has to decode the audio after the commit offset
+  - feed(force=True) decodes early, so the endpointer gets a transcript
+    that reaches the start of a pause (see transcript_through)
+
+Audio is 16 kHz mono int16 samples in the session's PCMBuffer; windows are
+views into it, so nothing is copied until the STT engine needs float32.
+"""
+
+import os
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.services.pcm_buffer import PCMBuffer
+
+logger = logging.getLogger("interviewer.stt")
+
+SAMPLE_RATE = 16000
+
+STT_STREAMING = os.environ.get("STT_STREAMING", "1") != "0"
+# Decode again once this much uncommitted audio has accumulated
+STT_WINDOW_SECONDS = float(os.environ.get("STT_WINDOW_SECONDS", "4.0"))
+# If a window is still a single segment after this long, commit it whole
+STT_MAX_UNCOMMITTED_SECONDS = float(os.environ.get("STT_MAX_UNCOMMITTED_SECONDS", "15.0"))
+
+# (start_seconds, end_seconds, text) relative to the decoded window
+Segment = Tuple[float, float, str]
+
+
+class IncrementalTranscriber:
+
+    def __init__(
+        self,
+        decode: Callable[[np.ndarray], Awaitable[List[Segment]]],
+        on_partial: Optional[Callable[[str], Awaitable[None]]] = None,
+        window_seconds: float = STT_WINDOW_SECONDS,
+        max_uncommitted_seconds: float = STT_MAX_UNCOMMITTED_SECONDS,
+    ):
+        self.decode = decode
+        self.on_partial = on_partial
+        self.window_samples = int(window_seconds * SAMPLE_RATE)
+        self.max_uncommitted_samples = int(max_uncommitted_seconds * SAMPLE_RATE)
+        self.reset()
+
+    def reset(self):
+        """Forget the current utterance (committed text and offsets)."""
+        self._committed: List[str] = []
+        self._commit_offset = 0       # sample offset into the utterance buffer
+        self._decoded_until = 0       # end of the last window handed to decode
+        self._task: Optional[asyncio.Task] = None
+        self.windows = 0
+        self.partial = ""             # latest partial transcript
+        self.partial_until = 0        # buffer length that partial was decoded from
+
+    def feed(self, audio_buffer: PCMBuffer, force: bool = False):
+        """
+        Called after each chunk is appended to the utterance buffer. Starts a
+        background decode when enough new audio is waiting (or any, with
+        force) and none is running.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        waiting = len(audio_buffer) - self._decoded_until
+        if waiting <= 0 or (waiting < self.window_samples and not force):
+            return
+        # A view — appends land after its end, so it stays intact while it decodes
+        window = audio_buffer.view(self._commit_offset)
+        self._decoded_until = len(audio_buffer)
+        self._task = asyncio.create_task(self._decode_window(window, self._commit_offset))
+
+    async def _decode_window(self, window: np.ndarray, offset: int):
+        try:
+            segments = await self.decode(window)
+        except Exception as e:
+            logger.error("[STT] Window decode failed: %s", e)
+            return
+        self.windows += 1
+        self.partial_until = offset + len(window)
+        if not segments:
+            return
+
+        if len(segments) > 1:
+            final, tentative = segments[:-1], segments[-1]
+            self._committed.extend(text for _, _, text in final)
+            self._commit_offset = offset + int(tentative[0] * SAMPLE_RATE)
+        elif len(window) >= self.max_uncommitted_samples:
+            # One very long segment — commit it rather than re-decoding it forever
+            final, tentative = segments, None
+            self._committed.extend(text for _, _, text in final)
+            self._commit_offset = offset + len(window)
+        else:
+            tentative = segments[0]
+
+        partial = " ".join(self._committed + ([tentative[2]] if tentative else [])).strip()
+        self.partial = partial
+        logger.debug("[STT] Window %s | committed_s=%.1f | '%s'", self.windows, self._commit_offset / SAMPLE_RATE, partial[-60:])
+        if partial and self.on_partial:
+            try:
+                await self.on_partial(partial)
+            except Exception as e:
+                logger.warning("[STT] Could not send partial transcript: %s", e)
+
+    def transcript_through(self, sample: int) -> Optional[str]:
+        """The partial transcript if it was decoded from audio reaching `sample`, else None."""
+        return self.partial if self.partial_until >= sample else None
+
+    async def finish(self, audio: np.ndarray) -> str:
+        """Transcript of the full utterance (int16 samples): committed text + a decode of the tail."""
+        if self._task is not None:
+            await self._task
+        tail = audio[self._commit_offset:]
+        segments = await self.decode(tail) if len(tail) else []
+        text = " ".join(self._committed + [t for _, _, t in segments]).strip()
+        logger.info(
+            "[STT] Utterance done | windows=%s | tail_s=%.1f of %.1f",
+            self.windows, len(tail) / SAMPLE_RATE, len(audio) / SAMPLE_RATE,
+        )
+        self.reset()
+        return text
+
+    def cancel(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self.reset()
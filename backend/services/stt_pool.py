@@ -0,0 +1,363 @@
+"""
+Whisper worker process pool with cross-session micro-batching.
+
+One in-process WhisperModel behind asyncio.to_thread means every
+concurrent interview decodes on the same model, competing with the event
+loop for the GIL. With STT_WORKERS > 0, decoding moves to worker processes
+instead, each holding its own model:
+
+  - Transport:   the parent writes float32 samples into a SharedMemory block
+                 and sends only (request_id, block name, length) over the
+                 task queue — no audio is pickled
+  - Batching:    requests that arrive within STT_BATCH_WINDOW_MS (up to
+                 STT_MAX_BATCH) are sent as one job; the worker VADs each one,
+                 merges its speech into chunks of up to 30 s and decodes every
+                 chunk of every request in a single BatchedInferencePipeline
+                 pass
+  - Scheduling:  all workers pull from one task queue, so a free worker
+                 takes the next job; dead workers are respawned on dispatch
+  - Results:     a reader thread resolves the waiting futures on their loop
+
+STT_WORKERS=0 keeps the single in-process model (decoded in a thread).
+
+transcribe() takes int16 (or float32) 16 kHz samples — typically a view
+into the session's PCMBuffer — and returns [(start_s, end_s, text)] like
+IncrementalTranscriber expects. int16 is scaled to float32 in one pass
+straight into the destination (the shared-memory block, or a reusable
+per-thread scratch array in-process); no WAV container is involved.
+"""
+
+import os
+import time
+import asyncio
+import bisect
+import itertools
+import threading
+import logging
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("interviewer.stt")
+
+SAMPLE_RATE = 16000
+
+STT_MODEL = os.environ.get("STT_MODEL", "tiny.en")
+STT_WORKERS = min(int(os.environ.get("STT_WORKERS", "2")), os.cpu_count() or 1)
+STT_BATCH_WINDOW_MS = float(os.environ.get("STT_BATCH_WINDOW_MS", "5"))
+STT_MAX_BATCH = int(os.environ.get("STT_MAX_BATCH", "8"))
+STT_TIMEOUT = float(os.environ.get("STT_TIMEOUT", "30"))
+
+# (start_seconds, end_seconds, text) relative to the request's audio
+Segment = Tuple[float, float, str]
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+def write_float32(samples: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Store samples into `out` as float32 in [-1, 1] without a temporary."""
+    if samples.dtype == np.int16:
+        np.multiply(samples, _INT16_SCALE, out=out)
+    else:
+        out[:] = samples
+    return out
+
+
+# ── Decoding (shared by workers and the in-process model) ─────────────────────
+
+def load_whisper_model(model_name: str = STT_MODEL, cpu_threads: int = 0):
+    from faster_whisper import WhisperModel
+    model = WhisperModel(model_name, device="cpu", compute_type="int8", cpu_threads=cpu_threads)
+    logger.info("[STT] Whisper model loaded: %s (cpu, int8, threads=%s)", model_name, cpu_threads or 'auto')
+    return model
+
+
+def transcribe_batch(pipeline, audios: List[np.ndarray], batch_size: int = STT_MAX_BATCH) -> List[List[Segment]]:
+    """
+    Decode several independent utterances in one batched pass. Each request's
+    speech regions (Silero VAD) are merged with the silence between them cut
+    out, into chunks of up to 30 s — as WhisperModel.transcribe(vad_filter=True)
+    does via collect_chunks — so a pausing answer is decoded as one passage,
+    with context, rather than fragment by fragment. The chunks of every
+    request become clips of one signal; each resulting segment is mapped back
+    to its request and to that request's original timeline.
+    """
+    from faster_whisper.vad import VadOptions, SpeechTimestampsMap, collect_chunks, get_speech_timestamps
+
+    vad_options = VadOptions(min_silence_duration_ms=400, max_speech_duration_s=30)
+    pieces, clips, clip_starts, clip_owners, position = [], [], [], [], 0
+    timestamp_maps: List[Optional[SpeechTimestampsMap]] = []
+    for idx, audio in enumerate(audios):
+        speech = get_speech_timestamps(audio, vad_options)
+        if not speech:
+            timestamp_maps.append(None)
+            continue
+        timestamp_maps.append(SpeechTimestampsMap(speech, SAMPLE_RATE))
+        chunks, _ = collect_chunks(audio, speech, SAMPLE_RATE, max_duration=30)
+        stripped = 0  # position in this request's speech-only timeline
+        for chunk in chunks:
+            clips.append({"start": position / SAMPLE_RATE, "end": (position + len(chunk)) / SAMPLE_RATE})
+            clip_starts.append(position)
+            clip_owners.append((idx, (stripped - position) / SAMPLE_RATE))
+            pieces.append(chunk)
+            position += len(chunk)
+            stripped += len(chunk)
+
+    results: List[List[Segment]] = [[] for _ in audios]
+    if not clips:
+        return results
+
+    segments, _ = pipeline.transcribe(
+        np.concatenate(pieces), clip_timestamps=clips, batch_size=batch_size, beam_size=1
+    )
+    for seg in segments:
+        midpoint = (seg.start + seg.end) / 2 * SAMPLE_RATE
+        idx, shift = clip_owners[bisect.bisect_right(clip_starts, midpoint) - 1]
+        timestamps = timestamp_maps[idx]
+        start = timestamps.get_original_time(seg.start + shift)
+        end = timestamps.get_original_time(seg.end + shift, is_end=True)
+        results[idx].append((start, end, seg.text.strip()))
+    return results
+
+
+# ── Worker process ────────────────────────────────────────────────────────────
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # The parent owns (and unlinks) every block. Spawned workers share the
+    # parent's resource tracker, where re-registering the name is a no-op.
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        return shared_memory.SharedMemory(name=name)
+
+
+def _worker_main(worker_id: int, model_name: str, cpu_threads: int, batch_size: int, tasks, results):
+    from faster_whisper import BatchedInferencePipeline
+
+    pipeline = BatchedInferencePipeline(load_whisper_model(model_name, cpu_threads))
+    while True:
+        job = tasks.get()
+        if job is None:
+            break
+        blocks, audios, live = [], [], []
+        for req_id, name, n in job:
+            try:
+                shm = _attach(name)
+            except FileNotFoundError:
+                continue  # the request was cancelled before the job was picked up
+            blocks.append(shm)
+            audios.append(np.ndarray((n,), dtype=np.float32, buffer=shm.buf))
+            live.append(req_id)
+        try:
+            t0 = time.time()
+            outputs = transcribe_batch(pipeline, audios, batch_size) if audios else []
+            for req_id, segments in zip(live, outputs):
+                results.put((req_id, segments, None))
+            logger.debug("[STT/Worker %s] Batch of %s in %.2fs", worker_id, len(live), time.time() - t0)
+        except Exception as e:
+            for req_id in live:
+                results.put((req_id, [], f"{type(e).__name__}: {e}"))
+        finally:
+            del audios  # views must go before the blocks can close
+            for shm in blocks:
+                shm.close()
+
+
+# ── Parent-side pool ──────────────────────────────────────────────────────────
+
+class STTWorkerPool:
+
+    def __init__(
+        self,
+        workers: int = STT_WORKERS,
+        model_name: str = STT_MODEL,
+        batch_window_ms: float = STT_BATCH_WINDOW_MS,
+        max_batch: int = STT_MAX_BATCH,
+        timeout: float = STT_TIMEOUT,
+    ):
+        self.workers = workers
+        self.model_name = model_name
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch = max_batch
+        self.timeout = timeout
+        self.batches = 0
+        self.requests = 0
+
+        self._ctx = mp.get_context("spawn")   # CTranslate2 is not fork-safe
+        self._procs: List[mp.Process] = []
+        self._tasks = None
+        self._results = None
+        self._reader: Optional[threading.Thread] = None
+        self._ids = itertools.count()
+        self._futures: Dict[int, Tuple[asyncio.Future, asyncio.AbstractEventLoop]] = {}
+        self._batch: List[tuple] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._worker_target = _worker_main
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._futures)
+
+    def start(self):
+        if self._tasks is not None or not self.enabled:
+            return
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._procs = [self._spawn(i) for i in range(self.workers)]
+        self._reader = threading.Thread(target=self._read_results, name="stt-results", daemon=True)
+        self._reader.start()
+        logger.info(
+            "[STT] Worker pool started | workers=%s | model=%s | "
+            "batch_window=%.0fms | max_batch=%s",
+            self.workers, self.model_name, self.batch_window * 1000, self.max_batch
+        )
+
+    def _spawn(self, worker_id: int) -> mp.Process:
+        cpu_threads = max(1, (os.cpu_count() or 1) // self.workers)
+        proc = self._ctx.Process(
+            target=self._worker_target,
+            args=(worker_id, self.model_name, cpu_threads, self.max_batch, self._tasks, self._results),
+            name=f"stt-worker-{worker_id}",
+            daemon=True,
+        )
+        proc.start()
+        return proc
+
+    async def transcribe(self, samples: np.ndarray) -> List[Segment]:
+        if not len(samples):
+            return []
+        self.start()
+        loop = asyncio.get_running_loop()
+        shm = shared_memory.SharedMemory(create=True, size=len(samples) * 4)
+        write_float32(samples, np.ndarray((len(samples),), dtype=np.float32, buffer=shm.buf))
+        req_id = next(self._ids)
+        future = loop.create_future()
+        self._futures[req_id] = (future, loop)
+        self.requests += 1
+
+        self._batch.append((req_id, shm.name, len(samples)))
+        if len(self._batch) >= self.max_batch:
+            self._dispatch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._dispatch)
+
+        try:
+            return await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            logger.error("[STT] Request %s timed out after %ss", req_id, self.timeout)
+            return []
+        finally:
+            self._futures.pop(req_id, None)
+            shm.close()
+            shm.unlink()
+
+    def _dispatch(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        for i, proc in enumerate(self._procs):
+            if not proc.is_alive():
+                logger.error("[STT] Worker %s died (exitcode=%s), respawning", i, proc.exitcode)
+                self._procs[i] = self._spawn(i)
+        self._tasks.put(batch)
+        self.batches += 1
+
+    def _read_results(self):
+        while True:
+            message = self._results.get()
+            if message is None:
+                break
+            req_id, segments, error = message
+            entry = self._futures.get(req_id)
+            if entry is None:
+                continue  # already timed out
+            future, loop = entry
+            if error:
+                logger.error("[STT] Worker decode failed: %s", error)
+            loop.call_soon_threadsafe(_resolve, future, segments)
+
+    def close(self):
+        if self._tasks is None:
+            return
+        for _ in self._procs:
+            self._tasks.put(None)
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        self._results.put(None)
+        self._tasks = None
+        logger.info("[STT] Worker pool stopped | requests=%s | batches=%s", self.requests, self.batches)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "alive": sum(p.is_alive() for p in self._procs),
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "in_flight": self.in_flight,
+        }
+
+
+def _resolve(future: asyncio.Future, segments: List[Segment]):
+    if not future.done():
+        future.set_result(segments)
+
+
+stt_pool = STTWorkerPool()
+
+
+# ── In-process fallback (STT_WORKERS=0) ───────────────────────────────────────
+
+_local_model = None
+_local_lock = threading.Lock()
+# float32 scratch per decoding thread, grown geometrically and reused
+_scratch = threading.local()
+
+
+def get_local_model():
+    """The in-process WhisperModel, loaded on first use."""
+    global _local_model
+    with _local_lock:
+        if _local_model is None:
+            _local_model = load_whisper_model()
+    return _local_model
+
+
+def _float32_scratch(n: int) -> np.ndarray:
+    buf = getattr(_scratch, "buf", None)
+    if buf is None or len(buf) < n:
+        buf = np.empty(max(n, 2 * len(buf) if buf is not None else n), dtype=np.float32)
+        _scratch.buf = buf
+    return buf[:n]
+
+
+def _transcribe_local(samples: np.ndarray) -> List[Segment]:
+    segments, _ = get_local_model().transcribe(
+        write_float32(samples, _float32_scratch(len(samples))),
+        beam_size=1,
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 400}
+    )
+    return [(seg.start, seg.end, seg.text.strip()) for seg in segments]
+
+
+async def transcribe(samples: np.ndarray) -> List[Segment]:
+    """Decode 16 kHz int16/float32 samples on the worker pool, or in a thread without one."""
+    try:
+        if stt_pool.enabled:
+            return await stt_pool.transcribe(samples)
+        return await asyncio.to_thread(_transcribe_local, samples)
+    except Exception as e:
+        logger.error("[STT] Transcription error: %s", e)
+        return []
@@ -0,0 +1,331 @@
+"""
+Per-turn latency tracing for the voice pipeline.
+
+Each candidate turn gets a TurnTrace: a tree of timed spans rooted at the
+end of the candidate's speech and closed when the client reports the reply
+finished playing ('audio_done'), the turn is interrupted, or the session
+ends. A typical answer turn looks like
+
+    turn
+    ├── endpoint        trailing silence until the end of turn was decided
+    ├── stt             final transcription
+    ├── graph           LangGraph astream
+    │   ├── grader ─ llm
+    │   ├── router
+    │   ├── question_gen ─ llm
+    │   └── planner ─ llm (first_token)
+    └── speak           sender stage
+        └── tts × N     one per clip (first_byte event; end = complete)
+
+plus turn-level marks: first_audio (first frame sent), audio_end and
+audio_done.
+
+  - Spans:     span() opens a child of the current span. The current span
+               lives in a ContextVar, so it follows the turn into tasks it
+               starts and into LangGraph nodes (wrapped with traced())
+  - Buffer:    finished traces go to a ring buffer of TRACE_BUFFER_SIZE,
+               served by /debug/traces/{thread_id}
+  - Export:    with TRACE_EXPORT_PATH set, every finished trace is also
+               appended to that file as one JSON line (by a writer thread)
+  - Off:       TRACING_ENABLED=0 keeps spans detached and records nothing
+
+Span attributes carry sizes, models and flags — never transcript text.
+"""
+
+import os
+import json
+import time
+import uuid
+import queue
+import inspect
+import functools
+import threading
+import logging
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Deque, Iterator, List, Optional
+
+from backend.services.metrics import GRAPH_NODE_SECONDS, TURN_FIRST_AUDIO_SECONDS
+
+logger = logging.getLogger("interviewer.tracing")
+
+TRACING_ENABLED = os.environ.get("TRACING_ENABLED", "1") != "0"
+TRACE_BUFFER_SIZE = int(os.environ.get("TRACE_BUFFER_SIZE", "500"))
+TRACE_EXPORT_PATH = os.environ.get("TRACE_EXPORT_PATH", "")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+_current_trace: ContextVar[Optional["TurnTrace"]] = ContextVar("current_trace", default=None)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+class Span:
+    __slots__ = ("name", "attrs", "start", "end", "events", "children")
+
+    def __init__(self, name: str, start: Optional[float] = None, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter() if start is None else start
+        self.end: Optional[float] = None
+        self.events: list = []
+        self.children: List["Span"] = []
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def event(self, name: str, **attrs):
+        self.events.append((name, time.perf_counter(), attrs))
+
+    def finish(self, end: Optional[float] = None):
+        if self.end is None:
+            self.end = time.perf_counter() if end is None else end
+
+    def to_dict(self, origin: float) -> dict:
+        end = self.end if self.end is not None else time.perf_counter()
+        data = {
+            "name": self.name,
+            "start_ms": _ms(self.start - origin),
+            "duration_ms": _ms(end - self.start),
+        }
+        if self.end is None:
+            data["unfinished"] = True
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.events:
+            data["events"] = [{"name": n, "at_ms": _ms(t - origin), **a} for n, t, a in self.events]
+        if self.children:
+            data["children"] = [c.to_dict(origin) for c in sorted(self.children, key=lambda c: c.start)]
+        return data
+
+
+class TurnTrace:
+    """The span tree of one turn, from end of speech to 'audio_done'."""
+
+    def __init__(self, tracer: "Tracer", thread_id: str, turn: int, start: Optional[float] = None, **attrs):
+        self.tracer = tracer
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.thread_id = thread_id
+        self.turn = turn
+        self.started_at = time.time() - (time.perf_counter() - start if start is not None else 0.0)
+        self.root = Span("turn", start, **attrs)
+        self.marks: dict = {}
+        self.status: Optional[str] = None
+        self.finished = False
+
+    @contextmanager
+    def activate(self) -> Iterator["TurnTrace"]:
+        """Make this trace's root the current span for the calling task."""
+        if not self.tracer.enabled:
+            yield self
+            return
+        trace_token = _current_trace.set(self)
+        span_token = _current_span.set(self.root)
+        try:
+            yield self
+        finally:
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+
+    def add_span(self, name: str, start: float, end: Optional[float] = None, **attrs) -> Span:
+        """Attach an already-timed span directly under the root."""
+        s = Span(name, start, **attrs)
+        s.finish(end)
+        self.root.children.append(s)
+        return s
+
+    def mark(self, name: str):
+        """Record when `name` first happened in this turn."""
+        self.marks.setdefault(name, time.perf_counter())
+
+    def finish(self, status: str = "ok"):
+        if self.finished:
+            return
+        self.finished = True
+        self.status = self.status or status
+        self.root.finish()
+        if "first_audio" in self.marks:
+            TURN_FIRST_AUDIO_SECONDS.observe(self.marks["first_audio"] - self.root.start)
+        self.tracer.record(self)
+
+    def breakdown(self) -> str:
+        origin = self.root.start
+        parts = [f"{c.name}={_ms((c.end or origin) - c.start):.0f}ms" for c in self.root.children]
+        parts += [f"{name}@{_ms(t - origin):.0f}ms" for name, t in self.marks.items()]
+        return " ".join(parts)
+
+    def to_dict(self) -> dict:
+        origin = self.root.start
+        return {
+            "trace_id": self.trace_id,
+            "thread_id": self.thread_id,
+            "turn": self.turn,
+            "started_at": round(self.started_at, 3),
+            "status": self.status,
+            "duration_ms": _ms((self.root.end or time.perf_counter()) - origin),
+            "marks_ms": {name: _ms(t - origin) for name, t in self.marks.items()},
+            "spans": self.root.to_dict(origin),
+        }
+
+
+# ── Span helpers (no-ops outside an active trace) ─────────────
+
+@contextmanager
+def span(name: str, current: bool = True, **attrs) -> Iterator[Span]:
+    """
+    Time the enclosed block as a child of the current span. Spans opened
+    inside it nest under it, unless current=False — needed around a yield
+    in an async generator, whose consumer's context must not change.
+    """
+    s = Span(name, **attrs)
+    parent = _current_span.get()
+    if parent is None:
+        yield s
+        return
+    parent.children.append(s)
+    token = _current_span.set(s) if current else None
+    try:
+        yield s
+    except BaseException as e:
+        s.attrs["error"] = type(e).__name__
+        raise
+    finally:
+        s.finish()
+        if token is not None:
+            _current_span.reset(token)
+
+
+def mark(name: str):
+    """Record a turn-level milestone (first_audio, audio_end...) on the current trace."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.mark(name)
+
+
+def traced(name: str):
+    """
+    Decorator: run a (sync or async) graph node inside span(name), and
+    record its run time in the graph_node_duration_seconds histogram.
+    """
+    histogram = GRAPH_NODE_SECONDS.labels(name)
+
+    def decorate(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(name) as s:
+                    try:
+                        return await fn(*args, **kwargs)
+                    finally:
+                        histogram.observe(time.perf_counter() - s.start)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name) as s:
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - s.start)
+        return wrapper
+    return decorate
+
+
+# ── Tracer: ring buffer + JSONL export ────────────────────────
+
+class Tracer:
+
+    def __init__(
+        self,
+        enabled: bool = TRACING_ENABLED,
+        buffer_size: int = TRACE_BUFFER_SIZE,
+        export_path: str = TRACE_EXPORT_PATH,
+    ):
+        self.enabled = enabled
+        self.export_path = export_path
+        self.recorded = 0
+        self.exported = 0
+        self.export_errors = 0
+        self._buffer: Deque[dict] = deque(maxlen=max(1, buffer_size))
+        self._lock = threading.Lock()
+        self._export_queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+
+    def start_turn(self, thread_id: str, turn: int, start: Optional[float] = None, **attrs) -> TurnTrace:
+        return TurnTrace(self, thread_id, turn, start, **attrs)
+
+    def record(self, trace: TurnTrace):
+        if not self.enabled:
+            return
+        data = trace.to_dict()
+        with self._lock:
+            self._buffer.append(data)
+            self.recorded += 1
+        logger.info(
+            "[Trace] %s turn %s %s in %.0fms | %s",
+            trace.thread_id, trace.turn, trace.status, data["duration_ms"], trace.breakdown(),
+        )
+        if self.export_path:
+            self._export(data)
+
+    def traces(self, thread_id: str, limit: Optional[int] = None) -> List[dict]:
+        """Buffered traces for one thread, oldest first."""
+        with self._lock:
+            found = [t for t in self._buffer if t["thread_id"] == thread_id]
+        return found[-limit:] if limit else found
+
+    # ── Export ────────────────────────────────────────────────
+
+    def _export(self, data: dict):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, name="trace-exporter", daemon=True)
+            self._writer.start()
+        self._export_queue.put(json.dumps(data, separators=(",", ":")))
+
+    def _write_loop(self):
+        directory = os.path.dirname(self.export_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        while True:
+            line = self._export_queue.get()
+            if line is None:
+                return
+            lines = [line]
+            # Write whatever else is already queued in the same call
+            while True:
+                try:
+                    more = self._export_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    self._export_queue.put(None)
+                    break
+                lines.append(more)
+            try:
+                with open(self.export_path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+                self.exported += len(lines)
+            except OSError as e:
+                self.export_errors += len(lines)
+                logger.warning("[Trace] Export to %s failed: %s", self.export_path, e)
+
+    def close(self):
+        """Flush pending exports. Called on app shutdown."""
+        if self._writer is not None:
+            self._export_queue.put(None)
+            self._writer.join(timeout=5)
+            self._writer = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "buffered": len(self._buffer),
+            "recorded": self.recorded,
+            "exported": self.exported,
+            "export_errors": self.export_errors,
+        }
+
+
+tracer = Tracer()
@@ -0,0 +1,265 @@
+"""
+Cache of synthesized TTS audio for fixed and predictable utterances.
+
+Template lines (acknowledgements, topic transitions, primary questions,
+farewells) and the fixed fallback/recovery messages are known before the
+interview starts, yet each one used to go through a live edge-tts round
+trip. This cache stores their MP3 audio keyed by sha256(provider + voice +
+text), so the silent clips of TTS_PROVIDER=fake never play in production.
+
+  - Memory:    LRU of up to TTS_CACHE_MEMORY_BYTES — a hit is a dict lookup
+  - Disk:      tts_cache table in cache/tts_cache.sqlite3, shared across
+               restarts; entries older than TTS_CACHE_TTL are dropped, then
+               least-recently-used ones beyond TTS_CACHE_MAX_BYTES
+  - Pre-warm:  prewarm() synthesizes a list of texts in the background
+               (TTS_PREWARM_CONCURRENCY at a time), skipping cached ones
+  - Counters:  hits (memory / disk) / misses / writes / evictions via stats()
+
+Only complete clips are stored — a stream that broke off is never replayed.
+
+communicate() is where every synthesis starts: edge-tts, or with
+TTS_PROVIDER=fake the offline stand-in in backend/tools/fake_providers.py.
+"""
+
+import os
+import time
+import sqlite3
+import asyncio
+import hashlib
+import threading
+import logging
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import edge_tts
+
+from backend.services.llm_cache import CACHE_DIR
+
+logger = logging.getLogger("interviewer.tts_cache")
+
+TTS_VOICE = os.environ.get("TTS_VOICE", "en-US-ChristopherNeural")
+
+# "edge": Microsoft's online voices. "fake": deterministic silent MP3 at a
+# configurable speed, for benchmarks (see backend/tools/fake_providers.py)
+TTS_PROVIDERS = ("edge", "fake")
+TTS_PROVIDER = os.environ.get("TTS_PROVIDER", "edge").lower()
+if TTS_PROVIDER not in TTS_PROVIDERS:
+    raise ValueError(f"TTS_PROVIDER must be one of {TTS_PROVIDERS}, got {TTS_PROVIDER!r}")
+
+TTS_CACHE_ENABLED = os.environ.get("TTS_CACHE_ENABLED", "1") != "0"
+TTS_CACHE_PATH = os.environ.get("TTS_CACHE_PATH", os.path.join(CACHE_DIR, "tts_cache.sqlite3"))
+TTS_CACHE_TTL = float(os.environ.get("TTS_CACHE_TTL", str(30 * 24 * 3600)))
+TTS_CACHE_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+TTS_CACHE_MEMORY_BYTES = int(os.environ.get("TTS_CACHE_MEMORY_BYTES", str(16 * 1024 * 1024)))
+TTS_PREWARM_CONCURRENCY = int(os.environ.get("TTS_PREWARM_CONCURRENCY", "4"))
+
+# Run disk eviction every N writes rather than on every put
+EVICT_EVERY = 50
+
+
+class TTSAudioCache:
+
+    def __init__(
+        self,
+        path: str = TTS_CACHE_PATH,
+        ttl: float = TTS_CACHE_TTL,
+        max_bytes: int = TTS_CACHE_MAX_BYTES,
+        memory_bytes: int = TTS_CACHE_MEMORY_BYTES,
+        provider: str = TTS_PROVIDER,
+    ):
+        self.path = path
+        self.provider = provider
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        # Guards only the in-memory LRU and is never held during SQLite
+        # work, so get_cached() cannot stall behind a disk read or write
+        self._memory_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened lazily so importing voice_handler never touches the disk
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tts_cache ("
+                " key TEXT PRIMARY KEY,"
+                " audio BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tts_cache_accessed ON tts_cache(accessed)")
+            conn.commit()
+            self._conn = conn
+            logger.info("[TTSCache] Opened %s | ttl=%ss | max_bytes=%s", self.path, self.ttl, self.max_bytes)
+        return self._conn
+
+    def make_key(self, voice: str, text: str) -> str:
+        return hashlib.sha256(f"{self.provider}\n{voice}\n{text.strip()}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, audio: bytes):
+        with self._memory_lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_size -= len(old)
+            self._memory[key] = audio
+            self._memory_size += len(audio)
+            while self._memory_size > self.memory_bytes and len(self._memory) > 1:
+                _, dropped = self._memory.popitem(last=False)
+                self._memory_size -= len(dropped)
+
+    def get_cached(self, voice: str, text: str) -> Optional[bytes]:
+        """Memory-only lookup — never blocks, safe to call on the event loop."""
+        key = self.make_key(voice, text)
+        with self._memory_lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+            return audio
+
+    def get(self, voice: str, text: str) -> Optional[bytes]:
+        """Memory, then disk (promoted to memory on a hit)."""
+        audio = self.get_cached(voice, text)
+        if audio is not None:
+            return audio
+        key = self.make_key(voice, text)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute("SELECT audio, created FROM tts_cache WHERE key = ?", (key,)).fetchone()
+                if row is None or now - row[1] > self.ttl:
+                    self.misses += 1
+                    return None
+                conn.execute("UPDATE tts_cache SET accessed = ? WHERE key = ?", (now, key))
+                conn.commit()
+                audio = bytes(row[0])
+                self.disk_hits += 1
+        except sqlite3.Error as e:
+            logger.warning("[TTSCache] Read failed, treating as miss: %s", e)
+            self.misses += 1
+            return None
+        self._remember(key, audio)
+        return audio
+
+    async def aget(self, voice: str, text: str) -> Optional[bytes]:
+        audio = self.get_cached(voice, text)
+        if audio is not None:
+            return audio
+        return await asyncio.to_thread(self.get, voice, text)
+
+    def put(self, voice: str, text: str, audio: bytes):
+        if not audio:
+            return
+        key = self.make_key(voice, text)
+        now = time.time()
+        self._remember(key, audio)
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO tts_cache (key, audio, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, audio, len(audio), now, now),
+                )
+                conn.commit()
+                self.writes += 1
+                if self.writes % EVICT_EVERY == 1:
+                    self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning("[TTSCache] Write failed: %s", e)
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """Drop expired rows, then LRU rows until under the byte cap."""
+        removed = conn.execute("DELETE FROM tts_cache WHERE created < ?", (now - self.ttl,)).rowcount
+
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM tts_cache").fetchone()
+        if total > self.max_bytes:
+            rows = conn.execute("SELECT key, size FROM tts_cache ORDER BY accessed ASC").fetchall()
+            doomed = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                count -= 1
+                total -= size
+            conn.executemany("DELETE FROM tts_cache WHERE key = ?", doomed)
+            removed += len(doomed)
+
+        conn.commit()
+        if removed:
+            self.evictions += removed
+            logger.info("[TTSCache] Evicted %s entries | remaining=%s", removed, count)
+
+    def stats(self) -> dict:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_size,
+        }
+
+
+tts_cache = TTSAudioCache()
+
+
+def communicate(text: str, voice: str = TTS_VOICE):
+    """A TTS stream for `text` from the selected provider (edge_tts.Communicate interface)."""
+    if TTS_PROVIDER == "fake":
+        from backend.tools.fake_providers import FakeCommunicate
+        return FakeCommunicate(text, voice)
+    return edge_tts.Communicate(text, voice)
+
+
+async def synthesize(text: str, voice: str = TTS_VOICE) -> bytes:
+    """Run TTS for one piece of text and return the full MP3 bytes."""
+    audio = bytearray()
+    async for chunk in communicate(text, voice).stream():
+        if chunk["type"] == "audio":
+            audio.extend(chunk["data"])
+    return bytes(audio)
+
+
+async def prewarm(texts: Iterable[str], voice: str = TTS_VOICE) -> int:
+    """Synthesize and cache every text not cached yet. Returns how many were added."""
+    if not TTS_CACHE_ENABLED:
+        return 0
+    t0 = time.time()
+    pending = [t for t in dict.fromkeys(t.strip() for t in texts) if t]
+    semaphore = asyncio.Semaphore(TTS_PREWARM_CONCURRENCY)
+
+    async def warm(text: str) -> bool:
+        if await tts_cache.aget(voice, text) is not None:
+            return False
+        async with semaphore:
+            audio = await synthesize(text, voice)
+        await asyncio.to_thread(tts_cache.put, voice, text, audio)
+        return bool(audio)
+
+    results = await asyncio.gather(*(warm(t) for t in pending), return_exceptions=True)
+    added = sum(r is True for r in results)
+    failed = [r for r in results if isinstance(r, Exception)]
+    if failed:
+        logger.warning("[TTSCache] Pre-warm: %s texts failed, e.g. %s: %s", len(failed), type(failed[0]).__name__, failed[0])
+    logger.info(
+        "[TTSCache] Pre-warmed %s of %s utterances in %.2fs | %s", added, len(pending), time.time() - t0, tts_cache.stats()
+    )
+    return added
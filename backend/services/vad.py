@@ -0,0 +1,302 @@
+"""
+Frame-level voice activity detection for the live microphone stream.
+
+The old VAD took one RMS over each whole 4096-sample chunk (~256 ms) and
+allocated a float32 copy of every chunk to do it, so speech start and end
+could only be placed on chunk boundaries. VoiceActivityDetector instead:
+
+  - Frames:     cuts the stream into short frames (carrying a partial frame
+                over to the next chunk) and classifies all frames of a chunk
+                in one vectorized pass into preallocated arrays
+  - Detectors:  "energy" — per-frame RMS against max(VOICE_ENERGY_THRESHOLD,
+                ambient × VAD_AMBIENT_RATIO) plus zero-crossing rate, so
+                hiss-like frames need twice the energy to count as speech;
+                "silero" — the Silero model bundled with faster-whisper
+                (32 ms frames). Chosen by VAD_BACKEND; any object with
+                frame_samples, classify(frames) and describe() can be
+                passed in instead
+  - Onset:      speech starts after VAD_ONSET_MS of consecutive speech frames
+  - Hangover:   speech ends after VAD_HANGOVER_MS without a speech frame —
+                the hard cap; endpointer.py usually ends the turn sooner
+  - Pauses:     silences that speech resumed after are reported to on_pause
+
+process(chunk) returns "start", "end" or None for each incoming chunk.
+"""
+
+import os
+import math
+import threading
+import logging
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger("interviewer.vad")
+
+SAMPLE_RATE = 16000
+
+VAD_BACKENDS = ("energy", "silero")
+VAD_BACKEND = os.environ.get("VAD_BACKEND", "energy")
+
+# Energy threshold for VAD
+# Int16 range is 0-32767. Fan noise is typically 200-800 RMS.
+# Human speech is typically 2000-10000+ RMS.
+ENERGY_THRESHOLD = int(os.environ.get("VOICE_ENERGY_THRESHOLD", "2000"))
+VAD_FRAME_MS = float(os.environ.get("VAD_FRAME_MS", "20"))
+# Speech must be this many times louder than the ambient estimate
+VAD_AMBIENT_RATIO = float(os.environ.get("VAD_AMBIENT_RATIO", "3.0"))
+# Frames crossing zero more often than this (fraction of samples) look like hiss
+VAD_NOISE_ZCR = float(os.environ.get("VAD_NOISE_ZCR", "0.35"))
+VAD_SILERO_THRESHOLD = float(os.environ.get("VAD_SILERO_THRESHOLD", "0.5"))
+
+VAD_ONSET_MS = float(os.environ.get("VAD_ONSET_MS", "60"))
+VAD_HANGOVER_MS = float(os.environ.get("VAD_HANGOVER_MS", "2000"))
+
+# The ambient estimate used to be smoothed by 0.98 per 256 ms chunk; the
+# per-frame factor keeps the same time constant
+_AMBIENT_ALPHA_PER_CHUNK = 0.98
+_CHUNK_MS = 256.0
+
+_INT16_SCALE = np.float32(1.0 / 32768.0)
+
+
+# ── Detectors ─────────────────────────────────────────────────────────────────
+
+class EnergyDetector:
+    """Per-frame RMS + zero-crossing rate against an adaptive ambient floor."""
+
+    def __init__(
+        self,
+        frame_ms: float = VAD_FRAME_MS,
+        threshold: float = ENERGY_THRESHOLD,
+        ambient_ratio: float = VAD_AMBIENT_RATIO,
+        noise_zcr: float = VAD_NOISE_ZCR,
+    ):
+        self.frame_samples = int(SAMPLE_RATE * frame_ms / 1000)
+        self.threshold = threshold
+        self.ambient_ratio = ambient_ratio
+        self.noise_crossings = noise_zcr * (self.frame_samples - 1)
+        self.alpha = _AMBIENT_ALPHA_PER_CHUNK ** (frame_ms / _CHUNK_MS)
+        self.ambient = 0.0
+        self.last_rms = 0.0
+        self.last_threshold = float(threshold)
+        self._capacity = 0
+        self._reserve(16)
+
+    def _reserve(self, n: int):
+        # Scratch arrays, grown geometrically and reused for every chunk
+        if n <= self._capacity:
+            return
+        cap = max(n, 2 * self._capacity)
+        length = self.frame_samples
+        self._f32 = np.empty((cap, length), dtype=np.float32)
+        self._sign = np.empty((cap, length), dtype=bool)
+        self._cross = np.empty((cap, length - 1), dtype=bool)
+        self._rms = np.empty(cap, dtype=np.float32)
+        self._crossings = np.empty(cap, dtype=np.intp)
+        self._speech = np.empty(cap, dtype=bool)
+        self._hissy = np.empty(cap, dtype=bool)
+        self._loud = np.empty(cap, dtype=bool)
+        self._capacity = cap
+
+    def classify(self, frames: np.ndarray) -> np.ndarray:
+        """frames: (n, frame_samples) int16 view. Returns a bool speech mask (scratch — valid until the next call)."""
+        n = len(frames)
+        self._reserve(n)
+        f32 = self._f32[:n]
+        np.copyto(f32, frames)
+        rms = self._rms[:n]
+        np.einsum("ij,ij->i", f32, f32, out=rms)
+        rms *= np.float32(1.0 / self.frame_samples)
+        np.sqrt(rms, out=rms)
+
+        sign = np.signbit(frames, out=self._sign[:n])
+        cross = np.not_equal(sign[:, 1:], sign[:, :-1], out=self._cross[:n])
+        crossings = np.sum(cross, axis=1, out=self._crossings[:n])
+
+        threshold = max(self.threshold, self.ambient * self.ambient_ratio)
+        speech = np.greater(rms, threshold, out=self._speech[:n])
+        # Hiss-like frames (many zero crossings) only count when clearly loud
+        hissy = np.greater(crossings, self.noise_crossings, out=self._hissy[:n])
+        loud = np.greater(rms, 2 * threshold, out=self._loud[:n])
+        np.logical_or(np.logical_not(hissy, out=hissy), loud, out=hissy)
+        np.logical_and(speech, hissy, out=speech)
+
+        # Ambient floor follows the non-speech frames
+        quiet = n - int(np.count_nonzero(speech))
+        if quiet:
+            quiet_mean = (float(rms.sum()) - float(np.dot(rms, speech))) / quiet
+            decay = self.alpha ** quiet
+            self.ambient = decay * self.ambient + (1 - decay) * quiet_mean
+
+        self.last_rms = float(rms.max())
+        self.last_threshold = threshold
+        return speech
+
+    def describe(self) -> str:
+        return f"rms={self.last_rms:.0f} | ambient={self.ambient:.0f} | threshold={self.last_threshold:.0f}"
+
+
+_silero_model = None
+_silero_lock = threading.Lock()
+
+
+def _get_silero_model():
+    """faster-whisper's Silero ONNX model, loaded once and shared by all sessions."""
+    global _silero_model
+    with _silero_lock:
+        if _silero_model is None:
+            from faster_whisper.vad import get_vad_model
+            _silero_model = get_vad_model()
+            logger.info("[VAD] Silero model loaded")
+    return _silero_model
+
+
+class SileroDetector:
+    """Silero speech probability per 32 ms frame (the model's native window)."""
+
+    frame_samples = 512
+
+    def __init__(self, threshold: float = VAD_SILERO_THRESHOLD):
+        self.threshold = threshold
+        self.model = _get_silero_model()
+        self.last_prob = 0.0
+        # The previous frame is prepended so the first frame of a chunk gets real context
+        self._previous = np.zeros(self.frame_samples, dtype=np.float32)
+        self._capacity = 0
+        self._reserve(16)
+
+    def _reserve(self, n: int):
+        if n <= self._capacity:
+            return
+        cap = max(n, 2 * self._capacity)
+        self._input = np.empty((cap + 1) * self.frame_samples, dtype=np.float32)
+        self._speech = np.empty(cap, dtype=bool)
+        self._capacity = cap
+
+    def classify(self, frames: np.ndarray) -> np.ndarray:
+        n = len(frames)
+        self._reserve(n)
+        size = self.frame_samples
+        audio = self._input[:(n + 1) * size]
+        audio[:size] = self._previous
+        np.multiply(frames.reshape(-1), _INT16_SCALE, out=audio[size:])
+        self._previous[:] = audio[-size:]
+        probs = self.model(audio).reshape(-1)[1:]
+        self.last_prob = float(probs.max())
+        return np.greater(probs, self.threshold, out=self._speech[:n])
+
+    def describe(self) -> str:
+        return f"p={self.last_prob:.2f} | threshold={self.threshold:.2f}"
+
+
+def make_detector(backend: str = VAD_BACKEND):
+    if backend not in VAD_BACKENDS:
+        raise ValueError(f"Unknown VAD backend '{backend}' (expected one of {VAD_BACKENDS})")
+    if backend == "silero":
+        try:
+            return SileroDetector()
+        except Exception as e:
+            logger.error("[VAD] Silero unavailable (%s: %s), falling back to energy", type(e).__name__, e)
+    return EnergyDetector()
+
+
+# ── Onset / hangover state machine ────────────────────────────────────────────
+
+class VoiceActivityDetector:
+
+    def __init__(
+        self,
+        detector=None,
+        onset_ms: float = VAD_ONSET_MS,
+        hangover_ms: float = VAD_HANGOVER_MS,
+        on_pause: Optional[Callable[[float], None]] = None,
+    ):
+        self.detector = detector or make_detector()
+        self.on_pause = on_pause
+        self.frame_samples = self.detector.frame_samples
+        self.frame_ms = self.frame_samples * 1000 / SAMPLE_RATE
+        self.onset_frames = max(1, math.ceil(onset_ms / self.frame_ms))
+        self.hangover_frames = max(1, math.ceil(hangover_ms / self.frame_ms))
+        self.speaking = False
+        self._onset_run = 0      # consecutive speech frames while not speaking
+        self._silence_run = 0    # consecutive non-speech frames while speaking
+        self._carry = np.empty(self.frame_samples, dtype=np.int16)
+        self._carry_len = 0
+        self._work = np.empty(0, dtype=np.int16)
+        self.frames = 0
+        self.speech_frames = 0
+        self.utterance_speech_frames = 0
+
+    @property
+    def trailing_silence_ms(self) -> float:
+        return self._silence_run * self.frame_ms
+
+    @property
+    def voiced_seconds(self) -> float:
+        """Speech (not pauses) in the current or most recent utterance."""
+        return self.utterance_speech_frames * self.frame_ms / 1000
+
+    def reset(self):
+        """Forget the current utterance state; the detector's noise estimate is kept."""
+        self.speaking = False
+        self._onset_run = 0
+        self._silence_run = 0
+        self._carry_len = 0
+
+    def process(self, chunk: bytes) -> Optional[str]:
+        """
+        Classify one chunk of int16 PCM. Returns "start" when speech begins,
+        "end" when the hangover has elapsed after speech, otherwise None.
+        Frames after a "start" still count toward the utterance (speech
+        frames, pauses, hangover); frames after an "end" in the same chunk
+        are trailing silence and dropped. At most one event is returned per
+        chunk — an end reached in the chunk that started speech is reported
+        on the next chunk.
+        """
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        size = self.frame_samples
+        total = self._carry_len + len(samples)
+        if self._carry_len:
+            if len(self._work) < total:
+                self._work = np.empty(max(total, 2 * len(self._work)), dtype=np.int16)
+            stream = self._work[:total]
+            stream[:self._carry_len] = self._carry[:self._carry_len]
+            stream[self._carry_len:] = samples
+        else:
+            stream = samples
+        n = total // size
+        self._carry_len = total - n * size
+        self._carry[:self._carry_len] = stream[n * size:]
+        if n == 0:
+            return None
+
+        mask = self.detector.classify(stream[:n * size].reshape(n, size))
+        self.frames += n
+        self.speech_frames += int(np.count_nonzero(mask))
+        event = None
+        for is_speech in mask.tolist():
+            if not self.speaking:
+                self._onset_run = self._onset_run + 1 if is_speech else 0
+                if self._onset_run >= self.onset_frames:
+                    self.speaking = True
+                    self._silence_run = 0
+                    self.utterance_speech_frames = self._onset_run
+                    self._onset_run = 0
+                    event = "start"
+            elif is_speech:
+                self.utterance_speech_frames += 1
+                if self._silence_run and self.on_pause:
+                    self.on_pause(self._silence_run * self.frame_ms)
+                self._silence_run = 0
+            else:
+                self._silence_run += 1
+                if self._silence_run >= self.hangover_frames:
+                    if event == "start":
+                        break
+                    self.reset()
+                    return "end"
+        return event
+
+    def describe(self) -> str:
+        return self.detector.describe()
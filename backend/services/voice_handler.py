@@ -2,53 +2,91 @@
 voice_handler.py — WebSocket session handler for live voice interviews.
 
 This module handles:
-  - VAD (Voice Activity Detection) via energy thresholding
-  - Whisper STT (speech-to-text)
-  - LangGraph interview graph invocation (replaces old voice_service)
-  - edge-tts TTS (text-to-speech)
+  - VAD (Voice Activity Detection) per 20-30 ms frame (vad.py), with the end
+    of each turn decided adaptively (endpointer.py)
+  - Whisper STT (speech-to-text), incrementally while the candidate speaks
+    (STT_STREAMING) with 'partial_text' messages to the client
+  - LangGraph interview graph invocation via astream (replaces old voice_service)
+  - edge-tts TTS (text-to-speech), sentence by sentence as the planner streams,
+    forwarded chunk by chunk as binary WebSocket frames (see AUDIO_FRAME);
+    template, fallback and recovery lines are served from the TTS cache
   - WebSocket keepalive heartbeat
-  - Per-turn error recovery
+  - Per-turn error recovery; each turn runs as a task so a barge-in
+    ('interrupt') cancels it while it is still transcribing, thinking or
+    speaking
+  - Resuming a checkpointed interview after a reconnect
 
 The LangGraph graph is invoked once per turn with the user's transcribed
 answer. It returns the AI's response text, routing decision, and score.
+While it runs, the planner's sentences are streamed out as separate audio
+clips followed by an 'audio_end' marker. The turn is a pipeline of stages
+joined by bounded asyncio queues — graph → synthesis (up to TTS_LOOKAHEAD
+sentences ahead) → sender — so sentence N+1 is synthesized while sentence N
+is sent, and the turn takes about as long as its slowest stage rather than
+the sum of all of them.
+
+TTS audio protocol: every MP3 chunk edge-tts yields is sent at once as a
+binary frame — an 8-byte AUDIO_FRAME header followed by the raw bytes (no
+base64). A clip is one sentence (or one whole fallback message); its last
+frame carries FRAME_CLIP_END. 'audio_end' (JSON) closes the reply.
 """
 
 import asyncio
-import base64
+import itertools
 import json
-import numpy as np
-import io
-import wave
+import struct
 import time
 import logging
 from typing import Optional
 from fastapi import WebSocket, WebSocketDisconnect
-from faster_whisper import WhisperModel
-import edge_tts
 from backend.graph.graph import interview_graph
+from backend.graph.checkpointer import checkpoint_saver
+from backend.graph.checkpoint_retention import checkpoint_retention
+from backend.graph.context_store import interview_context
+from backend.graph.templates import all_renderings
 from backend.services.evaluation_service import evaluation_service
+from backend.services.sentence_splitter import split_sentences
+from backend.services.tts_cache import TTS_VOICE, TTS_CACHE_ENABLED, tts_cache, prewarm, communicate
+from backend.services.streaming_stt import STT_STREAMING, IncrementalTranscriber
+from backend.services.pcm_buffer import PCMBuffer
+from backend.services.vad import VAD_BACKEND, VAD_HANGOVER_MS, SAMPLE_RATE, VoiceActivityDetector
+from backend.services.endpointer import ENDPOINT_MIN_MS, ENDPOINT_PROBE_MS, Endpointer
+from backend.services import stt_pool
+from backend.services.tracing import tracer, span, mark
+from backend.services.metrics import STT_SECONDS, TTS_FIRST_BYTE_SECONDS, TTS_SECONDS, FALLBACKS
 import os
 
 logger = logging.getLogger("interviewer.voice")
 
-# Load Whisper model globally to avoid reloading
-whisper_model = WhisperModel("tiny.en", device="cpu", compute_type="int8")
-logger.info(f"[Voice] Whisper model loaded: tiny.en (cpu, int8)")
-
-# Energy threshold for VAD
-# Int16 range is 0-32767. Fan noise is typically 200-800 RMS.
-# Human speech is typically 2000-10000+ RMS.
-ENERGY_THRESHOLD = int(os.environ.get("VOICE_ENERGY_THRESHOLD", "2000"))
-
-# Number of silent frames to wait before treating utterance as complete
-# At 4096 samples/chunk @ 16kHz: each chunk is ~256ms
-# 8 chunks = ~2 seconds of silence
-SILENCE_THRESHOLD = 8
+# Whisper runs in the STT worker pool (stt_pool.py); with STT_WORKERS=0 the
+# in-process model is loaded on first use via stt_pool.get_local_model()
 
 # How often (seconds) to send a keepalive ping to prevent uvicorn from
-# closing the WebSocket during long Whisper/Gemini API calls
+# closing the WebSocket during long Whisper/LLM API calls
 KEEPALIVE_INTERVAL = 8
 
+# Binary TTS frame header, network byte order:
+#   version u8 | flags u8 | clip u16 | seq u32 (chunk index within the clip)
+AUDIO_FRAME = struct.Struct("!BBHI")
+AUDIO_FRAME_VERSION = 1
+FRAME_CLIP_END = 0x01   # last frame of the clip (payload may be empty)
+
+# Clip ids only need to differ between consecutive clips; wraps at 16 bits
+_clip_ids = itertools.count()
+
+# Turn pipeline bounds (see _run_graph_and_speak)
+SENTENCE_QUEUE_SIZE = max(1, int(os.environ.get("SENTENCE_QUEUE_SIZE", "8")))
+# Sentences synthesized ahead of the one being sent
+TTS_LOOKAHEAD = max(1, int(os.environ.get("TTS_LOOKAHEAD", "2")))
+# MP3 chunks a clip may buffer before its synthesis waits for the sender
+CLIP_QUEUE_CHUNKS = max(1, int(os.environ.get("CLIP_QUEUE_CHUNKS", "256")))
+
+# Fixed lines — spoken whole via _speak_and_send and pre-warmed in the TTS cache
+GREETING_FALLBACK = "Hello {name}! Welcome to your interview for the {job_title} position. Let's get started -- could you please introduce yourself briefly?"
+RESUME_GREETING_FALLBACK = "Welcome back, {name}! Let's pick up where we left off -- could you please repeat your last answer?"
+TIMEOUT_MESSAGE = "I'm sorry, I took too long to process that. Could you repeat your answer?"
+RECOVERY_MESSAGE = "I encountered a brief technical issue. Let's continue -- could you please repeat or rephrase your last answer?"
+
 
 async def _send(websocket: WebSocket, data: dict, lock: Optional[asyncio.Lock] = None):
     """Send a JSON dict as text over websocket, using a lock to prevent concurrent write errors."""
@@ -59,6 +97,23 @@ async def _send(websocket: WebSocket, data: dict, lock: Optional[asyncio.Lock] =
         await websocket.send_text(json.dumps(data))
 
 
+async def _send_audio_frame(
+    websocket: WebSocket,
+    clip: int,
+    seq: int,
+    data: bytes,
+    end: bool = False,
+    lock: Optional[asyncio.Lock] = None,
+):
+    """Send one chunk of TTS audio as a binary frame with an AUDIO_FRAME header."""
+    frame = AUDIO_FRAME.pack(AUDIO_FRAME_VERSION, FRAME_CLIP_END if end else 0, clip & 0xFFFF, seq) + data
+    if lock:
+        async with lock:
+            await websocket.send_bytes(frame)
+    else:
+        await websocket.send_bytes(frame)
+
+
 async def _keepalive_loop(websocket: WebSocket, stop_event: asyncio.Event, lock: asyncio.Lock):
     """
     Runs concurrently with the main session loop.
@@ -84,6 +139,46 @@ async def _keepalive_loop(websocket: WebSocket, stop_event: asyncio.Event, lock:
             break
 
 
+async def prewarm_tts(question_file: dict, candidate_name: str, job_title: str) -> int:
+    """
+    Synthesize everything this interview can say without the LLM: the fixed
+    lines, each primary question, and every template rendering, split into
+    the same sentences the planner will stream.
+    """
+    topics = question_file.get("topics", [])
+    texts = [
+        GREETING_FALLBACK.format(name=candidate_name, job_title=job_title),
+        TIMEOUT_MESSAGE,
+        RECOVERY_MESSAGE,
+    ]
+    for topic in topics:
+        texts.extend(split_sentences(topic.get("primary_question", "")))
+    for rendering in all_renderings(topics):
+        texts.extend(split_sentences(rendering))
+    return await prewarm(texts)
+
+
+def _thread_prefix(job_id, candidate_id) -> str:
+    return f"interview_{job_id}_{candidate_id}_"
+
+
+async def find_resumable_session(job_id: int, candidate_id: int) -> Optional[tuple[str, dict]]:
+    """
+    The candidate's most recent interview thread for this job, if it was
+    checkpointed but never completed. Returns (thread_id, state values).
+    Only the newest thread is considered — a finished interview is never
+    reopened by falling back to an older abandoned one.
+    """
+    thread_ids = await asyncio.to_thread(checkpoint_saver.thread_ids, _thread_prefix(job_id, candidate_id))
+    if not thread_ids:
+        return None
+    snapshot = await interview_graph.aget_state({"configurable": {"thread_id": thread_ids[0]}})
+    values = snapshot.values
+    if not values or values.get("is_complete") or not values.get("messages"):
+        return None
+    return thread_ids[0], values
+
+
 class VoiceConnectionManager:
 
     async def handle_session(
@@ -93,22 +188,21 @@ class VoiceConnectionManager:
         candidate_details: dict,
         resume_profile: dict,
         question_file: dict,
+        resume_thread_id: Optional[str] = None,
     ):
-        await websocket.accept()
+        # The socket was accepted by main.py when admission.py gave it a slot
         candidate_name = candidate_details.get('name', 'Candidate')
         job_title = job_details.get('title', 'the position')
-        logger.info(f"[Voice] ═══════════════════════════════════════════════")
-        logger.info(f"[Voice] Session started | candidate={candidate_name} | job={job_title}")
-        logger.info(f"[Voice]   VAD threshold={ENERGY_THRESHOLD} | silence_frames={SILENCE_THRESHOLD} | keepalive={KEEPALIVE_INTERVAL}s")
-        logger.info(f"[Voice]   Topics: {len(question_file.get('topics', []))} | Resume skills: {len(resume_profile.get('skills', []))}")
-        logger.info(f"[Voice] ═══════════════════════════════════════════════")
+        logger.info("[Voice] ═══════════════════════════════════════════════")
+        logger.info("[Voice] Session started | candidate=%s | job=%s", candidate_name, job_title)
+        logger.info("[Voice]   VAD backend=%s | end of turn %.0f-%.0fms | keepalive=%ss", VAD_BACKEND, ENDPOINT_MIN_MS, VAD_HANGOVER_MS, KEEPALIVE_INTERVAL)
+        logger.info("[Voice]   Topics: %s | Resume skills: %s", len(question_file.get('topics', [])), len(resume_profile.get('skills', [])))
+        logger.info("[Voice] ═══════════════════════════════════════════════")
 
         # ── Session State ─────────────────────────────────────────
-        audio_buffer = bytearray()
-        is_speaking = False
-        silence_frames = 0
-        ambient_energy = 0.0
-        AMBIENT_ALPHA = 0.98  # Rolling average smoothing factor
+        audio_buffer = PCMBuffer()
+        endpointer = Endpointer()
+        vad = VoiceActivityDetector(on_pause=endpointer.observe_pause)
 
         # Gate: ignore all incoming mic audio while AI is playing
         ai_is_speaking = False
@@ -116,11 +210,33 @@ class VoiceConnectionManager:
         ai_speak_expected_duration = 0.0
 
         # LangGraph thread ID — MUST be unique per session to avoid state leaks
-        # Using timestamp ensures each new interview session starts with a clean state
-        session_ts = int(time.time() * 1000)
-        thread_id = f"interview_{job_details.get('job_id', 0)}_{candidate_details.get('candidate_id', 0)}_{session_ts}"
+        # Using timestamp ensures each new interview session starts with a clean state.
+        # A reconnect to an unfinished interview reuses its checkpointed thread instead.
+        thread_prefix = _thread_prefix(job_details.get('job_id', 0), candidate_details.get('candidate_id', 0))
+        if resume_thread_id:
+            thread_id = resume_thread_id
+        else:
+            session_ts = int(time.time() * 1000)
+            thread_id = thread_prefix + str(session_ts)
         graph_config = {"configurable": {"thread_id": thread_id}}
-        logger.info(f"[Voice] LangGraph thread_id={thread_id}")
+        logger.info("[Voice] LangGraph thread_id=%s | resumed=%s", thread_id, bool(resume_thread_id))
+
+        # Protect this thread from the retention sweep while the socket is open.
+        # A fresh session supersedes any older thread for this job/candidate.
+        checkpoint_retention.session_started(thread_id)
+        if not resume_thread_id:
+            try:
+                superseded = await asyncio.to_thread(checkpoint_saver.thread_ids, thread_prefix)
+                await asyncio.to_thread(checkpoint_retention.release, superseded)
+            except Exception as e:
+                logger.warning("[Voice] Could not release superseded threads: %s", e)
+            # Static context is stored once; the graph state only references it
+            await asyncio.to_thread(interview_context.put, thread_id, {
+                "resume_profile": resume_profile,
+                "question_file": question_file,
+                "job_details": job_details,
+                "candidate_name": candidate_name,
+            })
 
         # Lock for synchronizing WebSocket sends between main loop and keepalive heartbeat
         ws_lock = asyncio.Lock()
@@ -131,9 +247,24 @@ class VoiceConnectionManager:
         # Start the concurrent keepalive heartbeat
         keepalive_task = asyncio.create_task(_keepalive_loop(websocket, stop_keepalive, ws_lock))
 
+        # Incremental STT: decodes the utterance in windows while the candidate speaks
+        async def send_partial(text: str):
+            await _send(websocket, {"type": "partial_text", "text": text}, ws_lock)
+
+        transcriber = IncrementalTranscriber(stt_pool.transcribe, send_partial) if STT_STREAMING else None
+
         # Track the final graph state for evaluation
         final_graph_state = None
 
+        # The in-flight turn (see run_turn) and the pending socket read
+        turn_task: Optional[asyncio.Task] = None
+        receive_task: Optional[asyncio.Task] = None
+
+        # The open turn trace (tracing.py): from end of speech until the
+        # client's 'audio_done' for the reply, an interrupt or session end
+        turn_trace = tracer.start_turn(thread_id, 0, kind="resume" if resume_thread_id else "greeting")
+        turn_count = 0
+
         try:
             # ── Initial Greeting via LangGraph ────────────────────
             logger.info("[Voice] Invoking graph for greeting (empty messages)...")
@@ -144,53 +275,236 @@ class VoiceConnectionManager:
             }, ws_lock)
 
             t0 = time.time()
-            try:
-                greeting_result = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        interview_graph.invoke,
-                        {
-                            "messages": [],
-                            "resume_profile": resume_profile,
-                            "question_file": question_file,
-                            "job_details": job_details,
-                            "candidate_name": candidate_name,
-                            "current_topic_index": 0,
-                            "current_topic_turn": 0,
-                            "current_topic_score": 0,
-                            "grader_reasoning": "",
-                            "planner_instruction": "",
-                            "is_complete": False,
-                            "evaluation_notes": [],
-                            "route": "",
-                        },
-                        graph_config,
-                    ),
-                    timeout=45.0,
+            greeting_audio_sent = False
+            if resume_thread_id:
+                fallback_greeting = RESUME_GREETING_FALLBACK.format(name=candidate_name)
+            else:
+                fallback_greeting = GREETING_FALLBACK.format(name=candidate_name, job_title=job_title)
+            with turn_trace.activate():
+                try:
+                    if resume_thread_id:
+                        greeting_step = self._resume_thread(websocket, graph_config, ws_lock)
+                    else:
+                        greeting_step = self._run_graph_and_speak(
+                            websocket,
+                            {
+                                "messages": [],
+                                "context_id": thread_id,
+                                "current_topic_index": 0,
+                                "current_topic_turn": 0,
+                                "current_topic_score": 0,
+                                "grader_reasoning": "",
+                                "planner_instruction": "",
+                                "planner_template": None,
+                                "is_complete": False,
+                                "evaluation_notes": [],
+                                "route": "",
+                                "draft_followup": "",
+                            },
+                            graph_config,
+                            ws_lock,
+                        )
+                    greeting_result, greeting_audio_sent = await asyncio.wait_for(greeting_step, timeout=45.0)
+                    final_graph_state = greeting_result
+                    greeting = greeting_result["messages"][-1]["content"]
+                    elapsed = round(time.time() - t0, 2)
+                    logger.info("[Voice] Greeting generated in %ss: '%s...'", elapsed, greeting[:80])
+
+                except asyncio.TimeoutError:
+                    logger.error("[Voice] Greeting generation timed out after 45s, using fallback.")
+                    FALLBACKS.labels("graph_timeout").inc()
+                    greeting = fallback_greeting
+                except Exception as e:
+                    logger.error("[Voice] Greeting error: %s: %s", type(e).__name__, e)
+                    greeting = fallback_greeting
+
+                await _send(websocket, {"type": "text", "role": "ai", "text": greeting}, ws_lock)
+
+                ai_is_speaking = True
+                ai_speak_start_time = time.time()
+                ai_speak_expected_duration = len(greeting) / 10.0 + 5.0
+                # Streamed sentences are already playing; otherwise (fallback) speak it now
+                success = greeting_audio_sent or await self._speak_and_send(
+                    websocket, greeting, ws_lock, cacheable=greeting == fallback_greeting
                 )
-                final_graph_state = greeting_result
-                greeting = greeting_result["messages"][-1]["content"]
-                elapsed = round(time.time() - t0, 2)
-                logger.info(f"[Voice] Greeting generated in {elapsed}s: '{greeting[:80]}...'")
-
-            except asyncio.TimeoutError:
-                logger.error("[Voice] Greeting generation timed out after 45s, using fallback.")
-                greeting = f"Hello {candidate_name}! Welcome to your interview for the {job_title} position. Let's get started -- could you please introduce yourself briefly?"
-            except Exception as e:
-                logger.error(f"[Voice] Greeting error: {type(e).__name__}: {e}")
-                greeting = f"Hello {candidate_name}! Welcome to your interview for the {job_title} position. Let's get started -- could you please introduce yourself briefly?"
-
-            await _send(websocket, {"type": "text", "role": "ai", "text": greeting}, ws_lock)
+                if not success:
+                    ai_is_speaking = False
 
-            ai_is_speaking = True
-            ai_speak_start_time = time.time()
-            ai_speak_expected_duration = len(greeting) / 10.0 + 5.0
-            success = await self._speak_and_send(websocket, greeting, ws_lock)
-            if not success:
-                ai_is_speaking = False
+            # A resumed turn may have been the one that ended the interview
+            if final_graph_state and final_graph_state.get("is_complete"):
+                logger.info("[Voice] Resumed thread completed the interview. Closing session.")
+                await _send(websocket, {
+                    "type": "interview_complete",
+                    "message": "Interview complete! Thank you for participating."
+                }, ws_lock)
 
             # ── Main Message Loop ─────────────────────────────────
-            while True:
-                message = await websocket.receive()
+            # Each answer is handled by a turn task (STT → graph → TTS → sender,
+            # see _run_graph_and_speak) while this loop keeps reading the socket,
+            # so an 'interrupt' can cancel the whole pipeline mid-turn.
+
+            async def run_turn(final_audio, trace):
+                nonlocal ai_is_speaking, ai_speak_start_time, ai_speak_expected_duration, final_graph_state
+
+                with trace.activate():
+                    # ── Per-turn try/except: errors here should NOT kill the session ──
+                    # Each turn is isolated so a transient API error just skips that turn.
+                    try:
+                        # Whisper runs in the worker pool (or a thread with STT_WORKERS=0)
+                        # The keepalive task keeps the WS alive during this
+                        logger.info("[Voice] Starting transcription...")
+                        t_stt = time.time()
+                        with span("stt", streaming=bool(transcriber)) as stt_span:
+                            if transcriber:
+                                # Most of the utterance is already decoded — only the tail is left
+                                transcription = await transcriber.finish(final_audio)
+                            else:
+                                segments = await stt_pool.transcribe(final_audio)
+                                transcription = " ".join(text for _, _, text in segments).strip()
+                            stt_span.set(chars=len(transcription))
+                        STT_SECONDS.labels("true" if transcriber else "false").observe(time.time() - t_stt)
+                        stt_elapsed = round(time.time() - t_stt, 2)
+                        logger.info("[Voice] Transcription (%ss): '%s'", stt_elapsed, transcription)
+
+                        if not transcription.strip():
+                            logger.info("[Voice] Empty transcription (noise). Resuming listen.")
+                            if transcriber:
+                                await _send(websocket, {"type": "partial_text", "text": ""}, ws_lock)
+                            await _send(websocket, {
+                                "type": "status",
+                                "message": "Didn't catch that. Please speak again.",
+                                "state": "listening"
+                            }, ws_lock)
+                            trace.finish("empty")
+                            return
+
+                        endpointer.observe_utterance(transcription, vad.voiced_seconds)
+
+                        # Send transcription to frontend chat
+                        await _send(websocket, {"type": "text", "role": "user", "text": transcription.strip()}, ws_lock)
+
+                        await _send(websocket, {
+                            "type": "status",
+                            "message": "AI is thinking...",
+                            "state": "thinking"
+                        }, ws_lock)
+
+                        # ── Invoke LangGraph Planner ──────────────────
+                        logger.info("[Voice] Invoking LangGraph planner...")
+                        t_llm = time.time()
+                        audio_sent = False
+                        try:
+                            graph_result, audio_sent = await asyncio.wait_for(
+                                self._run_graph_and_speak(
+                                    websocket,
+                                    {"messages": [{"role": "user", "content": transcription.strip()}]},
+                                    graph_config,
+                                    ws_lock,
+                                ),
+                                timeout=45.0,
+                            )
+                            final_graph_state = graph_result
+                        except asyncio.TimeoutError:
+                            logger.error("[Voice] LangGraph timed out after 45s.")
+                            FALLBACKS.labels("graph_timeout").inc()
+                            trace.status = "timeout"
+                            graph_result = None
+                            audio_sent = False
+
+                        llm_elapsed = round(time.time() - t_llm, 2)
+
+                        # Only canned fallbacks go to the TTS cache, never a free-form reply
+                        response_canned = not graph_result
+                        if graph_result:
+                            ai_response = graph_result["messages"][-1]["content"]
+                            interview_ended = graph_result.get("is_complete", False)
+                            route = graph_result.get("route", "unknown")
+                            logger.info(
+                                "[Voice] Turn complete (%ss) | route=%s | score=%s | "
+                                "topic_idx=%s | topic_turn=%s | response='%s...'",
+                                llm_elapsed, route,
+                                graph_result.get('current_topic_score', '?'),
+                                graph_result.get('current_topic_index'),
+                                graph_result.get('current_topic_turn'),
+                                ai_response[:80],
+                            )
+                        else:
+                            ai_response = TIMEOUT_MESSAGE
+                            interview_ended = False
+                            logger.warning("[Voice] Using fallback response due to timeout.")
+
+                        # Guard against None/empty response
+                        if not ai_response or not ai_response.strip():
+                            logger.warning("[Voice] AI response was empty, using fallback.")
+                            ai_response = "Thank you for sharing that. Could you tell me more about your technical background?"
+                            response_canned = True
+                            audio_sent = False
+
+                        await _send(websocket, {"type": "text", "role": "ai", "text": ai_response}, ws_lock)
+
+                        # Gate mic before sending audio
+                        ai_is_speaking = True
+                        ai_speak_start_time = time.time()
+                        ai_speak_expected_duration = len(ai_response) / 10.0 + 5.0
+                        success = audio_sent or await self._speak_and_send(
+                            websocket, ai_response, ws_lock, cacheable=response_canned
+                        )
+                        if not success:
+                            logger.warning("[Voice] TTS failed, immediately ungating microphone.")
+                            FALLBACKS.labels("tts_failed").inc()
+                            ai_is_speaking = False
+                            await _send(websocket, {
+                                "type": "status",
+                                "message": "Your turn -- please speak now",
+                                "state": "listening"
+                            }, ws_lock)
+
+                        if interview_ended:
+                            logger.info("[Voice] Interview complete (route=end). Closing session.")
+                            await _send(websocket, {
+                                "type": "interview_complete",
+                                "message": "Interview complete! Thank you for participating."
+                            }, ws_lock)
+
+                    except asyncio.CancelledError:
+                        # Barge-in or session shutdown — drop what the STT stage had decoded
+                        if transcriber:
+                            transcriber.cancel()
+                        raise
+                    except Exception as turn_error:
+                        logger.error("[Voice] Per-turn error: %s: %s", type(turn_error).__name__, turn_error, exc_info=True)
+                        trace.status = "error"
+                        # Recover gracefully: notify the user and resume listening
+                        try:
+                            recovery_msg = RECOVERY_MESSAGE
+                            ai_is_speaking = True
+                            ai_speak_start_time = time.time()
+                            ai_speak_expected_duration = len(recovery_msg) / 10.0 + 5.0
+                            success = await self._speak_and_send(websocket, recovery_msg, ws_lock, cacheable=True)
+                            if not success:
+                                ai_is_speaking = False
+                        except Exception:
+                            # If even the recovery fails, just reset state and keep listening
+                            ai_is_speaking = False
+                            await _send(websocket, {
+                                "type": "status",
+                                "message": "Technical issue. Please speak again.",
+                                "state": "listening"
+                            }, ws_lock)
+
+            while not (final_graph_state and final_graph_state.get("is_complete")):
+                if receive_task is None:
+                    receive_task = asyncio.create_task(websocket.receive())
+                waiting = {receive_task} if turn_task is None else {receive_task, turn_task}
+                await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if turn_task is not None and turn_task.done():
+                    if not turn_task.cancelled() and turn_task.exception():
+                        error = turn_task.exception()
+                        logger.error("[Voice] Turn failed: %s: %s", type(error).__name__, error)
+                    turn_task = None
+                    continue
+                message = receive_task.result()
+                receive_task = None
 
                 # ── Text / Control Messages ───────────────────────
                 if "text" in message:
@@ -206,6 +520,10 @@ class VoiceConnectionManager:
                         # NOW it's safe to re-enable the microphone listener.
                         ai_is_speaking = False
                         logger.debug("[Voice] Client confirmed audio_done. Listening enabled.")
+                        if turn_trace is not None:
+                            turn_trace.mark("audio_done")
+                            turn_trace.finish()
+                            turn_trace = None
                         await _send(websocket, {
                             "type": "status",
                             "message": "Your turn -- please speak now",
@@ -213,9 +531,16 @@ class VoiceConnectionManager:
                         }, ws_lock)
 
                     elif msg_type == "interrupt":
-                        # Barge-in: user spoke while AI was playing
+                        # Barge-in: user spoke while AI was playing — stop every stage of the turn
                         ai_is_speaking = False
-                        logger.info("[Voice] Barge-in interrupt received.")
+                        if turn_task is not None:
+                            turn_task.cancel()
+                            logger.info("[Voice] Barge-in interrupt received, cancelling the turn pipeline.")
+                        else:
+                            logger.info("[Voice] Barge-in interrupt received.")
+                        if turn_trace is not None:
+                            turn_trace.finish("interrupted")
+                            turn_trace = None
                         await _send(websocket, {"type": "clear"}, ws_lock)
                         await _send(websocket, {
                             "type": "status",
@@ -231,6 +556,10 @@ class VoiceConnectionManager:
 
                 # ── Binary Audio Chunks ───────────────────────────
                 elif "bytes" in message:
+                    if turn_task is not None:
+                        # The previous answer is still being handled (its audio is a
+                        # view into audio_buffer, which must not refill until then)
+                        continue
                     if ai_is_speaking:
                         if time.time() - ai_speak_start_time > ai_speak_expected_duration:
                             logger.info("[Voice] Server-side fallback: audio_done timeout reached. Ungating mic.")
@@ -249,42 +578,39 @@ class VoiceConnectionManager:
                     if len(chunk) == 0:
                         continue
 
-                    audio_arr = np.frombuffer(chunk, dtype=np.int16).astype(np.float32)
-                    rms = float(np.sqrt(np.mean(audio_arr ** 2)))
-
-                    # Update ambient noise estimate only during silence
-                    if not is_speaking:
-                        ambient_energy = AMBIENT_ALPHA * ambient_energy + (1 - AMBIENT_ALPHA) * rms
-
-                    # Dynamic threshold: must be significantly louder than background
-                    dynamic_threshold = max(ENERGY_THRESHOLD, ambient_energy * 3.0)
-
-                    if rms > dynamic_threshold:
+                    event = vad.process(chunk)
+                    if event == "start":
                         # ── Speech detected ───────────────────────
-                        if not is_speaking:
-                            is_speaking = True
-                            silence_frames = 0
-                            logger.info(f"[Voice] Speech start | rms={rms:.0f} | ambient={ambient_energy:.0f} | threshold={dynamic_threshold:.0f}")
-                            await _send(websocket, {
-                                "type": "status",
-                                "message": "Listening to you...",
-                                "state": "listening"
-                            }, ws_lock)
-                        silence_frames = 0
-                        audio_buffer.extend(chunk)
-
-                    elif is_speaking:
-                        # ── Silence frames during speech window ───
-                        silence_frames += 1
-                        audio_buffer.extend(chunk)
+                        logger.info("[Voice] Speech start | %s", vad.describe())
+                        await _send(websocket, {
+                            "type": "status",
+                            "message": "Listening to you...",
+                            "state": "listening"
+                        }, ws_lock)
 
-                        if silence_frames >= SILENCE_THRESHOLD:
+                    if vad.speaking or event == "end":
+                        # Speech and the pauses within it both belong to the utterance
+                        audio_buffer.append(chunk)
+                        silence_ms = vad.trailing_silence_ms
+                        transcript = None
+                        if transcriber:
+                            # The partial only counts if it was decoded up to where the pause began
+                            speech_end = len(audio_buffer) - int(silence_ms * SAMPLE_RATE / 1000)
+                            transcript = transcriber.transcript_through(speech_end)
+                            transcriber.feed(audio_buffer, force=transcript is None and silence_ms >= ENDPOINT_PROBE_MS)
+
+                        if event == "end":
+                            endpointer.hangover_reached()
+                        elif silence_ms and endpointer.should_end(silence_ms, transcript):
+                            vad.reset()
+                            event = "end"
+
+                        if event == "end":
                             # ── End of utterance ──────────────────
-                            is_speaking = False
-                            silence_frames = 0
-                            final_audio = bytes(audio_buffer)
+                            # A view, not a copy: mic audio is dropped while the turn task runs
+                            final_audio = audio_buffer.view()
+                            logger.info("[Voice] Utterance end | buffer=%s samples (%.1fs)", len(final_audio), audio_buffer.seconds)
                             audio_buffer.clear()
-                            logger.info(f"[Voice] Utterance end | buffer={len(final_audio)} bytes")
 
                             await _send(websocket, {
                                 "type": "status",
@@ -292,120 +618,17 @@ class VoiceConnectionManager:
                                 "state": "processing"
                             }, ws_lock)
 
-                            # ── Per-turn try/except: errors here should NOT kill the session ──
-                            # Each turn is isolated so a transient API error just skips that turn.
-                            try:
-                                # Run Whisper in a thread (blocking, CPU-bound)
-                                # The keepalive task keeps the WS alive during this
-                                logger.info("[Voice] Starting transcription...")
-                                t_stt = time.time()
-                                transcription = await asyncio.to_thread(self._transcribe, final_audio)
-                                stt_elapsed = round(time.time() - t_stt, 2)
-                                logger.info(f"[Voice] Transcription ({stt_elapsed}s): '{transcription}'")
-
-                                if not transcription.strip():
-                                    logger.info("[Voice] Empty transcription (noise). Resuming listen.")
-                                    await _send(websocket, {
-                                        "type": "status",
-                                        "message": "Didn't catch that. Please speak again.",
-                                        "state": "listening"
-                                    }, ws_lock)
-                                    continue
-
-                                # Send transcription to frontend chat
-                                await _send(websocket, {"type": "text", "role": "user", "text": transcription.strip()}, ws_lock)
-
-                                await _send(websocket, {
-                                    "type": "status",
-                                    "message": "AI is thinking...",
-                                    "state": "thinking"
-                                }, ws_lock)
-
-                                # ── Invoke LangGraph Planner ──────────────────
-                                logger.info("[Voice] Invoking LangGraph planner...")
-                                t_llm = time.time()
-                                try:
-                                    graph_result = await asyncio.wait_for(
-                                        asyncio.to_thread(
-                                            interview_graph.invoke,
-                                            {"messages": [{"role": "user", "content": transcription.strip()}]},
-                                            graph_config,
-                                        ),
-                                        timeout=45.0,
-                                    )
-                                    final_graph_state = graph_result
-                                except asyncio.TimeoutError:
-                                    logger.error("[Voice] LangGraph timed out after 45s.")
-                                    graph_result = None
-
-                                llm_elapsed = round(time.time() - t_llm, 2)
-
-                                if graph_result:
-                                    ai_response = graph_result["messages"][-1]["content"]
-                                    interview_ended = graph_result.get("is_complete", False)
-                                    route = graph_result.get("route", "unknown")
-                                    logger.info(
-                                        f"[Voice] Turn complete ({llm_elapsed}s) | route={route} | "
-                                        f"score={graph_result.get('current_topic_score', '?')} | "
-                                        f"topic_idx={graph_result.get('current_topic_index')} | "
-                                        f"topic_turn={graph_result.get('current_topic_turn')} | "
-                                        f"response='{ai_response[:80]}...'"
-                                    )
-                                else:
-                                    ai_response = "I'm sorry, I took too long to process that. Could you repeat your answer?"
-                                    interview_ended = False
-                                    logger.warning("[Voice] Using fallback response due to timeout.")
-
-                                # Guard against None/empty response
-                                if not ai_response or not ai_response.strip():
-                                    logger.warning("[Voice] AI response was empty, using fallback.")
-                                    ai_response = "Thank you for sharing that. Could you tell me more about your technical background?"
-
-                                await _send(websocket, {"type": "text", "role": "ai", "text": ai_response}, ws_lock)
-
-                                # Gate mic before sending audio
-                                ai_is_speaking = True
-                                ai_speak_start_time = time.time()
-                                ai_speak_expected_duration = len(ai_response) / 10.0 + 5.0
-                                success = await self._speak_and_send(websocket, ai_response, ws_lock)
-                                if not success:
-                                    logger.warning("[Voice] TTS failed, immediately ungating microphone.")
-                                    ai_is_speaking = False
-                                    await _send(websocket, {
-                                        "type": "status",
-                                        "message": "Your turn -- please speak now",
-                                        "state": "listening"
-                                    }, ws_lock)
-
-                                if interview_ended:
-                                    logger.info("[Voice] Interview complete (route=end). Closing session.")
-                                    await _send(websocket, {
-                                        "type": "interview_complete",
-                                        "message": "Interview complete! Thank you for participating."
-                                    }, ws_lock)
-                                    break  # Exit the main message loop
-
-                            except asyncio.CancelledError:
-                                raise  # Let CancelledError propagate (session shutdown)
-                            except Exception as turn_error:
-                                logger.error(f"[Voice] Per-turn error: {type(turn_error).__name__}: {turn_error}", exc_info=True)
-                                # Recover gracefully: notify the user and resume listening
-                                try:
-                                    recovery_msg = "I encountered a brief technical issue. Let's continue -- could you please repeat or rephrase your last answer?"
-                                    ai_is_speaking = True
-                                    ai_speak_start_time = time.time()
-                                    ai_speak_expected_duration = len(recovery_msg) / 10.0 + 5.0
-                                    success = await self._speak_and_send(websocket, recovery_msg, ws_lock)
-                                    if not success:
-                                        ai_is_speaking = False
-                                except Exception:
-                                    # If even the recovery fails, just reset state and keep listening
-                                    ai_is_speaking = False
-                                    await _send(websocket, {
-                                        "type": "status",
-                                        "message": "Technical issue. Please speak again.",
-                                        "state": "listening"
-                                    }, ws_lock)
+                            # The turn's trace starts where the candidate stopped speaking
+                            if turn_trace is not None:
+                                turn_trace.finish("no_audio_done")
+                            turn_count += 1
+                            speech_ended_at = time.perf_counter() - silence_ms / 1000
+                            turn_trace = tracer.start_turn(thread_id, turn_count, start=speech_ended_at, kind="answer")
+                            turn_trace.add_span(
+                                "endpoint", speech_ended_at,
+                                silence_ms=round(silence_ms), voiced_s=round(vad.voiced_seconds, 2),
+                            )
+                            turn_task = asyncio.create_task(run_turn(final_audio, turn_trace))
 
         except WebSocketDisconnect:
             logger.info("[Voice] WebSocket disconnected by client.")
@@ -414,9 +637,9 @@ class VoiceConnectionManager:
             if "disconnect" in str(e).lower():
                 logger.info("[Voice] WebSocket disconnected (RuntimeError).")
             else:
-                logger.error(f"[Voice] Session RuntimeError: {e}")
+                logger.error("[Voice] Session RuntimeError: %s", e)
         except Exception as e:
-            logger.error(f"[Voice] Session error: {type(e).__name__}: {e}", exc_info=True)
+            logger.error("[Voice] Session error: %s: %s", type(e).__name__, e, exc_info=True)
         finally:
             # Stop the keepalive heartbeat
             stop_keepalive.set()
@@ -425,6 +648,19 @@ class VoiceConnectionManager:
                 await keepalive_task
             except asyncio.CancelledError:
                 pass
+            for task in (turn_task, receive_task):
+                if task is not None and not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except (asyncio.CancelledError, Exception):
+                        pass
+            checkpoint_retention.session_ended(thread_id)
+            if turn_trace is not None:
+                turn_trace.finish("disconnected")
+            if transcriber:
+                transcriber.cancel()
+            logger.info("[Voice] Session metrics | endpointer=%s", endpointer.stats())
 
             # Determine message count for evaluation
             msg_count = 0
@@ -434,7 +670,7 @@ class VoiceConnectionManager:
                 eval_messages = final_graph_state.get("messages", [])
                 eval_notes = final_graph_state.get("evaluation_notes", [])
                 msg_count = len(eval_messages)
-            logger.info(f"[Voice] Session ended | messages={msg_count} | eval_notes={len(eval_notes)}")
+            logger.info("[Voice] Session ended | messages=%s | eval_notes=%s", msg_count, len(eval_notes))
 
             if msg_count > 2:
                 logger.info("[Voice] Running evaluation in background thread...")
@@ -457,61 +693,248 @@ class VoiceConnectionManager:
                             eval_path = os.path.join(EVAL_DIR, f"job_{job_id}_candidate_{candidate_id}.json")
                             with open(eval_path, "w") as f:
                                 json.dump(report, f, indent=4)
-                            logger.info(f"[Voice/Eval] Evaluation saved: {eval_path}")
-                            logger.info(f"[Voice/Eval]   Verdict: {report.get('verdict')} | Tech: {report.get('technical_score')} | Behavioral: {report.get('behavioral_score')}")
+                            logger.info("[Voice/Eval] Evaluation saved: %s", eval_path)
+                            logger.info("[Voice/Eval]   Verdict: %s | Tech: %s | Behavioral: %s", report.get('verdict'), report.get('technical_score'), report.get('behavioral_score'))
+                            # Evaluation is on disk — a finished interview's checkpoints are no longer needed
+                            if final_graph_state.get("is_complete"):
+                                checkpoint_retention.release([thread_id])
                     except Exception as ex:
-                        logger.error(f"[Voice/Eval] Evaluation FAILED: {type(ex).__name__}: {ex}")
+                        logger.error("[Voice/Eval] Evaluation FAILED: %s: %s", type(ex).__name__, ex)
 
                 threading.Thread(target=run_eval, daemon=False).start()
 
-    def _transcribe(self, audio_bytes: bytes) -> str:
-        """Convert raw PCM bytes -> WAV -> Whisper transcription."""
+    async def _resume_thread(
+        self,
+        websocket: WebSocket,
+        graph_config: dict,
+        lock: Optional[asyncio.Lock] = None,
+    ) -> tuple[Optional[dict], bool]:
+        """
+        Pick a checkpointed interview back up after a reconnect or restart.
+        If the last turn was cut off mid-graph, it is finished first (astream
+        with None input continues from the latest checkpoint); otherwise the
+        last question is repeated so the candidate knows where they were.
+        Returns (graph state, whether any audio was sent) like _run_graph_and_speak.
+        """
+        snapshot = await interview_graph.aget_state(graph_config)
+        if snapshot.next:
+            logger.info("[Voice] Resuming interrupted turn at %s", snapshot.next)
+            return await self._run_graph_and_speak(websocket, None, graph_config, lock)
+
+        state = dict(snapshot.values)
+        candidate_name = (await interview_context.aget(state.get("context_id", ""))).get("candidate_name", "there")
+        last_question = next(
+            (m["content"] for m in reversed(state["messages"]) if m.get("role") == "model"), ""
+        )
+        logger.info("[Voice] Resuming after %s messages | topic_idx=%s", len(state['messages']), state.get('current_topic_index'))
+        # Only the returned copy is changed — the checkpoint keeps the original message
+        state["messages"] = state["messages"] + [{
+            "role": "model",
+            "content": f"Welcome back, {candidate_name}! Let's pick up where we left off. {last_question}",
+        }]
+        return state, False
+
+    async def _run_graph_and_speak(
+        self,
+        websocket: WebSocket,
+        graph_input: dict,
+        graph_config: dict,
+        lock: Optional[asyncio.Lock] = None,
+    ) -> tuple[Optional[dict], bool]:
+        """
+        Run one graph turn via astream as the head of the turn pipeline:
+
+          graph (planner sentences) → sentence queue → synthesis stage
+                                    → clip queue → sender (_speak_stream)
+
+        Every stage starts on the first unit its upstream produces, and the
+        queues are bounded, so a slow stage holds back the ones before it
+        instead of letting work pile up. Cancelling this coroutine (barge-in,
+        timeout, disconnect) cancels every stage.
+        Returns (final graph state, whether any audio was sent).
+        """
+        # Nodes read the static context synchronously; load it off the loop first
+        await interview_context.aget((graph_input or {}).get("context_id") or graph_config["configurable"]["thread_id"])
+
+        sentences: asyncio.Queue = asyncio.Queue(maxsize=SENTENCE_QUEUE_SIZE)
+        speak_task = asyncio.create_task(self._speak_stream(websocket, sentences, lock))
+        final_state = None
         try:
-            wav_io = io.BytesIO()
-            with wave.open(wav_io, 'wb') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)   # 16-bit
-                wf.setframerate(16000)
-                wf.writeframes(audio_bytes)
-            wav_io.seek(0)
-
-            # vad_filter=True uses Whisper's built-in speech activity detection
-            # to skip silent/noise-only segments before attempting transcription
-            segments, _ = whisper_model.transcribe(
-                wav_io,
-                beam_size=1,
-                vad_filter=True,
-                vad_parameters={"min_silence_duration_ms": 400}
+            with span("graph"):
+                async for mode, chunk in interview_graph.astream(
+                    graph_input, graph_config, stream_mode=["custom", "values"]
+                ):
+                    if mode == "custom" and chunk.get("type") == "sentence":
+                        await sentences.put((chunk["text"], chunk.get("cacheable", False)))
+                    elif mode == "values":
+                        final_state = chunk
+            await sentences.put(None)
+            audio_sent = await speak_task
+        except BaseException:
+            speak_task.cancel()
+            raise
+        return final_state, audio_sent
+
+    async def _speak_stream(self, websocket: WebSocket, sentences: asyncio.Queue, lock: Optional[asyncio.Lock] = None) -> bool:
+        """
+        Sender stage for a queue of (sentence, cacheable) pairs ending in None.
+        The synthesis stage runs up to TTS_LOOKAHEAD sentences ahead; clips
+        still go out in sentence order, chunk by chunk, then 'audio_end'.
+        """
+        with span("speak"):
+            clips: asyncio.Queue = asyncio.Queue(maxsize=TTS_LOOKAHEAD)
+            synthesizing: set = set()
+            upstream_done = asyncio.Event()
+            tts_task = asyncio.create_task(self._synthesis_stage(sentences, clips, synthesizing, upstream_done))
+
+            def stop():
+                tts_task.cancel()
+                for task in list(synthesizing):
+                    task.cancel()
+
+            sent_any = False
+            try:
+                while True:
+                    item = await clips.get()
+                    if item is None:
+                        break
+                    if not sent_any:
+                        await _send(websocket, {
+                            "type": "status",
+                            "message": "AI is preparing to speak...",
+                            "state": "speaking"
+                        }, lock)
+                    if await self._send_clip(websocket, *item, lock=lock):
+                        sent_any = True
+            except asyncio.CancelledError:
+                # Whoever cancelled resets the client ('clear' on barge-in)
+                stop()
+                raise
+            except Exception as e:
+                logger.error("[Voice] Streaming TTS error: %s", e)
+                stop()
+                # Keep taking sentences so the graph is never blocked on a full
+                # queue — unless the synthesis stage already took the final None
+                if not upstream_done.is_set():
+                    while await sentences.get() is not None:
+                        pass
+
+            if sent_any:
+                await _send(websocket, {"type": "audio_end"}, lock)
+                mark("audio_end")
+            return sent_any
+
+    async def _synthesis_stage(
+        self,
+        sentences: asyncio.Queue,
+        clips: asyncio.Queue,
+        synthesizing: set,
+        upstream_done: asyncio.Event,
+    ):
+        """
+        TTS stage: start synthesizing each sentence as soon as it arrives and
+        pass (clip id, text, chunk queue) on to the sender in sentence order.
+        The bounded clip queue is what limits how far synthesis runs ahead.
+        Sets `upstream_done` once it has taken the closing None.
+        """
+        while True:
+            item = await sentences.get()
+            if item is None:
+                upstream_done.set()
+                break
+            text, cacheable = item
+            chunks: asyncio.Queue = asyncio.Queue(maxsize=CLIP_QUEUE_CHUNKS)
+            await clips.put((next(_clip_ids), text, chunks))
+            task = asyncio.create_task(self._synthesize_clip(text, cacheable, chunks))
+            synthesizing.add(task)
+            task.add_done_callback(synthesizing.discard)
+        await clips.put(None)
+
+    async def _synthesize_clip(self, text: str, cacheable: bool, chunks: asyncio.Queue):
+        """
+        Run TTS for one piece of text, putting each MP3 chunk on `chunks`
+        as soon as it is yielded, then None. Cached audio is a single chunk;
+        a cacheable miss is stored once the clip has streamed completely.
+        """
+        with span("tts", chars=len(text), cacheable=cacheable) as tts_span:
+            try:
+                cached = await tts_cache.aget(TTS_VOICE, text) if TTS_CACHE_ENABLED else None
+                tts_span.set(cached=bool(cached))
+                if cached:
+                    logger.debug("[Voice] TTS cache hit: %s bytes | '%s...'", len(cached), text[:40])
+                    await chunks.put(cached)
+                else:
+                    keep = bytearray() if TTS_CACHE_ENABLED and cacheable else None
+                    async for chunk in communicate(text, TTS_VOICE).stream():
+                        if chunk["type"] != "audio" or not chunk["data"]:
+                            continue
+                        if not tts_span.events:
+                            tts_span.event("first_byte")
+                            TTS_FIRST_BYTE_SECONDS.observe(time.perf_counter() - tts_span.start)
+                        await chunks.put(chunk["data"])
+                        if keep is not None:
+                            keep.extend(chunk["data"])
+                    if keep:
+                        await asyncio.to_thread(tts_cache.put, TTS_VOICE, text, bytes(keep))
+                TTS_SECONDS.labels("true" if cached else "false").observe(time.perf_counter() - tts_span.start)
+            except Exception as e:
+                # Whatever was already queued still plays; the clip just ends early
+                tts_span.set(error=type(e).__name__)
+                logger.error("[Voice] TTS error for '%s...': %s", text[:40], e)
+        await chunks.put(None)
+
+    async def _send_clip(
+        self,
+        websocket: WebSocket,
+        clip: int,
+        text: str,
+        chunks: asyncio.Queue,
+        lock: Optional[asyncio.Lock] = None,
+    ) -> int:
+        """Forward one clip's chunks as binary frames, closed by a FRAME_CLIP_END frame. Returns the bytes sent."""
+        t0 = time.time()
+        first_audio = None
+        seq = 0
+        sent = 0
+        while True:
+            data = await chunks.get()
+            if data is None:
+                break
+            if first_audio is None:
+                first_audio = time.time() - t0
+                mark("first_audio")
+            await _send_audio_frame(websocket, clip, seq, data, lock=lock)
+            seq += 1
+            sent += len(data)
+        if seq:
+            await _send_audio_frame(websocket, clip, seq, b"", end=True, lock=lock)
+            logger.info(
+                "[Voice] Sent clip %s: %s bytes in %s frames | first audio after %.2fs | '%s...'",
+                clip, sent, seq, first_audio, text[:40],
             )
-            return " ".join(seg.text for seg in segments).strip()
-        except Exception as e:
-            logger.error(f"[Voice] Transcription error: {e}")
-            return ""
+        return sent
 
-    async def _speak_and_send(self, websocket: WebSocket, text: str, lock: Optional[asyncio.Lock] = None) -> bool:
+    async def _speak_and_send(
+        self,
+        websocket: WebSocket,
+        text: str,
+        lock: Optional[asyncio.Lock] = None,
+        cacheable: bool = False,
+    ) -> bool:
         """
-        Generate TTS audio, collect ALL chunks, send as ONE payload.
-        The 'speaking_done' signal is embedded in the audio message so
-        the client knows when to signal 'audio_done' back after playback.
+        Stream TTS audio for one message as a single clip, then 'audio_end'
+        so the client knows when to signal 'audio_done' back after playback.
+        Used for text that was not streamed by the planner (fallbacks, recovery).
+        Pass cacheable=True only for fixed messages — a free-form LLM reply
+        would just push pre-warmed lines out of the TTS cache.
         """
         try:
-            await _send(websocket, {
-                "type": "status",
-                "message": "AI is preparing to speak...",
-                "state": "speaking"
-            }, lock)
-            logger.debug(f"[Voice] Generating TTS for: '{text[:60]}...'")
-
-            communicate = edge_tts.Communicate(text, "en-US-ChristopherNeural")
-            full_audio = bytearray()
-            async for chunk in communicate.stream():
-                if chunk["type"] == "audio":
-                    full_audio.extend(chunk["data"])
-
-            if full_audio:
-                b64 = base64.b64encode(full_audio).decode("utf-8")
-                await _send(websocket, {"type": "audio", "data": b64}, lock)
-                logger.info(f"[Voice] Audio sent: {len(full_audio)} bytes")
+            logger.debug("[Voice] Generating TTS for: '%s...'", text[:60])
+            sentences: asyncio.Queue = asyncio.Queue()
+            sentences.put_nowait((text, cacheable))
+            sentences.put_nowait(None)
+
+            if await self._speak_stream(websocket, sentences, lock):
                 return True
             else:
                 logger.warning("[Voice] Warning: TTS produced no audio. Sending speaking_done anyway.")
@@ -523,7 +946,7 @@ class VoiceConnectionManager:
             await _send(websocket, {"type": "speaking_done"}, lock)
             raise
         except Exception as e:
-            logger.error(f"[Voice] TTS error: {e}")
+            logger.error("[Voice] TTS error: %s", e)
             # Even on error, ungate the microphone
             await _send(websocket, {"type": "speaking_done"}, lock)
             return False
@@ -538,6 +961,9 @@ async def handle_voice_session(
     candidate_details: dict,
     resume_profile: dict,
     question_file: dict,
+    resume_thread_id: Optional[str] = None,
 ):
-    """Entry point called from main.py WebSocket handler."""
-    await manager.handle_session(websocket, job_details, candidate_details, resume_profile, question_file)
+    """Entry point called from main.py WebSocket handler, once the session is admitted."""
+    await manager.handle_session(
+        websocket, job_details, candidate_details, resume_profile, question_file, resume_thread_id
+    )
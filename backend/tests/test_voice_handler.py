@@ -0,0 +1,66 @@
+"""
+Error paths of the voice handler's speak pipeline.
+
+Runs offline: fake TTS, no TTS cache, in-process STT (never loaded here).
+"""
+
+import os
+
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ.setdefault("TTS_PROVIDER", "fake")
+os.environ.setdefault("TTS_CACHE_ENABLED", "0")
+os.environ.setdefault("STT_WORKERS", "0")
+
+import json
+import asyncio
+
+from backend.services.voice_handler import VoiceConnectionManager
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.messages = []
+
+    async def send_text(self, text: str):
+        self.messages.append(json.loads(text))
+
+    async def send_bytes(self, data: bytes):
+        pass
+
+
+class FailingSendManager(VoiceConnectionManager):
+    async def _send_clip(self, *args, **kwargs) -> int:
+        raise RuntimeError("socket closed")
+
+
+def test_speak_and_send_returns_when_send_clip_fails():
+    """The pre-filled queue's None is taken by the synthesis stage; the sender must not wait for it again."""
+    ws = RecordingWebSocket()
+
+    async def run():
+        return await asyncio.wait_for(FailingSendManager()._speak_and_send(ws, "Hello there."), timeout=5)
+
+    assert asyncio.run(run()) is False
+    assert ws.messages[-1] == {"type": "speaking_done"}
+
+
+def test_speak_stream_drains_a_live_producer_after_send_failure():
+    """While the producer is still running, the sender keeps taking sentences so it never blocks."""
+
+    async def run():
+        sentences: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+        async def produce():
+            for i in range(5):
+                await sentences.put((f"Sentence {i}.", False))
+                await asyncio.sleep(0.01)
+            await sentences.put(None)
+
+        producer = asyncio.create_task(produce())
+        sent_any = await asyncio.wait_for(
+            FailingSendManager()._speak_stream(RecordingWebSocket(), sentences), timeout=5
+        )
+        await asyncio.wait_for(producer, timeout=5)
+        return sent_any
+
+    assert asyncio.run(run()) is False
@@ -0,0 +1 @@
+# backend/tools — load-testing and benchmarking utilities (the app only loads fake_providers, and only when selected)
@@ -0,0 +1,269 @@
+"""
+Offline stand-ins for the LLM and TTS providers, for benchmarks that must
+not depend on Groq's or edge-tts's latency of the day (or spend quota).
+
+  - Fake LLM:  a local HTTP server speaking Groq's chat-completions API
+               (/openai/v1/chat/completions, JSON and SSE streaming) with a
+               fixed time to first token, a fixed token rate and optional
+               429 injection (with Retry-After). Replies are canned per
+               prompt kind — grader, followup designer, planner, resume
+               profile, question file, evaluation — so every run sees the
+               same conversation
+
+        python -m backend.tools.fake_providers --port 8790 --latency 0.3 \\
+            --tokens-per-second 250 --rate-limit-prob 0.05
+
+               and start the backend with LLM_PROVIDER=fake (FAKE_LLM_URL
+               defaults to http://127.0.0.1:8790). If the in-process
+               rate limiter is on (LLM_RATE_LIMIT_ENABLED=1), raise its
+               quotas with LLM_RATE_LIMITS to measure the backend rather
+               than the quota
+
+  - Fake TTS:  FakeCommunicate, a drop-in for edge_tts.Communicate that
+               streams deterministic silent MP3 (24 kHz mono, 48 kbit/s, like
+               edge-tts) — about 1 s of audio per FAKE_TTS_CHARS_PER_SECOND
+               characters — after FAKE_TTS_LATENCY seconds, at
+               FAKE_TTS_RTF × real time (0.1 = ten times faster than
+               playback). Selected in-process with TTS_PROVIDER=fake
+
+Both are meant for load_test.py runs; nothing here is used unless selected.
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import logging
+from typing import AsyncIterator, List
+
+logger = logging.getLogger("interviewer.fake_providers")
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FAKE TTS
+# ══════════════════════════════════════════════════════════════════════════════
+
+FAKE_TTS_LATENCY = float(os.environ.get("FAKE_TTS_LATENCY", "0.15"))
+FAKE_TTS_RTF = float(os.environ.get("FAKE_TTS_RTF", "0.1"))
+FAKE_TTS_CHARS_PER_SECOND = float(os.environ.get("FAKE_TTS_CHARS_PER_SECOND", "15"))
+
+# One MPEG-2 Layer III frame: 24 kHz, 48 kbit/s, mono, no CRC — 576 samples
+# (24 ms) in 144 bytes. An all-zero payload decodes as silence.
+MP3_FRAME = bytes([0xFF, 0xF3, 0x64, 0xC0]) + bytes(140)
+MP3_FRAME_SECONDS = 576 / 24000
+# edge-tts hands out audio in chunks of roughly this many frames
+FRAMES_PER_CHUNK = 20
+
+
+class FakeCommunicate:
+    """Same constructor and stream() shape as edge_tts.Communicate."""
+
+    def __init__(self, text: str, voice: str = "", *args, **kwargs):
+        self.text = text
+        self.voice = voice
+
+    async def stream(self) -> AsyncIterator[dict]:
+        seconds = max(0.5, len(self.text.strip()) / FAKE_TTS_CHARS_PER_SECOND)
+        frames = int(seconds / MP3_FRAME_SECONDS)
+        await asyncio.sleep(FAKE_TTS_LATENCY)
+        for start in range(0, frames, FRAMES_PER_CHUNK):
+            n = min(FRAMES_PER_CHUNK, frames - start)
+            if FAKE_TTS_RTF > 0:
+                await asyncio.sleep(n * MP3_FRAME_SECONDS * FAKE_TTS_RTF)
+            yield {"type": "audio", "data": MP3_FRAME * n}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FAKE LLM — canned replies
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _prompt_text(messages: list, role: str) -> str:
+    return "\n".join(m.get("content") or "" for m in messages if m.get("role") == role)
+
+
+def _hr_topics(user_prompt: str) -> List[dict]:
+    return [
+        {"topic": name, "threshold": int(threshold), "primary_question": f"Can you walk me through your experience with {name}?"}
+        for name, threshold in re.findall(r'- Topic: "(.+?)" \(threshold: (\d+)/10\)', user_prompt)
+    ]
+
+
+def canned_reply(messages: list) -> str:
+    """A fixed reply for each kind of prompt the backend sends."""
+    system = _prompt_text(messages, "system")
+    user = _prompt_text(messages, "user")
+
+    if "interview grader" in system:
+        return json.dumps({
+            "score": 7,
+            "reasoning": "Covers the key points with a concrete example, though trade-offs are only touched on.",
+            "followup_question": "What trade-offs did you weigh when you chose that approach?",
+        })
+    if "question designer" in system:
+        return json.dumps({"question": "How would you measure whether that change actually helped?"})
+    if "conducting a live voice interview" in system:
+        text = (
+            "Thanks, that's a clear answer. "
+            "Let's build on that a little. "
+            "Could you tell me about a time you had to make a system faster under real load?"
+        )
+        return json.dumps({"response_text": text}) if "respond in JSON" in system else text
+    if "resume analyzer" in system:
+        return json.dumps({
+            "name": "Load Test Candidate",
+            "skills": ["Python", "FastAPI", "SQL", "Docker", "Redis"],
+            "experience_years": 4,
+            "past_roles": ["Backend Engineer at Example Corp (3 years)"],
+            "education": "B.Sc. Computer Science",
+        })
+    if "designing interview questions" in system:
+        topics = _hr_topics(user) or [
+            {"topic": "Python", "threshold": 6, "primary_question": "How do you structure a large Python service?"},
+            {"topic": "Databases", "threshold": 6, "primary_question": "How would you diagnose a slow SQL query?"},
+            {"topic": "System Design", "threshold": 7, "primary_question": "How would you design a rate limiter?"},
+            {"topic": "Teamwork", "threshold": 5, "primary_question": "Tell me about a disagreement on your team and how it was resolved."},
+        ]
+        return json.dumps({"topics": topics})
+    if "technical recruiter" in system:
+        return json.dumps({
+            "technical_score": 7.0,
+            "behavioral_score": 7.5,
+            "confidence_score": 7.0,
+            "summary": "The candidate gave structured answers with relevant examples.",
+            "strengths": ["Clear communication", "Practical experience"],
+            "weaknesses": ["Limited depth on trade-offs"],
+            "verdict": "Hire",
+            "per_topic_breakdown": [],
+        })
+    return json.dumps({"response_text": "OK."}) if "JSON" in system else "OK."
+
+
+def split_tokens(text: str) -> List[str]:
+    """Word-sized pieces that concatenate back to `text`."""
+    return re.findall(r"\S+\s*|\s+", text)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FAKE LLM — HTTP server
+# ══════════════════════════════════════════════════════════════════════════════
+
+def create_llm_app(
+    latency: float = 0.3,
+    tokens_per_second: float = 250.0,
+    rate_limit_prob: float = 0.0,
+    retry_after: float = 1.0,
+    seed: int = 0,
+):
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse, StreamingResponse
+
+    app = FastAPI(title="Fake Groq")
+    rng = random.Random(seed)
+    counters = {"requests": 0, "streamed": 0, "rate_limited": 0}
+
+    def token_delay() -> float:
+        return 1.0 / tokens_per_second if tokens_per_second > 0 else 0.0
+
+    @app.get("/stats")
+    async def stats():
+        return counters
+
+    @app.post("/openai/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        counters["requests"] += 1
+        if rate_limit_prob and rng.random() < rate_limit_prob:
+            counters["rate_limited"] += 1
+            return JSONResponse(
+                status_code=429,
+                headers={"retry-after": str(retry_after)},
+                content={"error": {
+                    "message": f"Rate limit reached for model `{body.get('model')}` (injected)",
+                    "type": "tokens",
+                    "code": "rate_limit_exceeded",
+                }},
+            )
+
+        messages = body.get("messages", [])
+        model = body.get("model", "fake")
+        tokens = split_tokens(canned_reply(messages))
+        max_tokens = body.get("max_tokens")
+        if max_tokens:
+            tokens = tokens[:max_tokens]
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        usage = {
+            "prompt_tokens": sum(len(m.get("content") or "") for m in messages) // 4,
+            "completion_tokens": len(tokens),
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if not body.get("stream"):
+            await asyncio.sleep(latency + len(tokens) * token_delay())
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(tokens)},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            }
+
+        counters["streamed"] += 1
+
+        def chunk(delta: dict, finish_reason=None, **extra) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra,
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        async def events():
+            await asyncio.sleep(latency)
+            yield chunk({"role": "assistant", "content": ""})
+            for token in tokens:
+                yield chunk({"content": token})
+                await asyncio.sleep(token_delay())
+            yield chunk({}, "stop", x_groq={"usage": usage})
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fake Groq chat-completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--latency", type=float, default=0.3, help="time to first token (s)")
+    parser.add_argument("--tokens-per-second", type=float, default=250.0, help="output token rate (0 = instant)")
+    parser.add_argument("--rate-limit-prob", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After sent with a 429 (s)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for 429 injection")
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    logger.info(
+        "[FakeLLM] Listening on %s:%s | latency=%ss | tokens/s=%s | 429 prob=%s",
+        args.host, args.port, args.latency, args.tokens_per_second, args.rate_limit_prob,
+    )
+    app = create_llm_app(args.latency, args.tokens_per_second, args.rate_limit_prob, args.retry_after, args.seed)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+"""
+Synthetic-load harness — drives N concurrent voice interviews against a
+running backend and reports turn latency.
+
+    python -m backend.tools.load_test --job-id 1 --levels 1,2,4,8 --turns 4
+
+Each virtual candidate signs up, applies, prepares the interview (uploading
+--resume, or a generated one-page PDF) and then talks to
+/api/ws/interview/{job_id} the way the browser does:
+
+  - Mic:       16 kHz int16 PCM in 4096-sample frames at real-time pace —
+               the answer (--audio, any format faster-whisper can decode, or
+               a synthetic voiced signal) followed by silence; nothing is
+               sent while the reply is "playing"
+  - Playback:  a reply lasts as long as its MP3 bytes take at edge-tts's
+               48 kbit/s, counted from its first frame; then 'audio_done'
+  - Latency:   per turn, from the last voiced frame to the end-of-turn
+               status ('processing'), to the first audio frame, and to
+               'audio_end'
+
+Each concurrency level in --levels is one wave of sessions. The report has
+p50/p95/p99 of each latency per level, and sessions per core: the highest
+level whose p95 first-audio latency stays within --slo, divided by the
+backend's cores (--cores, default this machine's).
+
+Whisper seldom finds words in the synthetic signal, so those turns mostly
+end as "Didn't catch that" and are counted as empty — they load VAD and STT
+but not the graph. Pass --audio with recorded speech for full turns.
+
+For repeatable numbers, run the backend against the offline stand-ins in
+fake_providers.py (LLM_PROVIDER=fake TTS_PROVIDER=fake) so Groq and edge-tts
+latency drop out of the measurement.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import asyncio
+import argparse
+import logging
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional
+
+import numpy as np
+import httpx
+
+try:
+    import websockets
+except ImportError:  # only this tool needs a WebSocket client
+    websockets = None
+
+logger = logging.getLogger("interviewer.loadtest")
+
+SAMPLE_RATE = 16000
+# The browser's ScriptProcessor hands over 4096 samples (~256 ms) at a time
+FRAME_SAMPLES = 4096
+FRAME_SECONDS = FRAME_SAMPLES / SAMPLE_RATE
+# edge-tts streams 24 kHz mono MP3 at 48 kbit/s
+TTS_BYTES_PER_SECOND = 6000
+AUDIO_FRAME_HEADER = 8
+
+SILENCE = np.zeros(FRAME_SAMPLES, dtype=np.int16).tobytes()
+
+
+# ── Inputs ────────────────────────────────────────────────────────────────────
+
+def synthetic_answer(seconds: float, seed: int = 0) -> np.ndarray:
+    """Voice-like int16 signal: a gliding 110-150 Hz harmonic stack with a ~4 Hz syllable envelope."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    f0 = 130 + 20 * np.sin(2 * np.pi * 0.4 * t + rng.uniform(0, np.pi))
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    syllables = (0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(3.5, 4.5) * t)) ** 2
+    signal = voice * (0.15 + 0.85 * syllables) / 2.3 + rng.normal(0, 0.01, len(t))
+    return (np.clip(signal, -1, 1) * 12000).astype(np.int16)
+
+
+def load_answer(path: str) -> np.ndarray:
+    from faster_whisper import decode_audio
+    audio = decode_audio(path, sampling_rate=SAMPLE_RATE)
+    return (np.clip(audio, -1, 1) * 32767).astype(np.int16)
+
+
+def minimal_pdf(text: str) -> bytes:
+    """A one-page PDF with `text` as its only content, enough for the resume parser."""
+    lines = [text[i:i + 90] for i in range(0, len(text), 90)]
+    body = "BT /F1 11 Tf 50 780 Td 14 TL " + " ".join(
+        "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ") Tj T*" for line in lines
+    ) + " ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Contents 4 0 R "
+        "/Resources << /Font << /F1 5 0 R >> >> >>",
+        f"<< /Length {len(body)} >>\nstream\n{body}\nendstream",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{off:010d} 00000 n \n" for off in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+RESUME_TEXT = (
+    "Alex Loadtest - Software Engineer. alex@example.com. Five years of backend development "
+    "in Python and Go. Built REST APIs with FastAPI, async workers, PostgreSQL and Redis caching. "
+    "Led a migration to Kubernetes; on-call for a service handling 2k requests per second. "
+    "Skills: Python, FastAPI, SQL, Docker, Kubernetes, system design. B.Sc. Computer Science."
+)
+
+
+# ── One virtual candidate ─────────────────────────────────────────────────────
+
+@dataclass
+class TurnRecord:
+    endpoint_ms: Optional[float] = None      # speech end → 'processing'
+    first_audio_ms: Optional[float] = None   # speech end → first audio frame
+    reply_ms: Optional[float] = None         # speech end → 'audio_end'
+    empty: bool = False                      # "Didn't catch that"
+
+
+@dataclass
+class SessionRecord:
+    index: int
+    queued_s: float = 0.0
+    greeting_ms: Optional[float] = None
+    turns: List[TurnRecord] = field(default_factory=list)
+    completed: bool = False
+    error: Optional[str] = None
+
+
+class VirtualCandidate:
+
+    def __init__(self, index: int, args, answer: np.ndarray, run_id: str):
+        self.args = args
+        self.answer = answer
+        self.email = f"loadtest-{run_id}-{index}@example.com"
+        self.token: Optional[str] = None
+        self.record = SessionRecord(index=index)
+        self.ws = None
+        self._speaking_at: Optional[int] = None   # sample offset into the answer while talking
+        self._mic_open = False
+        self._speech_end = 0.0
+        self._turn: Optional[TurnRecord] = None
+        self._reply_bytes = 0
+        self._reply_start = 0.0
+        self._done = asyncio.Event()
+        self._tasks: set = set()
+
+    # ── Setup (HTTP) ──────────────────────────────────────────
+
+    async def setup(self, http: httpx.AsyncClient, resume: bytes):
+        password = "loadtest-pass"
+        r = await http.post("/signup/candidate", json={
+            "name": f"Load Test {self.record.index}", "email": self.email, "password": password,
+            "skills": "Python, FastAPI, SQL", "experience": "5 years",
+        })
+        if r.status_code not in (200, 400):   # 400: already registered by an earlier run
+            r.raise_for_status()
+        r = await http.post("/login", json={"email": self.email, "password": password})
+        r.raise_for_status()
+        self.token = r.json()["access_token"]
+        headers = {"Authorization": f"Bearer {self.token}"}
+        await http.post("/apply", headers=headers, json={
+            "job_posting_id": self.args.job_id, "years_of_experience": 5, "skills": "Python, FastAPI, SQL",
+        })
+        r = await http.post(
+            "/api/interview/prepare",
+            headers=headers,
+            data={"job_id": str(self.args.job_id)},
+            files={"file": ("resume.pdf", resume, "application/pdf")},
+            timeout=self.args.prepare_timeout,
+        )
+        r.raise_for_status()
+
+    # ── Session (WebSocket) ───────────────────────────────────
+
+    async def run(self):
+        url = f"{self.args.ws_url}/api/ws/interview/{self.args.job_id}?token={self.token}"
+        t_connect = time.monotonic()
+        try:
+            async with websockets.connect(url, max_size=None) as ws:
+                self.ws = ws
+                mic = asyncio.create_task(self._mic_loop())
+                try:
+                    await asyncio.wait_for(self._receive_loop(t_connect), self.args.session_timeout)
+                finally:
+                    mic.cancel()
+                    for task in self._tasks:
+                        task.cancel()
+        except asyncio.TimeoutError:
+            self.record.error = "session timeout"
+        except Exception as e:
+            self.record.error = f"{type(e).__name__}: {e}"
+        if self.record.error:
+            logger.warning("[LoadTest] Session %s failed: %s", self.record.index, self.record.error)
+
+    async def _mic_loop(self):
+        """Send one frame every FRAME_SECONDS, on a drift-free schedule, while the mic is open."""
+        next_at = time.monotonic()
+        while True:
+            next_at += FRAME_SECONDS
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+            if not self._mic_open:
+                continue
+            if self._speaking_at is None:
+                await self.ws.send(SILENCE)
+                continue
+            frame = self.answer[self._speaking_at:self._speaking_at + FRAME_SAMPLES]
+            self._speaking_at += FRAME_SAMPLES
+            if len(frame) < FRAME_SAMPLES:
+                frame = np.pad(frame, (0, FRAME_SAMPLES - len(frame)))
+            await self.ws.send(frame.tobytes())
+            if self._speaking_at >= len(self.answer):
+                self._speaking_at = None
+                self._speech_end = time.monotonic()
+                self._turn = TurnRecord()
+
+    def _since_speech_end(self) -> float:
+        return round((time.monotonic() - self._speech_end) * 1000, 1)
+
+    def _start_answer(self):
+        """After --think seconds of silence, speak the next answer (or hang up when done)."""
+        async def later():
+            if len(self.record.turns) >= self.args.turns:
+                self.record.completed = True
+                self._done.set()
+                return
+            await asyncio.sleep(self.args.think)
+            self._speaking_at = 0
+        task = asyncio.create_task(later())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _finish_reply(self):
+        """The reply is fully received: 'play' what is left of it, then hand the turn back."""
+        async def playback():
+            remaining = self._reply_bytes / TTS_BYTES_PER_SECOND - (time.monotonic() - self._reply_start)
+            if self._reply_bytes and remaining > 0 and not self.args.no_playback:
+                await asyncio.sleep(remaining)
+            self._reply_bytes = 0
+            await self.ws.send(json.dumps({"type": "audio_done"}))
+            self._mic_open = True
+            self._start_answer()
+        task = asyncio.create_task(playback())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _receive_loop(self, t_connect: float):
+        admitted = False
+        receiving = asyncio.ensure_future(self.ws.recv())
+        done = asyncio.ensure_future(self._done.wait())
+        try:
+            while True:
+                await asyncio.wait({receiving, done}, return_when=asyncio.FIRST_COMPLETED)
+                if done.done():
+                    return
+                message = receiving.result()
+                receiving = asyncio.ensure_future(self.ws.recv())
+                now = time.monotonic()
+
+                if isinstance(message, bytes):
+                    if len(message) <= AUDIO_FRAME_HEADER and not self._reply_bytes:
+                        continue
+                    if not self._reply_bytes:
+                        self._mic_open = False    # the browser stops sending while the AI speaks
+                        self._reply_start = now
+                        if self._turn is None:
+                            self.record.greeting_ms = round((now - t_connect) * 1000, 1)
+                        elif self._turn.first_audio_ms is None:
+                            self._turn.first_audio_ms = self._since_speech_end()
+                    self._reply_bytes += len(message) - AUDIO_FRAME_HEADER
+                    continue
+
+                data = json.loads(message)
+                kind = data.get("type")
+                if kind == "queued":
+                    continue
+                if not admitted:
+                    admitted = True
+                    self.record.queued_s = round(now - t_connect, 2)
+                    self._mic_open = True
+
+                if kind == "ping":
+                    await self.ws.send(json.dumps({"type": "pong"}))
+                elif kind == "status" and data.get("state") == "processing" and self._turn:
+                    self._turn.endpoint_ms = self._since_speech_end()
+                elif kind == "status" and "catch that" in data.get("message", "") and self._turn:
+                    self._turn.empty = True
+                    self.record.turns.append(self._turn)
+                    self._turn = None
+                    self._start_answer()
+                elif kind in ("audio_end", "speaking_done"):
+                    if self._turn is not None:
+                        self._turn.reply_ms = self._since_speech_end()
+                        self.record.turns.append(self._turn)
+                        self._turn = None
+                    self._finish_reply()
+                elif kind == "interview_complete":
+                    self.record.completed = True
+                    return
+        finally:
+            receiving.cancel()
+            done.cancel()
+
+
+# ── Waves and report ──────────────────────────────────────────────────────────
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize(level: int, sessions: List[SessionRecord]) -> Dict:
+    turns = [t for s in sessions for t in s.turns]
+    full = [t for t in turns if not t.empty]
+    summary = {
+        "level": level,
+        "sessions": len(sessions),
+        "failed": sum(1 for s in sessions if s.error),
+        "turns": len(turns),
+        "empty_turns": len(turns) - len(full),
+        "max_queued_s": max((s.queued_s for s in sessions), default=0.0),
+        "greeting_p50_ms": percentile([s.greeting_ms for s in sessions if s.greeting_ms is not None], 0.5),
+    }
+    for name, values in (
+        ("endpoint", [t.endpoint_ms for t in turns if t.endpoint_ms is not None]),
+        ("first_audio", [t.first_audio_ms for t in full if t.first_audio_ms is not None]),
+        ("reply", [t.reply_ms for t in full if t.reply_ms is not None]),
+    ):
+        for q in (50, 95, 99):
+            summary[f"{name}_p{q}_ms"] = percentile(values, q / 100)
+    return summary
+
+
+async def run_level(level: int, args, answer: np.ndarray, resume: bytes, run_id: str) -> Dict:
+    candidates = [VirtualCandidate(i, args, answer, f"{run_id}-{level}") for i in range(level)]
+    async with httpx.AsyncClient(base_url=args.url, timeout=30) as http:
+        setup_limit = asyncio.Semaphore(args.setup_concurrency)
+
+        async def setup(candidate: VirtualCandidate):
+            async with setup_limit:
+                await candidate.setup(http, resume)
+
+        await asyncio.gather(*(setup(c) for c in candidates))
+
+    async def start(candidate: VirtualCandidate, delay: float):
+        await asyncio.sleep(delay)
+        await candidate.run()
+
+    t0 = time.monotonic()
+    await asyncio.gather(*(start(c, i * args.stagger) for i, c in enumerate(candidates)))
+    summary = summarize(level, [c.record for c in candidates])
+    summary["wall_s"] = round(time.monotonic() - t0, 1)
+    summary["records"] = [asdict(c.record) for c in candidates]
+    return summary
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def print_report(results: List[Dict], args):
+    print()
+    print(f"{'level':>5} {'fail':>4} {'turns':>5} {'empty':>5} {'queue_s':>7} "
+          f"{'endpoint p50/95/99':>20} {'first_audio p50/95/99':>23} {'reply p50/95/99':>20}")
+    for r in results:
+        print(
+            f"{r['level']:>5} {r['failed']:>4} {r['turns']:>5} {r['empty_turns']:>5} {r['max_queued_s']:>7.1f} "
+            f"{'/'.join(_fmt(r[f'endpoint_p{q}_ms']) for q in (50, 95, 99)):>20} "
+            f"{'/'.join(_fmt(r[f'first_audio_p{q}_ms']) for q in (50, 95, 99)):>23} "
+            f"{'/'.join(_fmt(r[f'reply_p{q}_ms']) for q in (50, 95, 99)):>20}"
+        )
+
+    # A level counts if nothing failed and its p95 first audio (or end-of-turn,
+    # when every turn was empty) stays within the SLO
+    def within_slo(r: Dict) -> bool:
+        p95 = r["first_audio_p95_ms"] if r["first_audio_p95_ms"] is not None else r["endpoint_p95_ms"]
+        return not r["failed"] and p95 is not None and p95 <= args.slo * 1000
+
+    sustained = max((r["level"] for r in results if within_slo(r)), default=0)
+    print()
+    print(f"Sustained sessions within p95 <= {args.slo:.1f}s: {sustained} "
+          f"on {args.cores} cores = {sustained / args.cores:.2f} sessions/core")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://localhost:8000", help="backend base URL")
+    parser.add_argument("--job-id", type=int, default=1, help="existing job posting to interview for")
+    parser.add_argument("--levels", default="1,2,4", help="comma-separated concurrent session counts")
+    parser.add_argument("--turns", type=int, default=3, help="answers per session")
+    parser.add_argument("--audio", help="answer recording (any format faster-whisper decodes)")
+    parser.add_argument("--answer-seconds", type=float, default=6.0, help="length of the synthetic answer")
+    parser.add_argument("--resume", help="resume PDF to upload (default: a generated one)")
+    parser.add_argument("--think", type=float, default=1.0, help="silence before each answer (s)")
+    parser.add_argument("--stagger", type=float, default=0.5, help="delay between session starts (s)")
+    parser.add_argument("--slo", type=float, default=3.0, help="p95 first-audio target (s)")
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 1, help="backend CPU cores")
+    parser.add_argument("--no-playback", action="store_true", help="send audio_done as soon as a reply ends")
+    parser.add_argument("--setup-concurrency", type=int, default=4)
+    parser.add_argument("--prepare-timeout", type=float, default=180.0)
+    parser.add_argument("--session-timeout", type=float, default=900.0)
+    parser.add_argument("--json", help="write the full results (per session and turn) here")
+    args = parser.parse_args(argv)
+    args.ws_url = "ws" + args.url[len("http"):] if args.url.startswith("http") else args.url
+    args.levels = [int(level) for level in args.levels.split(",") if level.strip()]
+    return args
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    if websockets is None:
+        sys.exit("load_test needs the 'websockets' package (pip install websockets)")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s │ %(levelname)-7s │ %(message)s", datefmt="%H:%M:%S")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    answer = load_answer(args.audio) if args.audio else synthetic_answer(args.answer_seconds)
+    if args.resume:
+        with open(args.resume, "rb") as f:
+            resume = f.read()
+    else:
+        resume = minimal_pdf(RESUME_TEXT)
+    run_id = uuid.uuid4().hex[:8]
+    logger.info(
+        "[LoadTest] run=%s | levels=%s | turns=%s | answer=%.1fs (%s) | target=%s",
+        run_id, args.levels, args.turns, len(answer) / SAMPLE_RATE,
+        "file" if args.audio else "synthetic", args.url,
+    )
+
+    results = []
+    for level in args.levels:
+        logger.info("[LoadTest] Level %s: preparing and running %s sessions...", level, level)
+        summary = await run_level(level, args, answer, resume, run_id)
+        logger.info("[LoadTest] Level %s done in %ss | failed=%s", level, summary['wall_s'], summary['failed'])
+        results.append(summary)
+
+    print_report(results, args)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"args": {k: v for k, v in vars(args).items()}, "results": results}, f, indent=2)
+        logger.info("[LoadTest] Results written to %s", args.json)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
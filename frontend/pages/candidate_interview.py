@@ -162,6 +162,7 @@ html_code = f"""
         .msg-user {{ background: #0f3460; color: #a8dadc; margin-left: auto; text-align: right; }}
         .msg-ai {{ background: #1b4332; color: #86efac; }}
         .msg-label {{ font-size: 0.75em; opacity: 0.7; margin-bottom: 2px; }}
+        .msg-partial {{ opacity: 0.6; font-style: italic; }}
 
         .debug-panel {{
             margin-top: 12px;
@@ -212,9 +213,28 @@ html_code = f"""
         let aiIsSpeaking = false;
         let currentAudio = null; // The playing HTMLAudioElement
 
+        // TTS audio arrives as binary frames: an 8-byte header
+        // (version u8, flags u8, clip u16, seq u32 — big-endian) + MP3 bytes.
+        // A reply is one or more clips (sentences) closed by 'audio_end'.
+        const FRAME_HEADER_BYTES = 8;
+        const FRAME_CLIP_END = 0x01;
+        // MediaSource plays MP3 chunks as they arrive; without it each clip
+        // is buffered whole and played from a Blob
+        const MSE_SUPPORTED = !!(window.MediaSource && MediaSource.isTypeSupported("audio/mpeg"));
+        let audioStreamOpen = false; // true from the first frame until audio_end
+        let mediaSource = null;
+        let sourceBuffer = null;
+        let pendingChunks = [];      // MSE: chunks waiting for the SourceBuffer
+        let clipChunks = [];         // Blob fallback: chunks of the clip being received
+        let audioQueue = [];         // Blob fallback: object URLs of complete clips
+
+        // Live transcript of the current answer, replaced by the final 'text' message
+        let partialBubble = null;
+
         // Reconnect state
         let reconnectAttempts = 0;
         const MAX_RECONNECT = 3;
+        const BUSY_RETRY_SEC = 30;  // retry delay after a 1013 (server at capacity)
         let userEndedSession = false;   // set true when user clicks "End Interview"
         let interviewCompleted = false; // set true when server sends interview_complete
 
@@ -255,6 +275,23 @@ html_code = f"""
             chatLog.scrollTop = chatLog.scrollHeight;
         }}
 
+        function showPartial(text) {{
+            if (!partialBubble) {{
+                addMessage('user', text);
+                partialBubble = chatLog.lastChild;
+                partialBubble.classList.add("msg-partial");
+            }}
+            partialBubble.lastChild.innerText = text;
+            chatLog.scrollTop = chatLog.scrollHeight;
+        }}
+
+        function clearPartial() {{
+            if (partialBubble) {{
+                partialBubble.remove();
+                partialBubble = null;
+            }}
+        }}
+
         function sendWS(obj) {{
             if (ws && ws.readyState === WebSocket.OPEN) {{
                 ws.send(JSON.stringify(obj));
@@ -262,49 +299,140 @@ html_code = f"""
         }}
 
         // ── Audio Playback ────────────────────────────────────────
-        function playAudio(base64Data) {{
-            dbg("Playing AI audio...");
-            setStatus("🔊", "AI Interviewer is speaking...", "AI SPEAKING", "#7c3aed");
-            aiIsSpeaking = true;
+        function finishPlayback() {{
+            dbg("Audio finished playing. Signaling server.");
+            currentAudio = null;
+            mediaSource = null;
+            sourceBuffer = null;
+            aiIsSpeaking = false;
+            // Tell the backend we finished playing - it will resume listening
+            sendWS({{ type: "audio_done" }});
+            setStatus("🎙️", "Your turn — please speak now", "LISTENING", "#15803d");
+        }}
 
-            const audioSrc = "data:audio/mp3;base64," + base64Data;
+        function stopPlayback() {{
+            audioStreamOpen = false;
+            pendingChunks = [];
+            clipChunks = [];
+            audioQueue.forEach(url => URL.revokeObjectURL(url));
+            audioQueue = [];
+            sourceBuffer = null;
+            mediaSource = null;
             if (currentAudio) {{
+                currentAudio.onended = null;
+                currentAudio.onerror = null;
                 currentAudio.pause();
+                URL.revokeObjectURL(currentAudio.src);
                 currentAudio = null;
             }}
+        }}
 
-            currentAudio = new Audio(audioSrc);
+        function startAudioElement(src, onDone) {{
+            setStatus("🔊", "AI Interviewer is speaking...", "AI SPEAKING", "#7c3aed");
+            aiIsSpeaking = true;
 
-            currentAudio.onended = () => {{
-                dbg("Audio finished playing. Signaling server.");
-                currentAudio = null;
-                aiIsSpeaking = false;
-                // Tell the backend we finished playing - it will resume listening
-                sendWS({{ type: "audio_done" }});
-                setStatus("🎙️", "Your turn — please speak now", "LISTENING", "#15803d");
+            const audio = new Audio(src);
+            currentAudio = audio;
+
+            audio.onended = () => {{
+                URL.revokeObjectURL(src);
+                if (currentAudio === audio) currentAudio = null;
+                onDone();
             }};
 
-            currentAudio.onerror = (e) => {{
-                dbg("Audio playback error: " + e.message);
-                currentAudio = null;
-                aiIsSpeaking = false;
-                sendWS({{ type: "audio_done" }});
-                setStatus("⚠️", "Audio error. Please speak.", "LISTENING", "#15803d");
+            audio.onerror = () => {{
+                dbg("Audio playback error: " + (audio.error ? audio.error.code : "unknown"));
+                URL.revokeObjectURL(src);
+                if (currentAudio === audio) currentAudio = null;
+                onDone();
             }};
 
-            currentAudio.play().catch(err => {{
+            audio.play().catch(err => {{
+                if (currentAudio !== audio) return;
                 dbg("play() rejected: " + err.message + " (user gesture may be needed)");
-                // If play is rejected (autoplay policy), reset state
+                // If play is rejected (autoplay policy), drop everything and reset state
+                stopPlayback();
                 aiIsSpeaking = false;
                 sendWS({{ type: "audio_done" }});
                 setStatus("🎙️", "Speak now (audio blocked by browser)", "LISTENING", "#15803d");
             }});
         }}
 
+        // One binary TTS frame from the server
+        function onAudioFrame(buffer) {{
+            if (buffer.byteLength < FRAME_HEADER_BYTES) return;
+            const header = new DataView(buffer, 0, FRAME_HEADER_BYTES);
+            const flags = header.getUint8(1);
+            const payload = new Uint8Array(buffer, FRAME_HEADER_BYTES);
+
+            if (!audioStreamOpen) {{
+                // First frame of a new reply
+                dbg("Receiving AI audio (" + (MSE_SUPPORTED ? "streamed playback" : "clip playback") + ").");
+                if (MSE_SUPPORTED) stopPlayback();
+                audioStreamOpen = true;
+                if (MSE_SUPPORTED) startMediaSource();
+            }}
+
+            if (MSE_SUPPORTED) {{
+                if (payload.byteLength) pendingChunks.push(payload);
+                pumpSourceBuffer();
+            }} else {{
+                if (payload.byteLength) clipChunks.push(payload);
+                if (flags & FRAME_CLIP_END) {{
+                    audioQueue.push(URL.createObjectURL(new Blob(clipChunks, {{ type: "audio/mpeg" }})));
+                    clipChunks = [];
+                    if (!currentAudio) playNextClip();
+                }}
+            }}
+        }}
+
+        // MSE: one MediaSource per reply; clips are appended back to back
+        function startMediaSource() {{
+            const ms = new MediaSource();
+            mediaSource = ms;
+            ms.addEventListener("sourceopen", () => {{
+                if (mediaSource !== ms) return;
+                sourceBuffer = ms.addSourceBuffer("audio/mpeg");
+                sourceBuffer.mode = "sequence";
+                sourceBuffer.addEventListener("updateend", pumpSourceBuffer);
+                pumpSourceBuffer();
+            }});
+            startAudioElement(URL.createObjectURL(ms), finishPlayback);
+        }}
+
+        function pumpSourceBuffer() {{
+            if (!sourceBuffer || sourceBuffer.updating) return;
+            if (pendingChunks.length > 0) {{
+                sourceBuffer.appendBuffer(pendingChunks.shift());
+            }} else if (!audioStreamOpen && mediaSource.readyState === "open") {{
+                mediaSource.endOfStream(); // lets the element fire 'ended'
+            }}
+        }}
+
+        // Blob fallback: play complete clips one after another
+        function playNextClip() {{
+            if (audioQueue.length > 0) {{
+                startAudioElement(audioQueue.shift(), playNextClip);
+            }} else if (!audioStreamOpen) {{
+                finishPlayback();
+            }}
+            // else: waiting for the next clip from the server
+        }}
+
+        function endAudioStream() {{
+            audioStreamOpen = false;
+            if (MSE_SUPPORTED && mediaSource) {{
+                pumpSourceBuffer();
+            }} else if (!currentAudio && audioQueue.length === 0) {{
+                finishPlayback();
+            }}
+        }}
+
         // ── WebSocket ─────────────────────────────────────────────
         function initWebSocket() {{
             dbg("Connecting to: " + WS_URL);
             ws = new WebSocket(WS_URL);
+            ws.binaryType = "arraybuffer";
 
             ws.onopen = () => {{
                 dbg("WebSocket connected.");
@@ -316,7 +444,10 @@ html_code = f"""
             }};
 
             ws.onmessage = (event) => {{
-                if (typeof event.data !== "string") return;
+                if (typeof event.data !== "string") {{
+                    onAudioFrame(event.data);
+                    return;
+                }}
                 let msg;
                 try {{ msg = JSON.parse(event.data); }} catch(e) {{ return; }}
 
@@ -339,30 +470,34 @@ html_code = f"""
                         setStatus(msg.icon || "⏳", msg.message, msg.state, color);
                     }}
                     dbg("[status] " + msg.state + ": " + msg.message);
+                }} else if (t === "partial_text") {{
+                    // Empty text withdraws the live transcript (the answer was noise)
+                    if (msg.text) showPartial(msg.text); else clearPartial();
+
                 }} else if (t === "text") {{
+                    if (msg.role === 'user') clearPartial();
                     addMessage(msg.role === 'user' ? 'user' : 'ai', msg.text);
                     dbg("[text] " + msg.role + ": " + msg.text.substring(0, 60) + "...");
 
-                }} else if (t === "audio") {{
-                    dbg("Received audio payload (" + msg.data.length + " chars b64).");
-                    playAudio(msg.data);
+                }} else if (t === "audio_end") {{
+                    dbg("Received audio_end (" + (pendingChunks.length + audioQueue.length) + " chunks/clips still queued).");
+                    endAudioStream();
 
                 }} else if (t === "speaking_done") {{
                     dbg("Received speaking_done fallback from server.");
-                    if (currentAudio) {{
-                        currentAudio.pause();
-                        currentAudio = null;
-                    }}
+                    stopPlayback();
                     aiIsSpeaking = false;
                     sendWS({{ type: "audio_done" }});
                     setStatus("🎙️", "Your turn — please speak now", "LISTENING", "#15803d");
 
+                }} else if (t === "queued") {{
+                    // Waiting for a free session slot (admission control)
+                    setStatus("⏳", msg.message, "QUEUED", "#b45309");
+                    dbg("[queued] position " + msg.position + ", ~" + msg.estimated_wait_seconds + "s");
+
                 }} else if (t === "clear") {{
                     dbg("Received clear signal.");
-                    if (currentAudio) {{
-                        currentAudio.pause();
-                        currentAudio = null;
-                    }}
+                    stopPlayback();
                     aiIsSpeaking = false;
 
                 }} else if (t === "interview_complete") {{
@@ -398,7 +533,14 @@ html_code = f"""
                 teardownMicrophone();
                 isSessionActive = false;
 
-                if (reconnectAttempts < MAX_RECONNECT) {{
+                if (e.code === 1013) {{
+                    // Server at capacity and its queue is full — retry without using up reconnect attempts
+                    setStatus("⏳", `All interviewers are busy — trying again in ${{BUSY_RETRY_SEC}}s`, "QUEUED", "#b45309");
+                    setTimeout(async () => {{
+                        const micReady = await requestMicPermission();
+                        if (micReady) initWebSocket();
+                    }}, BUSY_RETRY_SEC * 1000);
+                }} else if (reconnectAttempts < MAX_RECONNECT) {{
                     reconnectAttempts++;
                     const waitSec = reconnectAttempts * 2;  // 2s, 4s, 6s
                     setStatus("🔄", `Reconnecting... (attempt ${{reconnectAttempts}}/${{MAX_RECONNECT}}) — waiting ${{waitSec}}s`, "RECONNECTING", "#78350f");
@@ -502,7 +644,7 @@ html_code = f"""
             if (scriptProcessor) {{ scriptProcessor.disconnect(); scriptProcessor = null; }}
             if (mediaStream) {{ mediaStream.getTracks().forEach(t => t.stop()); mediaStream = null; }}
             if (audioCtx) {{ audioCtx.close().catch(()=>{{}}); audioCtx = null; }}
-            if (currentAudio) {{ currentAudio.pause(); currentAudio = null; }}
+            stopPlayback();
             levelBar.style.width = "0%";
             dbg("Microphone and audio pipeline torn down.");
         }}